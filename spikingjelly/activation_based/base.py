@@ -15,6 +15,18 @@ try:
 except BaseException as e:
     slayer = None
 
+try:
+    import triton
+except BaseException as e:
+    logging.info(f'spikingjelly.activation_based.base: {e}')
+    triton = None
+
+try:
+    import numba
+except BaseException as e:
+    logging.info(f'spikingjelly.activation_based.base: {e}')
+    numba = None
+
 
 def check_backend_library(backend: str):
     """
@@ -22,7 +34,7 @@ def check_backend_library(backend: str):
 
     .. _check_backend_library-cn:
 
-    :param backend: ``'torch'``, ``'cupy'`` 或 ``'lava'``
+    :param backend: ``'torch'``, ``'cupy'``, ``'triton'``, ``'numba'`` 或 ``'lava'``
     :type backend: str
 
     检查某个后端的python库是否已经安装。若未安装则此函数会报错。
@@ -31,7 +43,7 @@ def check_backend_library(backend: str):
 
     .. _check_backend_library-en:
 
-    :param backend: ``'torch'``, ``'cupy'`` or ``'lava'``
+    :param backend: ``'torch'``, ``'cupy'``, ``'triton'``, ``'numba'`` or ``'lava'``
     :type backend: str
 
     Check whether the python lib for backend is installed. If not, this function will raise an error.
@@ -41,6 +53,12 @@ def check_backend_library(backend: str):
     elif backend == 'cupy':
         if cupy is None:
             raise ImportError('CuPy is not installed! You can install it from "https://github.com/cupy/cupy".')
+    elif backend == 'triton':
+        if triton is None:
+            raise ImportError('Triton is not installed! You can install it from "https://github.com/triton-lang/triton".')
+    elif backend == 'numba':
+        if numba is None:
+            raise ImportError('Numba is not installed! You can install it from "https://github.com/numba/numba".')
     elif backend == 'lava':
         if slayer is None:
             raise ImportError('Lava-DL is not installed! You can install it from ' \
@@ -20,6 +20,41 @@ except BaseException as e:
     neuron_kernel = None
     cuda_utils = None
 
+try:
+    from .triton_kernel import if_kernel as triton_if_kernel
+    from .triton_kernel import lif_kernel as triton_lif_kernel
+    from .triton_kernel import dsr_kernel as triton_dsr_kernel
+except BaseException as e:
+    logging.info(f'spikingjelly.activation_based.neuron: {e}')
+    triton_if_kernel = None
+    triton_lif_kernel = None
+    triton_dsr_kernel = None
+
+try:
+    from .numba_kernel import lif_kernel as numba_lif_kernel
+except BaseException as e:
+    logging.info(f'spikingjelly.activation_based.neuron: {e}')
+    numba_lif_kernel = None
+
+
+def _identity(x: torch.Tensor):
+    return x
+
+
+def _is_hook_free_surrogate(sg: Callable):
+    # the methods of ``SurrogateFunctionBase`` can be called directly to skip the overhead of ``nn.Module.__call__``,
+    # as long as no hook is registered on ``sg`` or globally (the same condition as the fast path in
+    # ``nn.Module._call_impl``)
+    return isinstance(sg, surrogate.SurrogateFunctionBase) and not (
+            sg._forward_hooks or sg._forward_pre_hooks or sg._backward_hooks or sg._backward_pre_hooks
+            or nn.modules.module._global_forward_hooks or nn.modules.module._global_forward_pre_hooks
+            or nn.modules.module._global_backward_hooks or nn.modules.module._global_backward_pre_hooks)
+
+
+def _is_binary_surrogate(sg: Callable):
+    # only a ``SurrogateFunctionBase`` in spiking mode is known to output binary spikes. Other callables may output
+    # any value, e.g., a user-defined smooth activation
+    return isinstance(sg, surrogate.SurrogateFunctionBase) and sg.spiking
 
 class SimpleBaseNode(base.MemoryModule):
     def __init__(self, v_threshold: float = 1., v_reset: float = 0.,
@@ -75,13 +110,27 @@ class SimpleLIFNode(SimpleBaseNode):
         self.tau = tau
         self.decay_input = decay_input
 
+    @property
+    def tau(self):
+        return self._tau
+
+    @tau.setter
+    def tau(self, value: float):
+        self._tau = value
+        self._inv_tau = 1. / value
+
     def neuronal_charge(self, x: torch.Tensor):
         if self.decay_input:
-            self.v = self.v + (self.v_reset - self.v + x) / self.tau
+            self.v = self.v + (self.v_reset - self.v + x) * self._inv_tau
         else:
-            self.v = self.v + (self.v_reset - self.v) / self.tau + x
+            self.v = self.v + (self.v_reset - self.v) * self._inv_tau + x
 
 class BaseNode(base.MemoryModule):
+    # used in lava_exchange
+    lava_s_cale = 1 << 6
+    # the maximum number of the CUDA graphs captured by each neuron, see cuda_graph_eval_multi_step_forward
+    cuda_graph_cache_size = 4
+
     def __init__(self, v_threshold: float = 1., v_reset: float = 0.,
                  surrogate_function: Callable = surrogate.Sigmoid(), detach_reset: bool = False,
                  step_mode='s', backend='torch', store_v_seq: bool = False):
@@ -171,12 +220,32 @@ class BaseNode(base.MemoryModule):
 
         self.store_v_seq = store_v_seq
 
-        # used in lava_exchange
-        self.lava_s_cale = 1 << 6
-
         # used for cupy backend
         self.forward_kernel = None
         self.backward_kernel = None
+        self._kernel_sig = None
+
+        # whether self.v has been converted from float to tensor, cleared by reset()
+        self._v_initialized = False
+
+        # whether the surrogate function can be called without hooks, which is decided once before the loop of
+        # multi_step_forward rather than at every time-step. None means that it is decided by each neuronal_fire
+        self._sg_hook_free = None
+
+        # used for CUDA graph replay in inference, which is disabled by default. The captured graphs are indexed by
+        # the shape, dtype and device of the inputs and the settings, see cuda_graph_eval_multi_step_forward
+        self.use_cuda_graph = False
+        self._cuda_graphs = {}
+
+    @property
+    def detach_reset(self):
+        return self._detach_reset
+
+    @detach_reset.setter
+    def detach_reset(self, value: bool):
+        self._detach_reset = value
+        # resolve the detach branch once, rather than checking ``self.detach_reset`` in every ``neuronal_reset``
+        self._detach_fn = torch.Tensor.detach if value else _identity
 
     @property
     def store_v_seq(self):
@@ -195,12 +264,32 @@ class BaseNode(base.MemoryModule):
         v = (1. - spike) * v + spike * v_reset
         return v
 
+    @staticmethod
+    @torch.jit.script
+    def jit_hard_reset_binary(v: torch.Tensor, spike: torch.Tensor, v_reset: float):
+        # equal to ``jit_hard_reset`` when ``spike`` only contains 0/1 and requires no grad
+        return torch.where(spike != 0., v_reset, v)
+
     @staticmethod
     @torch.jit.script
     def jit_soft_reset(v: torch.Tensor, spike: torch.Tensor, v_threshold: float):
         v = v - spike * v_threshold
         return v
 
+    @staticmethod
+    @torch.jit.script
+    def jit_fire_hard_reset_binary(v: torch.Tensor, v_threshold: float, v_reset: float):
+        # the fused ``neuronal_fire`` and ``jit_hard_reset_binary`` for the heaviside spike that requires no grad
+        spike = (v >= v_threshold).to(v)
+        return spike, torch.where(spike != 0., v_reset, v)
+
+    @staticmethod
+    @torch.jit.script
+    def jit_fire_soft_reset_binary(v: torch.Tensor, v_threshold: float):
+        # the fused ``neuronal_fire`` and ``jit_soft_reset`` for the heaviside spike that requires no grad
+        spike = (v >= v_threshold).to(v)
+        return spike, v - spike * v_threshold
+
     @abstractmethod
     def neuronal_charge(self, x: torch.Tensor):
         """
@@ -233,9 +322,22 @@ class BaseNode(base.MemoryModule):
 
 
         Calculate out spikes of neurons by their current membrane potential and threshold voltage.
-        """
 
-        return self.surrogate_function(self.v - self.v_threshold)
+        If ``v`` is stored as ``torch.float16`` or ``torch.bfloat16``, the surrogate function is evaluated in
+        ``torch.float32`` and the spikes are cast back, so that the surrogate gradients near the threshold keep their
+        precision.
+        """
+        sg = self.surrogate_function
+        hook_free = self._sg_hook_free
+        if hook_free is None:
+            hook_free = _is_hook_free_surrogate(sg)
+        if hook_free:
+            return sg.forward_with_threshold(self.v, self.v_threshold)
+
+        x = self.v - self.v_threshold
+        if x.dtype == torch.float16 or x.dtype == torch.bfloat16:
+            return sg(x.float()).to(x.dtype)
+        return sg(x)
 
     def neuronal_reset(self, spike):
         """
@@ -252,10 +354,7 @@ class BaseNode(base.MemoryModule):
 
         Reset the membrane potential according to neurons' output spikes.
         """
-        if self.detach_reset:
-            spike_d = spike.detach()
-        else:
-            spike_d = spike
+        spike_d = self._detach_fn(spike)
 
         if self.v_reset is None:
             # soft reset
@@ -263,7 +362,11 @@ class BaseNode(base.MemoryModule):
 
         else:
             # hard reset
-            self.v = self.jit_hard_reset(self.v, spike_d, self.v_reset)
+            if spike_d.requires_grad or not _is_binary_surrogate(self.surrogate_function):
+                # the gradient flows through spike_d, or spike_d is not binary
+                self.v = self.jit_hard_reset(self.v, spike_d, self.v_reset)
+            else:
+                self.v = self.jit_hard_reset_binary(self.v, spike_d, self.v_reset)
 
     def extra_repr(self):
         return f'v_threshold={self.v_threshold}, v_reset={self.v_reset}, detach_reset={self.detach_reset}, step_mode={self.step_mode}, backend={self.backend}'
@@ -304,24 +407,127 @@ class BaseNode(base.MemoryModule):
 
     def multi_step_forward(self, x_seq: torch.Tensor):
         T = x_seq.shape[0]
-        y_seq = []
+        # torch.empty_like would copy the layout of a strided x_seq, e.g., a transposed one. The outputs are always
+        # contiguous, as those stacked by torch.stack
+        y_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
         if self.store_v_seq:
-            v_seq = []
-        for t in range(T):
-            y = self.single_step_forward(x_seq[t])
-            y_seq.append(y)
-            if self.store_v_seq:
-                v_seq.append(self.v)
+            v_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        # the hook dicts are checked once for all time-steps. A hook registered during the loop takes effect from the
+        # next call
+        self._sg_hook_free = _is_hook_free_surrogate(self.surrogate_function)
+        try:
+            for t in range(T):
+                y_seq[t] = self.single_step_forward(x_seq[t])
+                if self.store_v_seq:
+                    v_seq[t] = self.v
+        finally:
+            self._sg_hook_free = None
 
         if self.store_v_seq:
-            self.v_seq = torch.stack(v_seq)
+            self.v_seq = v_seq
 
-        return torch.stack(y_seq)
+        return y_seq
 
     def v_float_to_tensor(self, x: torch.Tensor):
+        if self._v_initialized:
+            return
         if isinstance(self.v, float):
             v_init = self.v
-            self.v = torch.full_like(x.data, v_init)
+            # always allocate a contiguous v, even if x is a strided view, so that the following element-wise
+            # charge/fire/reset kernels run on contiguous memory
+            self.v = torch.full(x.shape, v_init, dtype=x.dtype, device=x.device)
+        self._v_initialized = True
+
+    def reset(self):
+        super().reset()
+        self._v_initialized = False
+
+    def jit_eval_settings(self):
+        # the settings that the jit functions used in inference depend on, which is a part of the key of the CUDA graph
+        return self.v_threshold, self.v_reset, self.store_v_seq
+
+    def cuda_graph_eval_multi_step_forward(self, x_seq: torch.Tensor, v: torch.Tensor):
+        """
+        * :ref:`API in English <BaseNode.cuda_graph_eval_multi_step_forward-en>`
+
+        .. _BaseNode.cuda_graph_eval_multi_step_forward-cn:
+
+        使用CUDA graph执行 ``jit_eval_multi_step_forward``。仅在 ``self.use_cuda_graph = True`` 时使用。捕获的CUDA graph按照输入的
+        形状、数据类型、设备以及神经元的设置进行索引，最多保存 ``self.cuda_graph_cache_size`` 个，超出时丢弃最早捕获的graph。
+        已捕获的输入调用只需要将输入拷贝到静态缓冲区并重放该graph，从而省去 ``T`` 个时间步的逐个kernel启动开销。
+        子类需要实现 ``jit_eval_multi_step_forward(x_seq, v)``，返回 ``(spike_seq, v, v_seq)``。
+
+        * :ref:`中文API <BaseNode.cuda_graph_eval_multi_step_forward-cn>`
+
+        .. _BaseNode.cuda_graph_eval_multi_step_forward-en:
+
+        Run ``jit_eval_multi_step_forward`` by a CUDA graph, which is only used if ``self.use_cuda_graph = True``. The
+        captured graphs are indexed by the shape, dtype and device of the inputs and the settings of the neuron. At most
+        ``self.cuda_graph_cache_size`` graphs are kept, and the earliest captured one is dropped when more are needed.
+        A call whose inputs have been captured only copies them into static buffers and replays the graph, which avoids
+        launching kernels step by step over ``T`` time-steps.
+        The subclass should implement ``jit_eval_multi_step_forward(x_seq, v)``, which returns
+        ``(spike_seq, v, v_seq)``.
+        """
+        key = (x_seq.shape, x_seq.dtype, x_seq.device, v.shape, v.dtype) + tuple(self.jit_eval_settings())
+        if key not in self._cuda_graphs:
+            if len(self._cuda_graphs) >= self.cuda_graph_cache_size:
+                # drop the earliest captured graph and its static buffers
+                self._cuda_graphs.pop(next(iter(self._cuda_graphs)))
+            graph_in = (x_seq.clone(), v.clone())
+            # warm up on a side stream, which is also required by the TorchScript profiling executor
+            stream = torch.cuda.Stream(device=x_seq.device)
+            stream.wait_stream(torch.cuda.current_stream(x_seq.device))
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    self.jit_eval_multi_step_forward(*graph_in)
+            torch.cuda.current_stream(x_seq.device).wait_stream(stream)
+
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph):
+                graph_out = self.jit_eval_multi_step_forward(*graph_in)
+            self._cuda_graphs[key] = (graph, graph_in, graph_out)
+
+        graph, graph_in, graph_out = self._cuda_graphs[key]
+        graph_in[0].copy_(x_seq)
+        graph_in[1].copy_(v)
+        graph.replay()
+        # the outputs of the graph will be overwritten by the next replay
+        return tuple(None if y is None else y.clone() for y in graph_out)
+
+    def eval_multi_step_forward_autograd(self, x_seq: torch.Tensor, v: torch.Tensor):
+        """
+        * :ref:`API in English <BaseNode.eval_multi_step_forward_autograd-en>`
+
+        .. _BaseNode.eval_multi_step_forward_autograd-cn:
+
+        推理阶段需要自动微分时（例如 ``x_seq.requires_grad = True`` 且启用了梯度）使用的多步前向传播。融合的推理实现会原地更新
+        膜电位或分离输出，不支持自动微分；此函数逐个时间步调用不含原地操作的 ``jit_eval_single_step_forward(x, v)``，
+        保留关于 ``x_seq`` 和 ``v`` 的梯度。返回 ``(spike_seq, v, v_seq)``。
+
+        * :ref:`中文API <BaseNode.eval_multi_step_forward_autograd-cn>`
+
+        .. _BaseNode.eval_multi_step_forward_autograd-en:
+
+        The multi-step forward in inference when autograd is required, e.g., ``x_seq.requires_grad = True`` with grad
+        mode enabled. The fused inference paths update the membrane potential in place or detach their outputs, and do
+        not support autograd. This function calls the out-of-place ``jit_eval_single_step_forward(x, v)`` step by step,
+        which keeps the gradients w.r.t. ``x_seq`` and ``v``. Returns ``(spike_seq, v, v_seq)``.
+        """
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device) if self.store_v_seq else None
+        for t in range(x_seq.shape[0]):
+            spike_seq[t], v = self.jit_eval_single_step_forward(x_seq[t], v)
+            if v_seq is not None:
+                v_seq[t] = v
+        return spike_seq, v, v_seq
+
+    def __getstate__(self):
+        # CUDA graphs can not be copied or pickled. They will be captured again when needed
+        # copy the dict, rather than modifying the __dict__ of the module itself
+        state = super().__getstate__().copy()
+        state['_cuda_graphs'] = {}
+        return state
 
 
 class AdaptBaseNode(BaseNode):
@@ -399,10 +605,7 @@ class AdaptBaseNode(BaseNode):
 
         Reset the membrane potential according to neurons' output spikes.
         """
-        if self.detach_reset:
-            spike_d = spike.detach()
-        else:
-            spike_d = spike
+        spike_d = self._detach_fn(spike)
 
         if self.v_reset is None:
             # soft reset
@@ -412,6 +615,51 @@ class AdaptBaseNode(BaseNode):
             # hard reset
             self.v, self.w = self.jit_hard_reset(self.v, self.w, spike_d, self.v_reset, self.b, spike)
 
+    @staticmethod
+    @torch.jit.script
+    def jit_hard_reset_with_adaptation(v: torch.Tensor, w: torch.Tensor, spike_d: torch.Tensor, v_reset: float,
+                                       b: float, spike: torch.Tensor, tau_w: float, a: float, v_rest: float):
+        w = w + 1. / tau_w * (a * (v - v_rest) - w) + b * spike
+        v = (1. - spike_d) * v + spike * v_reset
+        return v, w
+
+    @staticmethod
+    @torch.jit.script
+    def jit_soft_reset_with_adaptation(v: torch.Tensor, w: torch.Tensor, spike_d: torch.Tensor, v_threshold: float,
+                                       b: float, spike: torch.Tensor, tau_w: float, a: float, v_rest: float):
+        w = w + 1. / tau_w * (a * (v - v_rest) - w) + b * spike
+        v = v - spike_d * v_threshold
+        return v, w
+
+    def neuronal_adaptation_and_reset(self, spike):
+        """
+        * :ref:`API in English <AdaptBaseNode.neuronal_adaptation_and_reset-en>`
+
+        .. _AdaptBaseNode.neuronal_adaptation_and_reset-cn:
+
+        在一个融合的函数中依次完成 ``neuronal_adaptation`` 和 ``neuronal_reset``。由于 ``neuronal_fire`` 不依赖 ``w``，
+        适应性电流的更新可以推迟到放电之后，与重置合并，从而减少对 ``v`` 和 ``w`` 的读写次数。
+
+        * :ref:`中文API <AdaptBaseNode.neuronal_adaptation_and_reset-cn>`
+
+        .. _AdaptBaseNode.neuronal_adaptation_and_reset-en:
+
+        Run ``neuronal_adaptation`` and ``neuronal_reset`` in one fused function. As ``neuronal_fire`` does not depend on
+        ``w``, the update of the adaptation current can be deferred after firing and merged with the reset, which
+        reduces the number of reads/writes of ``v`` and ``w``.
+        """
+        spike_d = self._detach_fn(spike)
+
+        if self.v_reset is None:
+            # soft reset
+            self.v, self.w = self.jit_soft_reset_with_adaptation(self.v, self.w, spike_d, self.v_threshold, self.b,
+                                                                 spike, self.tau_w, self.a, self.v_rest)
+
+        else:
+            # hard reset
+            self.v, self.w = self.jit_hard_reset_with_adaptation(self.v, self.w, spike_d, self.v_reset, self.b,
+                                                                 spike, self.tau_w, self.a, self.v_rest)
+
     def extra_repr(self):
         return super().extra_repr() + f', v_rest={self.v_rest}, w_rest={self.w_rest}, tau_w={self.tau_w}, a={self.a}, b={self.b}'
 
@@ -419,21 +667,82 @@ class AdaptBaseNode(BaseNode):
         self.v_float_to_tensor(x)
         self.w_float_to_tensor(x)
         self.neuronal_charge(x)
-        self.neuronal_adaptation()
-        spike = self.neuronal_fire()
-        self.neuronal_reset(spike)
+        if type(self).neuronal_adaptation is AdaptBaseNode.neuronal_adaptation and \
+                type(self).neuronal_reset is AdaptBaseNode.neuronal_reset:
+            spike = self.neuronal_fire()
+            self.neuronal_adaptation_and_reset(spike)
+        else:
+            self.neuronal_adaptation()
+            spike = self.neuronal_fire()
+            self.neuronal_reset(spike)
         return spike
 
     def w_float_to_tensor(self, x: torch.Tensor):
         if isinstance(self.w, float):
             w_init = self.w
-            self.w = torch.full_like(x.data, fill_value=w_init)
+            self.w = torch.full(x.shape, w_init, dtype=x.dtype, device=x.device)
+
+
+@torch.jit.script
+def if_step_hard_reset(v: torch.Tensor, x: torch.Tensor, v_threshold: float, v_reset: float):
+    """
+    * :ref:`API in English <if_step_hard_reset-en>`
+
+    .. _if_step_hard_reset-cn:
+
+    :return: ``(spike, v)``
+    :rtype: tuple
+
+    硬重置的IF神经元单步更新的纯函数实现，不修改任何输入，也没有状态，因此可以直接使用 ``torch.vmap`` 或
+    ``torch.func`` 在额外的维度（例如多个模型）上批量计算。前向传播使用阶跃函数，不包含替代梯度。
+
+    * :ref:`中文API <if_step_hard_reset-cn>`
+
+    .. _if_step_hard_reset-en:
+
+    :return: ``(spike, v)``
+    :rtype: tuple
+
+    The pure functional single-step update of the IF neuron with hard reset. It does not modify any input and holds no
+    state, and can be batched over an extra dimension (e.g., an ensemble of models) by ``torch.vmap`` or ``torch.func``.
+    The heaviside function is used in forward and no surrogate gradient is involved.
+    """
+    v = v + x
+    mask = v >= v_threshold
+    return mask.to(x), torch.where(mask, v_reset, v)
+
+
+@torch.jit.script
+def if_step_soft_reset(v: torch.Tensor, x: torch.Tensor, v_threshold: float):
+    """
+    * :ref:`API in English <if_step_soft_reset-en>`
+
+    .. _if_step_soft_reset-cn:
+
+    :return: ``(spike, v)``
+    :rtype: tuple
+
+    软重置的IF神经元单步更新的纯函数实现，参见 :ref:`if_step_hard_reset <if_step_hard_reset-cn>`。
+
+    * :ref:`中文API <if_step_soft_reset-cn>`
+
+    .. _if_step_soft_reset-en:
+
+    :return: ``(spike, v)``
+    :rtype: tuple
+
+    The pure functional single-step update of the IF neuron with soft reset. Refer to
+    :ref:`if_step_hard_reset <if_step_hard_reset-en>` for more details.
+    """
+    v = v + x
+    spike = (v >= v_threshold).to(x)
+    return spike, v - spike * v_threshold
 
 
 class IFNode(BaseNode):
     def __init__(self, v_threshold: float = 1., v_reset: float = 0.,
                  surrogate_function: Callable = surrogate.Sigmoid(), detach_reset: bool = False, step_mode='s',
-                 backend='torch', store_v_seq: bool = False):
+                 backend='torch', store_v_seq: bool = False, use_cuda_graph: bool = False):
         """
         * :ref:`API in English <IFNode.__init__-en>`
 
@@ -456,7 +765,9 @@ class IFNode(BaseNode):
         :type step_mode: str
 
         :param backend: 使用那种后端。不同的 ``step_mode`` 可能会带有不同的后端。可以通过打印 ``self.supported_backends`` 查看当前
-            使用的步进模式支持的后端。在支持的情况下，使用 ``'cupy'`` 后端是速度最快的
+            使用的步进模式支持的后端。在支持的情况下，使用 ``'cupy'`` 后端是速度最快的。多步模式下的 ``'triton'`` 后端在CUDA上
+            使用Triton kernel，目前仅支持 ``surrogate.Sigmoid`` 和 ``surrogate.ATan``；若输入不在CUDA上、使用了其他替代函数、替代函数
+            注册了hook或子类重写了充电、放电、重置函数，则回退到 ``'torch'`` 后端的逐步实现
         :type backend: str
 
         :param store_v_seq: 在使用 ``step_mode = 'm'`` 时，给与 ``shape = [T, N, *]`` 的输入后，是否保存中间过程的 ``shape = [T, N, *]``
@@ -464,6 +775,11 @@ class IFNode(BaseNode):
             通常设置成 ``False`` ，可以节省内存
         :type store_v_seq: bool
 
+        :param use_cuda_graph: 在CUDA上使用多步模式推理且不需要梯度时，是否使用CUDA graph重放整个 ``T`` 步的前向传播。输入的形状
+            固定时可以减少kernel启动开销；形状经常变化时每个新形状都需要重新捕获，不建议启用。启用时优先于 ``'triton'`` 后端的推理
+            kernel
+        :type use_cuda_graph: bool
+
         Integrate-and-Fire 神经元模型，可以看作理想积分器，无输入时电压保持恒定，不会像LIF神经元那样衰减。其阈下神经动力学方程为：
 
         .. math::
@@ -491,7 +807,11 @@ class IFNode(BaseNode):
 
         :param backend: backend fot this neurons layer. Different ``step_mode`` may support for different backends. The user can
         print ``self.supported_backends`` and check what backends are supported by the current ``step_mode``. If supported,
-        using ``'cupy'`` backend will have the fastest training speed
+        using ``'cupy'`` backend will have the fastest training speed. The ``'triton'`` backend in multi-step mode uses Triton
+        kernels on CUDA, and only supports ``surrogate.Sigmoid`` and ``surrogate.ATan`` now. It falls back to the
+        step-by-step implementation of the ``'torch'`` backend if the input is not on CUDA, another surrogate function
+        is used, hooks are registered on the surrogate function, or the charge, fire or reset functions are overridden
+        by a subclass
         :type backend: str
 
         :param store_v_seq: when using ``step_mode = 'm'`` and given input with ``shape = [T, N, *]``, this option controls
@@ -500,6 +820,12 @@ class IFNode(BaseNode):
             memory consumption
         :type store_v_seq: bool
 
+        :param use_cuda_graph: whether to replay the forward of all ``T`` time-steps by a CUDA graph in multi-step
+            inference on CUDA without gradients. It reduces the overhead of launching kernels if the shape of inputs is
+            fixed. It is not recommended if the shape changes frequently, as each new shape requires a new capture. If
+            enabled, it takes precedence over the inference kernel of the ``'triton'`` backend
+        :type use_cuda_graph: bool
+
         The Integrate-and-Fire neuron, which can be seen as a ideal integrator. The voltage of the IF neuron will not decay
         as that of the LIF neuron. The sub-threshold neural dynamics of it is as followed:
 
@@ -508,13 +834,14 @@ class IFNode(BaseNode):
 
         """
         super().__init__(v_threshold, v_reset, surrogate_function, detach_reset, step_mode, backend, store_v_seq)
+        self.use_cuda_graph = use_cuda_graph
 
     @property
     def supported_backends(self):
         if self.step_mode == 's':
             return ('torch', 'cupy')
         elif self.step_mode == 'm':
-            return ('torch', 'cupy')
+            return ('torch', 'cupy', 'triton')
         else:
             raise ValueError(self.step_mode)
 
@@ -524,73 +851,109 @@ class IFNode(BaseNode):
     @staticmethod
     @torch.jit.script
     def jit_eval_single_step_forward_hard_reset(x: torch.Tensor, v: torch.Tensor, v_threshold: float, v_reset: float):
-        v = v + x
-        spike = (v >= v_threshold).to(x)
-        v = v_reset * spike + (1. - spike) * v
-        return spike, v
+        return if_step_hard_reset(v, x, v_threshold, v_reset)
 
     @staticmethod
     @torch.jit.script
     def jit_eval_single_step_forward_soft_reset(x: torch.Tensor, v: torch.Tensor, v_threshold: float):
-        v = v + x
-        spike = (v >= v_threshold).to(x)
-        v = v - spike * v_threshold
-        return spike, v
+        return if_step_soft_reset(v, x, v_threshold)
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_hard_reset(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float,
                                                v_reset: float):
-        spike_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        # the mask is reused by all time-steps
+        mask = torch.empty(v.shape, dtype=torch.bool, device=v.device)
         for t in range(x_seq.shape[0]):
-            v = v + x_seq[t]
-            spike = (v >= v_threshold).to(x_seq)
-            v = v_reset * spike + (1. - spike) * v
-            spike_seq[t] = spike
-        return spike_seq, v
+            v.add_(x_seq[t])
+            torch.ge(v, v_threshold, out=mask)
+            spike_seq[t] = mask
+            v.masked_fill_(mask, v_reset)
+        return spike_seq.view(shape), v_out
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_hard_reset_with_v_seq(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float,
                                                           v_reset: float):
-        spike_seq = torch.zeros_like(x_seq)
-        v_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        v_seq = torch.empty(shape, dtype=x_seq.dtype, device=x_seq.device)
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        v_seq_flat = v_seq.view(x_seq.shape)
+        # the mask is reused by all time-steps
+        mask = torch.empty(v.shape, dtype=torch.bool, device=v.device)
         for t in range(x_seq.shape[0]):
-            v = v + x_seq[t]
-            spike = (v >= v_threshold).to(x_seq)
-            v = v_reset * spike + (1. - spike) * v
-            spike_seq[t] = spike
-            v_seq[t] = v
-        return spike_seq, v, v_seq
+            v.add_(x_seq[t])
+            torch.ge(v, v_threshold, out=mask)
+            spike_seq[t] = mask
+            v.masked_fill_(mask, v_reset)
+            v_seq_flat[t] = v
+        return spike_seq.view(shape), v_out, v_seq
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_soft_reset(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float):
-        spike_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
         for t in range(x_seq.shape[0]):
-            v = v + x_seq[t]
-            spike = (v >= v_threshold).to(x_seq)
-            v = v - spike * v_threshold
-            spike_seq[t] = spike
-        return spike_seq, v
+            v.add_(x_seq[t])
+            torch.ge(v, v_threshold, out=spike_seq[t])
+            v.sub_(spike_seq[t], alpha=v_threshold)
+        return spike_seq.view(shape), v_out
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_soft_reset_with_v_seq(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float):
-        spike_seq = torch.zeros_like(x_seq)
-        v_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        v_seq = torch.empty(shape, dtype=x_seq.dtype, device=x_seq.device)
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        v_seq_flat = v_seq.view(x_seq.shape)
         for t in range(x_seq.shape[0]):
-            v = v + x_seq[t]
-            spike = (v >= v_threshold).to(x_seq)
-            v = v - spike * v_threshold
-            spike_seq[t] = spike
-            v_seq[t] = v
-        return spike_seq, v, v_seq
+            v.add_(x_seq[t])
+            torch.ge(v, v_threshold, out=spike_seq[t])
+            v.sub_(spike_seq[t], alpha=v_threshold)
+            v_seq_flat[t] = v
+        return spike_seq.view(shape), v_out, v_seq
 
     def multi_step_forward(self, x_seq: torch.Tensor):
         if self.training:
             if self.backend == 'torch':
                 return super().multi_step_forward(x_seq)
+            elif self.backend == 'triton':
+                # the kernel implements the default IF dynamics and surrogate gradients, and can not be used if any of
+                # them is overridden by a subclass or hooked
+                if triton_if_kernel is not None and x_seq.is_cuda \
+                        and type(self).single_step_forward is IFNode.single_step_forward \
+                        and type(self).neuronal_charge is IFNode.neuronal_charge \
+                        and type(self).neuronal_fire is BaseNode.neuronal_fire \
+                        and type(self).neuronal_reset is BaseNode.neuronal_reset \
+                        and _is_hook_free_surrogate(self.surrogate_function):
+                    try:
+                        self.v_float_to_tensor(x_seq[0])
+                        spike_seq, v_seq = triton_if_kernel.multi_step_forward_train(x_seq, self.v, self.v_threshold,
+                                                                                     self.v_reset,
+                                                                                     self.surrogate_function,
+                                                                                     self.detach_reset)
+                        if self.store_v_seq:
+                            self.v_seq = v_seq
+                        self.v = v_seq[-1].clone()
+                        return spike_seq
+                    except NotImplementedError:
+                        pass
+                return super().multi_step_forward(x_seq)
             elif self.backend == 'cupy':
                 hard_reset = self.v_reset is not None
 
@@ -601,20 +964,22 @@ class IFNode(BaseNode):
                 else:
                     raise NotImplementedError(x_seq.dtype)
 
-                if self.forward_kernel is None or not self.forward_kernel.check_attributes(hard_reset=hard_reset,
-                                                                                           dtype=dtype):
+                # compare a tuple with the cached one, rather than calling check_attributes on both kernels
+                kernel_sig = ('m', hard_reset, self.detach_reset, dtype, self.surrogate_function)
+                if self.forward_kernel is None or self.backward_kernel is None or self._kernel_sig != kernel_sig:
                     self.forward_kernel = ac_neuron_kernel.IFNodeFPTTKernel(hard_reset=hard_reset, dtype=dtype)
-
-                if self.backward_kernel is None or not self.backward_kernel.check_attributes(
-                        surrogate_function=self.surrogate_function.cuda_codes, hard_reset=hard_reset,
-                        detach_reset=self.detach_reset, dtype=dtype):
                     self.backward_kernel = ac_neuron_kernel.IFNodeBPTTKernel(
                         surrogate_function=self.surrogate_function.cuda_codes, hard_reset=hard_reset,
                         detach_reset=self.detach_reset, dtype=dtype)
+                    self._kernel_sig = kernel_sig
 
                 self.v_float_to_tensor(x_seq[0])
 
-                spike_seq, v_seq = ac_neuron_kernel.IFNodeATGF.apply(x_seq.flatten(1), self.v.flatten(0),
+                # flatten(1) may return a strided view, e.g., when x_seq is sliced from a larger tensor. The kernels
+                # index [T, N] densely, so make the layout explicit here
+                x_flat = x_seq.contiguous().view(x_seq.shape[0], -1)
+                v_flat = self.v.contiguous().view(-1)
+                spike_seq, v_seq = ac_neuron_kernel.IFNodeATGF.apply(x_flat, v_flat,
                                                                      self.v_threshold, self.v_reset,
                                                                      self.forward_kernel,
                                                                      self.backward_kernel)
@@ -633,27 +998,45 @@ class IFNode(BaseNode):
 
         else:
             self.v_float_to_tensor(x_seq[0])
-            if self.v_reset is None:
-                if self.store_v_seq:
-                    spike_seq, self.v, self.v_seq = self.jit_eval_multi_step_forward_soft_reset_with_v_seq(x_seq,
-                                                                                                           self.v,
-                                                                                                           self.v_threshold)
-                else:
-                    spike_seq, self.v = self.jit_eval_multi_step_forward_soft_reset(x_seq, self.v, self.v_threshold)
+            requires_grad = torch.is_grad_enabled() and (x_seq.requires_grad or self.v.requires_grad)
+            if self.use_cuda_graph and x_seq.is_cuda and not (x_seq.requires_grad or self.v.requires_grad):
+                spike_seq, self.v, v_seq = self.cuda_graph_eval_multi_step_forward(x_seq, self.v)
+            elif self.backend == 'triton' and triton_if_kernel is not None and x_seq.is_cuda and not requires_grad:
+                spike_seq, self.v, v_seq = triton_if_kernel.multi_step_forward(x_seq, self.v, self.v_threshold,
+                                                                               self.v_reset, self.store_v_seq)
+            elif requires_grad:
+                # the triton kernel and the jit functions do not support autograd
+                spike_seq, self.v, v_seq = self.eval_multi_step_forward_autograd(x_seq, self.v)
             else:
-                if self.store_v_seq:
-                    spike_seq, self.v, self.v_seq = self.jit_eval_multi_step_forward_hard_reset_with_v_seq(x_seq,
-                                                                                                           self.v,
-                                                                                                           self.v_threshold,
-                                                                                                           self.v_reset)
-                else:
-                    spike_seq, self.v = self.jit_eval_multi_step_forward_hard_reset(x_seq, self.v, self.v_threshold,
-                                                                                    self.v_reset)
+                spike_seq, self.v, v_seq = self.jit_eval_multi_step_forward(x_seq, self.v)
+            if self.store_v_seq:
+                self.v_seq = v_seq
             return spike_seq
 
+    def jit_eval_multi_step_forward(self, x_seq: torch.Tensor, v: torch.Tensor):
+        if self.v_reset is None:
+            if self.store_v_seq:
+                return self.jit_eval_multi_step_forward_soft_reset_with_v_seq(x_seq, v, self.v_threshold)
+            else:
+                spike_seq, v = self.jit_eval_multi_step_forward_soft_reset(x_seq, v, self.v_threshold)
+        else:
+            if self.store_v_seq:
+                return self.jit_eval_multi_step_forward_hard_reset_with_v_seq(x_seq, v, self.v_threshold,
+                                                                              self.v_reset)
+            else:
+                spike_seq, v = self.jit_eval_multi_step_forward_hard_reset(x_seq, v, self.v_threshold, self.v_reset)
+        return spike_seq, v, None
+
+    def jit_eval_single_step_forward(self, x: torch.Tensor, v: torch.Tensor):
+        if self.v_reset is None:
+            return self.jit_eval_single_step_forward_soft_reset(x, v, self.v_threshold)
+        else:
+            return self.jit_eval_single_step_forward_hard_reset(x, v, self.v_threshold, self.v_reset)
+
     def single_step_forward(self, x: torch.Tensor):
         if self.training:
-            if self.backend == 'torch':
+            # the step-by-step fallback of the 'triton' backend in multi-step mode also calls this function
+            if self.backend == 'torch' or self.backend == 'triton':
                 return super().single_step_forward(x)
             elif self.backend == 'cupy':
                 hard_reset = self.v_reset is not None
@@ -665,20 +1048,17 @@ class IFNode(BaseNode):
                 else:
                     raise NotImplementedError(x.dtype)
                 
-                if self.forward_kernel is None or not self.forward_kernel.check_attributes(hard_reset=hard_reset,
-                                                                                           dtype=dtype):
+                kernel_sig = ('s', hard_reset, self.detach_reset, dtype, self.surrogate_function)
+                if self.forward_kernel is None or self.backward_kernel is None or self._kernel_sig != kernel_sig:
                     self.forward_kernel = ss_ac_neuron_kernel.IFNodeFPKernel(hard_reset=hard_reset, dtype=dtype)
-
-                if self.backward_kernel is None or not self.backward_kernel.check_attributes(
-                        surrogate_function=self.surrogate_function.cuda_codes, hard_reset=hard_reset,
-                        detach_reset=self.detach_reset, dtype=dtype):
                     self.backward_kernel = ss_ac_neuron_kernel.IFNodeBPKernel(
                         surrogate_function=self.surrogate_function.cuda_codes, hard_reset=hard_reset,
                         detach_reset=self.detach_reset, dtype=dtype)
+                    self._kernel_sig = kernel_sig
 
                 self.v_float_to_tensor(x)
 
-                spike, v = ss_ac_neuron_kernel.IFNodeATGF.apply(x.flatten(0), self.v.flatten(0),
+                spike, v = ss_ac_neuron_kernel.IFNodeATGF.apply(x.contiguous().view(-1), self.v.contiguous().view(-1),
                                                                      self.v_threshold, self.v_reset,
                                                                      self.forward_kernel,
                                                                      self.backward_kernel)
@@ -694,17 +1074,15 @@ class IFNode(BaseNode):
 
         else:
             self.v_float_to_tensor(x)
-            if self.v_reset is None:
-                spike, self.v = self.jit_eval_single_step_forward_soft_reset(x, self.v, self.v_threshold)
-            else:
-                spike, self.v = self.jit_eval_single_step_forward_hard_reset(x, self.v, self.v_threshold, self.v_reset)
+            spike, self.v = self.jit_eval_single_step_forward(x, self.v)
             return spike
 
 
 class LIFNode(BaseNode):
     def __init__(self, tau: float = 2., decay_input: bool = True, v_threshold: float = 1.,
                  v_reset: float = 0., surrogate_function: Callable = surrogate.Sigmoid(),
-                 detach_reset: bool = False, step_mode='s', backend='torch', store_v_seq: bool = False):
+                 detach_reset: bool = False, step_mode='s', backend='torch', store_v_seq: bool = False,
+                 use_cuda_graph: bool = False):
         """
         * :ref:`API in English <LIFNode.__init__-en>`
 
@@ -733,7 +1111,9 @@ class LIFNode(BaseNode):
         :type step_mode: str
 
         :param backend: 使用那种后端。不同的 ``step_mode`` 可能会带有不同的后端。可以通过打印 ``self.supported_backends`` 查看当前
-            使用的步进模式支持的后端。在支持的情况下，使用 ``'cupy'`` 后端是速度最快的
+            使用的步进模式支持的后端。在支持的情况下，使用 ``'cupy'`` 后端是速度最快的。多步模式下的 ``'triton'`` 后端在CUDA上
+            推理时使用Triton kernel；``'numba'`` 后端在CPU上对 ``torch.float32`` 或 ``torch.float64`` 的输入推理时使用Numba
+            kernel。这两种后端在训练时与 ``'torch'`` 后端相同
         :type backend: str
 
         :param store_v_seq: 在使用 ``step_mode = 'm'`` 时，给与 ``shape = [T, N, *]`` 的输入后，是否保存中间过程的 ``shape = [T, N, *]``
@@ -741,6 +1121,11 @@ class LIFNode(BaseNode):
             通常设置成 ``False`` ，可以节省内存
         :type store_v_seq: bool
 
+        :param use_cuda_graph: 在CUDA上使用多步模式推理且不需要梯度时，是否使用CUDA graph重放整个 ``T`` 步的前向传播。输入的形状
+            固定时可以减少kernel启动开销；形状经常变化时每个新形状都需要重新捕获，不建议启用。启用时优先于 ``'triton'`` 后端的推理
+            kernel
+        :type use_cuda_graph: bool
+
         Leaky Integrate-and-Fire 神经元模型，可以看作是带漏电的积分器。其阈下神经动力学方程为：
 
         若 ``decay_input == True``:
@@ -782,7 +1167,10 @@ class LIFNode(BaseNode):
 
         :param backend: backend fot this neurons layer. Different ``step_mode`` may support for different backends. The user can
         print ``self.supported_backends`` and check what backends are supported by the current ``step_mode``. If supported,
-        using ``'cupy'`` backend will have the fastest training speed
+        using ``'cupy'`` backend will have the fastest training speed. The ``'triton'`` backend in multi-step mode uses a
+        Triton kernel in inference on CUDA. The ``'numba'`` backend in multi-step mode uses a Numba kernel in inference on
+        CPU with inputs of ``torch.float32`` or ``torch.float64``. Both of them are the same as the ``'torch'`` backend
+        in training
         :type backend: str
 
         :param store_v_seq: when using ``step_mode = 'm'`` and given input with ``shape = [T, N, *]``, this option controls
@@ -791,6 +1179,12 @@ class LIFNode(BaseNode):
             memory consumption
         :type store_v_seq: bool
 
+        :param use_cuda_graph: whether to replay the forward of all ``T`` time-steps by a CUDA graph in multi-step
+            inference on CUDA without gradients. It reduces the overhead of launching kernels if the shape of inputs is
+            fixed. It is not recommended if the shape changes frequently, as each new shape requires a new capture. If
+            enabled, it takes precedence over the inference kernel of the ``'triton'`` backend
+        :type use_cuda_graph: bool
+
         The Leaky Integrate-and-Fire neuron, which can be seen as a leaky integrator.
         The subthreshold neural dynamics of it is as followed:
 
@@ -808,16 +1202,26 @@ class LIFNode(BaseNode):
         assert isinstance(tau, float) and tau > 1.
 
         super().__init__(v_threshold, v_reset, surrogate_function, detach_reset, step_mode, backend, store_v_seq)
+        self.use_cuda_graph = use_cuda_graph
 
         self.tau = tau
         self.decay_input = decay_input
 
+    @property
+    def tau(self):
+        return self._tau
+
+    @tau.setter
+    def tau(self, value: float):
+        self._tau = value
+        self._inv_tau = 1. / value
+
     @property
     def supported_backends(self):
         if self.step_mode == 's':
             return ('torch', 'cupy')
         elif self.step_mode == 'm':
-            return ('torch', 'cupy')
+            return ('torch', 'cupy', 'triton', 'numba')
         else:
             raise ValueError(self.step_mode)
 
@@ -840,51 +1244,54 @@ class LIFNode(BaseNode):
     @staticmethod
     @torch.jit.script
     def neuronal_charge_decay_input_reset0(x: torch.Tensor, v: torch.Tensor, tau: float):
-        v = v + (x - v) / tau
+        v = v + (x - v) * (1. / tau)
         return v
 
     @staticmethod
     @torch.jit.script
     def neuronal_charge_decay_input(x: torch.Tensor, v: torch.Tensor, v_reset: float, tau: float):
-        v = v + (x - (v - v_reset)) / tau
+        v = v + (x - (v - v_reset)) * (1. / tau)
         return v
 
     @staticmethod
     @torch.jit.script
     def neuronal_charge_no_decay_input_reset0(x: torch.Tensor, v: torch.Tensor, tau: float):
-        v = v * (1. - 1. / tau) + x
+        v = torch.add(x, v, alpha=1. - 1. / tau)
         return v
 
     @staticmethod
     @torch.jit.script
     def neuronal_charge_no_decay_input(x: torch.Tensor, v: torch.Tensor, v_reset: float, tau: float):
-        v = v - (v - v_reset) / tau + x
+        v = v - (v - v_reset) * (1. / tau) + x
         return v
 
     @staticmethod
     @torch.jit.script
     def jit_eval_single_step_forward_hard_reset_decay_input(x: torch.Tensor, v: torch.Tensor, v_threshold: float,
                                                             v_reset: float, tau: float):
-        v = v + (x - (v - v_reset)) / tau
-        spike = (v >= v_threshold).to(x)
-        v = v_reset * spike + (1. - spike) * v
+        v = v + (x - (v - v_reset)) * (1. / tau)
+        mask = v >= v_threshold
+        spike = mask.to(x)
+        v = torch.where(mask, v_reset, v)
         return spike, v
 
     @staticmethod
     @torch.jit.script
     def jit_eval_single_step_forward_hard_reset_no_decay_input(x: torch.Tensor, v: torch.Tensor, v_threshold: float,
                                                                v_reset: float, tau: float):
-        v = v - (v - v_reset) / tau + x
-        spike = (v >= v_threshold).to(x)
-        v = v_reset * spike + (1. - spike) * v
+        v = v - (v - v_reset) * (1. / tau) + x
+        mask = v >= v_threshold
+        spike = mask.to(x)
+        v = torch.where(mask, v_reset, v)
         return spike, v
 
     @staticmethod
     @torch.jit.script
     def jit_eval_single_step_forward_soft_reset_decay_input(x: torch.Tensor, v: torch.Tensor, v_threshold: float,
                                                             tau: float):
-        v = v + (x - v) / tau
-        spike = (v >= v_threshold).to(x)
+        v = v + (x - v) * (1. / tau)
+        spike = torch.empty_like(x)
+        torch.ge(v, v_threshold, out=spike)
         v = v - spike * v_threshold
         return spike, v
 
@@ -892,8 +1299,9 @@ class LIFNode(BaseNode):
     @torch.jit.script
     def jit_eval_single_step_forward_soft_reset_no_decay_input(x: torch.Tensor, v: torch.Tensor, v_threshold: float,
                                                                tau: float):
-        v = v * (1. - 1. / tau) + x
-        spike = (v >= v_threshold).to(x)
+        v = torch.add(x, v, alpha=1. - 1. / tau)
+        spike = torch.empty_like(x)
+        torch.ge(v, v_threshold, out=spike)
         v = v - spike * v_threshold
         return spike, v
 
@@ -901,111 +1309,203 @@ class LIFNode(BaseNode):
     @torch.jit.script
     def jit_eval_multi_step_forward_hard_reset_decay_input(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float,
                                                            v_reset: float, tau: float):
-        spike_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        inv_tau = 1. / tau
+        decay = 1. - inv_tau
+        # v + (x - (v - v_reset)) / tau = v * decay + x / tau + v_reset / tau, whose last term vanishes if v_reset = 0
+        bias = v_reset * inv_tau
+        # the mask is reused by all time-steps
+        mask = torch.empty(v.shape, dtype=torch.bool, device=v.device)
         for t in range(x_seq.shape[0]):
-            v = v + (x_seq[t] - (v - v_reset)) / tau
-            spike = (v >= v_threshold).to(x_seq)
-            v = v_reset * spike + (1. - spike) * v
-            spike_seq[t] = spike
-        return spike_seq, v
+            v.mul_(decay).add_(x_seq[t], alpha=inv_tau)
+            if bias != 0.:
+                v.add_(bias)
+            torch.ge(v, v_threshold, out=mask)
+            spike_seq[t] = mask
+            v.masked_fill_(mask, v_reset)
+        return spike_seq.view(shape), v_out
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_hard_reset_decay_input_with_v_seq(x_seq: torch.Tensor, v: torch.Tensor,
                                                                       v_threshold: float, v_reset: float, tau: float):
-        spike_seq = torch.zeros_like(x_seq)
-        v_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        v_seq = torch.empty(shape, dtype=x_seq.dtype, device=x_seq.device)
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        v_seq_flat = v_seq.view(x_seq.shape)
+        inv_tau = 1. / tau
+        decay = 1. - inv_tau
+        # v + (x - (v - v_reset)) / tau = v * decay + x / tau + v_reset / tau, whose last term vanishes if v_reset = 0
+        bias = v_reset * inv_tau
+        # the mask is reused by all time-steps
+        mask = torch.empty(v.shape, dtype=torch.bool, device=v.device)
         for t in range(x_seq.shape[0]):
-            v = v + (x_seq[t] - (v - v_reset)) / tau
-            spike = (v >= v_threshold).to(x_seq)
-            v = v_reset * spike + (1. - spike) * v
-            spike_seq[t] = spike
-            v_seq[t] = v
-        return spike_seq, v, v_seq
+            v.mul_(decay).add_(x_seq[t], alpha=inv_tau)
+            if bias != 0.:
+                v.add_(bias)
+            torch.ge(v, v_threshold, out=mask)
+            spike_seq[t] = mask
+            v.masked_fill_(mask, v_reset)
+            v_seq_flat[t] = v
+        return spike_seq.view(shape), v_out, v_seq
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_hard_reset_no_decay_input(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float,
                                                               v_reset: float, tau: float):
-        spike_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        inv_tau = 1. / tau
+        decay = 1. - inv_tau
+        # v - (v - v_reset) / tau + x = v * decay + x + v_reset / tau, whose last term vanishes if v_reset = 0
+        bias = v_reset * inv_tau
+        # the mask is reused by all time-steps
+        mask = torch.empty(v.shape, dtype=torch.bool, device=v.device)
         for t in range(x_seq.shape[0]):
-            v = v - (v - v_reset) / tau + x_seq[t]
-            spike = (v >= v_threshold).to(x_seq)
-            v = v_reset * spike + (1. - spike) * v
-            spike_seq[t] = spike
-        return spike_seq, v
+            v.mul_(decay).add_(x_seq[t])
+            if bias != 0.:
+                v.add_(bias)
+            torch.ge(v, v_threshold, out=mask)
+            spike_seq[t] = mask
+            v.masked_fill_(mask, v_reset)
+        return spike_seq.view(shape), v_out
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_hard_reset_no_decay_input_with_v_seq(x_seq: torch.Tensor, v: torch.Tensor,
                                                                          v_threshold: float, v_reset: float,
                                                                          tau: float):
-        spike_seq = torch.zeros_like(x_seq)
-        v_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        v_seq = torch.empty(shape, dtype=x_seq.dtype, device=x_seq.device)
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        v_seq_flat = v_seq.view(x_seq.shape)
+        inv_tau = 1. / tau
+        decay = 1. - inv_tau
+        # v - (v - v_reset) / tau + x = v * decay + x + v_reset / tau, whose last term vanishes if v_reset = 0
+        bias = v_reset * inv_tau
+        # the mask is reused by all time-steps
+        mask = torch.empty(v.shape, dtype=torch.bool, device=v.device)
         for t in range(x_seq.shape[0]):
-            v = v - (v - v_reset) / tau + x_seq[t]
-            spike = (v >= v_threshold).to(x_seq)
-            v = v_reset * spike + (1. - spike) * v
-            spike_seq[t] = spike
-            v_seq[t] = v
-        return spike_seq, v, v_seq
+            v.mul_(decay).add_(x_seq[t])
+            if bias != 0.:
+                v.add_(bias)
+            torch.ge(v, v_threshold, out=mask)
+            spike_seq[t] = mask
+            v.masked_fill_(mask, v_reset)
+            v_seq_flat[t] = v
+        return spike_seq.view(shape), v_out, v_seq
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_soft_reset_decay_input(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float,
                                                            tau: float):
-        spike_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        inv_tau = 1. / tau
         for t in range(x_seq.shape[0]):
-            v = v + (x_seq[t] - v) / tau
-            spike = (v >= v_threshold).to(x_seq)
-            v = v - spike * v_threshold
-            spike_seq[t] = spike
-        return spike_seq, v
+            v.add_(x_seq[t] - v, alpha=inv_tau)
+            torch.ge(v, v_threshold, out=spike_seq[t])
+            v.sub_(spike_seq[t], alpha=v_threshold)
+        return spike_seq.view(shape), v_out
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_soft_reset_decay_input_with_v_seq(x_seq: torch.Tensor, v: torch.Tensor,
                                                                       v_threshold: float, tau: float):
-        spike_seq = torch.zeros_like(x_seq)
-        v_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        v_seq = torch.empty(shape, dtype=x_seq.dtype, device=x_seq.device)
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        v_seq_flat = v_seq.view(x_seq.shape)
+        inv_tau = 1. / tau
         for t in range(x_seq.shape[0]):
-            v = v + (x_seq[t] - v) / tau
-            spike = (v >= v_threshold).to(x_seq)
-            v = v - spike * v_threshold
-            spike_seq[t] = spike
-            v_seq[t] = v
-        return spike_seq, v, v_seq
+            v.add_(x_seq[t] - v, alpha=inv_tau)
+            torch.ge(v, v_threshold, out=spike_seq[t])
+            v.sub_(spike_seq[t], alpha=v_threshold)
+            v_seq_flat[t] = v
+        return spike_seq.view(shape), v_out, v_seq
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_soft_reset_no_decay_input(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float,
                                                               tau: float):
-        spike_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        inv_tau = 1. / tau
+        decay = 1. - inv_tau
         for t in range(x_seq.shape[0]):
-            v = v * (1. - 1. / tau) + x_seq[t]
-            spike = (v >= v_threshold).to(x_seq)
-            v = v - spike * v_threshold
-            spike_seq[t] = spike
-        return spike_seq, v
+            v.mul_(decay).add_(x_seq[t])
+            torch.ge(v, v_threshold, out=spike_seq[t])
+            v.sub_(spike_seq[t], alpha=v_threshold)
+        return spike_seq.view(shape), v_out
 
     @staticmethod
     @torch.jit.script
     def jit_eval_multi_step_forward_soft_reset_no_decay_input_with_v_seq(x_seq: torch.Tensor, v: torch.Tensor,
                                                                          v_threshold: float,
                                                                          tau: float):
-        spike_seq = torch.zeros_like(x_seq)
-        v_seq = torch.zeros_like(x_seq)
+        shape = x_seq.shape
+        v_seq = torch.empty(shape, dtype=x_seq.dtype, device=x_seq.device)
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        v_seq_flat = v_seq.view(x_seq.shape)
+        inv_tau = 1. / tau
+        decay = 1. - inv_tau
         for t in range(x_seq.shape[0]):
-            v = v * (1. - 1. / tau) + x_seq[t]
-            spike = (v >= v_threshold).to(x_seq)
-            v = v - spike * v_threshold
-            spike_seq[t] = spike
-            v_seq[t] = v
-        return spike_seq, v, v_seq
+            v.mul_(decay).add_(x_seq[t])
+            torch.ge(v, v_threshold, out=spike_seq[t])
+            v.sub_(spike_seq[t], alpha=v_threshold)
+            v_seq_flat[t] = v
+        return spike_seq.view(shape), v_out, v_seq
+
+    # the names of the jit functions used in inference, indexed by (hard_reset, decay_input) or
+    # (hard_reset, decay_input, store_v_seq). The names are resolved by ``getattr`` so that the subclass can override
+    # the functions
+    _jit_eval_single_step_forward_fns = {
+        (True, True): 'jit_eval_single_step_forward_hard_reset_decay_input',
+        (True, False): 'jit_eval_single_step_forward_hard_reset_no_decay_input',
+        (False, True): 'jit_eval_single_step_forward_soft_reset_decay_input',
+        (False, False): 'jit_eval_single_step_forward_soft_reset_no_decay_input',
+    }
+
+    _jit_eval_multi_step_forward_fns = {
+        (True, True, False): 'jit_eval_multi_step_forward_hard_reset_decay_input',
+        (True, True, True): 'jit_eval_multi_step_forward_hard_reset_decay_input_with_v_seq',
+        (True, False, False): 'jit_eval_multi_step_forward_hard_reset_no_decay_input',
+        (True, False, True): 'jit_eval_multi_step_forward_hard_reset_no_decay_input_with_v_seq',
+        (False, True, False): 'jit_eval_multi_step_forward_soft_reset_decay_input',
+        (False, True, True): 'jit_eval_multi_step_forward_soft_reset_decay_input_with_v_seq',
+        (False, False, False): 'jit_eval_multi_step_forward_soft_reset_no_decay_input',
+        (False, False, True): 'jit_eval_multi_step_forward_soft_reset_no_decay_input_with_v_seq',
+    }
 
     def single_step_forward(self, x: torch.Tensor):
         if self.training:
-            if self.backend == 'torch':
+            # the multi-step forward of the 'triton' and 'numba' backends in training also calls this function
+            if self.backend == 'torch' or self.backend == 'triton' or self.backend == 'numba':
                 return super().single_step_forward(x)
             elif self.backend == 'cupy':
                 hard_reset = self.v_reset is not None
@@ -1017,24 +1517,20 @@ class LIFNode(BaseNode):
                 else:
                     raise NotImplementedError(x.dtype)
                 
-                if self.forward_kernel is None or not self.forward_kernel.check_attributes(hard_reset=hard_reset,
-                                                                                           dtype=dtype,
-                                                                                           decay_input=self.decay_input):
+                kernel_sig = ('s', hard_reset, self.detach_reset, dtype, self.decay_input, self.surrogate_function)
+                if self.forward_kernel is None or self.backward_kernel is None or self._kernel_sig != kernel_sig:
                     self.forward_kernel = ss_ac_neuron_kernel.LIFNodeFPKernel(decay_input=self.decay_input,
                                                                               hard_reset=hard_reset, dtype=dtype)
-
-                if self.backward_kernel is None or not self.backward_kernel.check_attributes(
-                        surrogate_function=self.surrogate_function.cuda_codes, hard_reset=hard_reset,
-                        detach_reset=self.detach_reset, dtype=dtype, decay_input=self.decay_input):
                     self.backward_kernel = ss_ac_neuron_kernel.LIFNodeBPKernel(
                         decay_input=self.decay_input,
                         surrogate_function=self.surrogate_function.cuda_codes, hard_reset=hard_reset,
                         detach_reset=self.detach_reset, dtype=dtype)
+                    self._kernel_sig = kernel_sig
 
                 self.v_float_to_tensor(x)
 
                 spike, v = ss_ac_neuron_kernel.LIFNodeATGF.apply(x.flatten(0), self.v.flatten(0),
-                                                                 self.v_threshold, self.v_reset, 1. / self.tau,
+                                                                 self.v_threshold, self.v_reset, self._inv_tau,
                                                                  self.forward_kernel,
                                                                  self.backward_kernel)
 
@@ -1049,29 +1545,20 @@ class LIFNode(BaseNode):
 
         else:
             self.v_float_to_tensor(x)
-            if self.v_reset is None:
-                if self.decay_input:
-                    spike, self.v = self.jit_eval_single_step_forward_soft_reset_decay_input(x, self.v,
-                                                                                             self.v_threshold, self.tau)
-                else:
-                    spike, self.v = self.jit_eval_single_step_forward_soft_reset_no_decay_input(x, self.v,
-                                                                                                self.v_threshold,
-                                                                                                self.tau)
-            else:
-                if self.decay_input:
-                    spike, self.v = self.jit_eval_single_step_forward_hard_reset_decay_input(x, self.v,
-                                                                                             self.v_threshold,
-                                                                                             self.v_reset, self.tau)
-                else:
-                    spike, self.v = self.jit_eval_single_step_forward_hard_reset_no_decay_input(x, self.v,
-                                                                                                self.v_threshold,
-                                                                                                self.v_reset,
-                                                                                                self.tau)
+            spike, self.v = self.jit_eval_single_step_forward(x, self.v)
             return spike
 
+    def jit_eval_single_step_forward(self, x: torch.Tensor, v: torch.Tensor):
+        v_reset = self.v_reset
+        fn = getattr(self, self._jit_eval_single_step_forward_fns[(v_reset is not None, self.decay_input)])
+        if v_reset is None:
+            return fn(x, v, self.v_threshold, self.tau)
+        else:
+            return fn(x, v, self.v_threshold, v_reset, self.tau)
+
     def multi_step_forward(self, x_seq: torch.Tensor):
         if self.training:
-            if self.backend == 'torch':
+            if self.backend == 'torch' or self.backend == 'triton' or self.backend == 'numba':
                 return super().multi_step_forward(x_seq)
             elif self.backend == 'cupy':
 
@@ -1083,25 +1570,21 @@ class LIFNode(BaseNode):
                 else:
                     raise NotImplementedError(x_seq.dtype)
 
-                if self.forward_kernel is None or not self.forward_kernel.check_attributes(hard_reset=hard_reset,
-                                                                                           dtype=dtype,
-                                                                                           decay_input=self.decay_input):
+                kernel_sig = ('m', hard_reset, self.detach_reset, dtype, self.decay_input, self.surrogate_function)
+                if self.forward_kernel is None or self.backward_kernel is None or self._kernel_sig != kernel_sig:
                     self.forward_kernel = ac_neuron_kernel.LIFNodeFPTTKernel(decay_input=self.decay_input,
                                                                              hard_reset=hard_reset, dtype=dtype)
-
-                if self.backward_kernel is None or not self.backward_kernel.check_attributes(
-                        surrogate_function=self.surrogate_function.cuda_codes, hard_reset=hard_reset,
-                        detach_reset=self.detach_reset, dtype=dtype, decay_input=self.decay_input):
                     self.backward_kernel = ac_neuron_kernel.LIFNodeBPTTKernel(decay_input=self.decay_input,
                                                                               surrogate_function=self.surrogate_function.cuda_codes,
                                                                               hard_reset=hard_reset,
                                                                               detach_reset=self.detach_reset,
                                                                               dtype=dtype)
+                    self._kernel_sig = kernel_sig
 
                 self.v_float_to_tensor(x_seq[0])
 
                 spike_seq, v_seq = ac_neuron_kernel.LIFNodeATGF.apply(x_seq.flatten(1), self.v.flatten(0),
-                                                                      self.v_threshold, self.v_reset, 1. / self.tau,
+                                                                      self.v_threshold, self.v_reset, self._inv_tau,
                                                                       self.forward_kernel,
                                                                       self.backward_kernel)
 
@@ -1119,45 +1602,42 @@ class LIFNode(BaseNode):
 
         else:
             self.v_float_to_tensor(x_seq[0])
-            if self.v_reset is None:
-                if self.decay_input:
-                    if self.store_v_seq:
-                        spike_seq, self.v, self.v_seq = self.jit_eval_multi_step_forward_soft_reset_decay_input_with_v_seq(
-                            x_seq, self.v, self.v_threshold, self.tau)
-                    else:
-                        spike_seq, self.v = self.jit_eval_multi_step_forward_soft_reset_decay_input(x_seq, self.v,
-                                                                                                    self.v_threshold,
-                                                                                                    self.tau)
-                else:
-                    if self.store_v_seq:
-                        spike_seq, self.v, self.v_seq = self.jit_eval_multi_step_forward_soft_reset_no_decay_input_with_v_seq(
-                            x_seq, self.v, self.v_threshold, self.tau)
-                    else:
-                        spike_seq, self.v = self.jit_eval_multi_step_forward_soft_reset_no_decay_input(x_seq, self.v,
-                                                                                                       self.v_threshold,
-                                                                                                       self.tau)
+            requires_grad = torch.is_grad_enabled() and (x_seq.requires_grad or self.v.requires_grad)
+            if self.use_cuda_graph and x_seq.is_cuda and not (x_seq.requires_grad or self.v.requires_grad):
+                spike_seq, self.v, v_seq = self.cuda_graph_eval_multi_step_forward(x_seq, self.v)
+            elif self.backend == 'triton' and triton_lif_kernel is not None and x_seq.is_cuda and not requires_grad:
+                spike_seq, self.v, v_seq = triton_lif_kernel.multi_step_forward(x_seq, self.v, self.v_threshold,
+                                                                                self.v_reset, self.tau,
+                                                                                self.decay_input, self.store_v_seq)
+            elif self.backend == 'numba' and numba_lif_kernel is not None and x_seq.device.type == 'cpu' and (
+                    x_seq.dtype == torch.float32 or x_seq.dtype == torch.float64) and not (
+                    x_seq.requires_grad or self.v.requires_grad):
+                spike_seq, self.v, v_seq = numba_lif_kernel.multi_step_forward(x_seq, self.v, self.v_threshold,
+                                                                               self.v_reset, self.tau,
+                                                                               self.decay_input, self.store_v_seq)
+            elif requires_grad:
+                # the triton kernel and the jit functions update v in place, which does not support autograd
+                spike_seq, self.v, v_seq = self.eval_multi_step_forward_autograd(x_seq, self.v)
             else:
-                if self.decay_input:
-                    if self.store_v_seq:
-                        spike_seq, self.v, self.v_seq = self.jit_eval_multi_step_forward_hard_reset_decay_input_with_v_seq(
-                            x_seq, self.v, self.v_threshold, self.v_reset, self.tau)
-                    else:
-                        spike_seq, self.v = self.jit_eval_multi_step_forward_hard_reset_decay_input(x_seq, self.v,
-                                                                                                    self.v_threshold,
-                                                                                                    self.v_reset,
-                                                                                                    self.tau)
-                else:
-                    if self.store_v_seq:
-                        spike_seq, self.v, self.v_seq = self.jit_eval_multi_step_forward_hard_reset_no_decay_input_with_v_seq(
-                            x_seq, self.v, self.v_threshold, self.v_reset, self.tau)
-                    else:
-                        spike_seq, self.v = self.jit_eval_multi_step_forward_hard_reset_no_decay_input(x_seq, self.v,
-                                                                                                       self.v_threshold,
-                                                                                                       self.v_reset,
-                                                                                                       self.tau)
-
+                spike_seq, self.v, v_seq = self.jit_eval_multi_step_forward(x_seq, self.v)
+            if self.store_v_seq:
+                self.v_seq = v_seq
             return spike_seq
 
+    def jit_eval_settings(self):
+        return super().jit_eval_settings() + (self.tau, self.decay_input)
+
+    def jit_eval_multi_step_forward(self, x_seq: torch.Tensor, v: torch.Tensor):
+        # return (spike_seq, v, v_seq), where v_seq is None if not self.store_v_seq
+        v_reset = self.v_reset
+        store_v_seq = self.store_v_seq
+        fn = getattr(self, self._jit_eval_multi_step_forward_fns[(v_reset is not None, self.decay_input, store_v_seq)])
+        if v_reset is None:
+            out = fn(x_seq, v, self.v_threshold, self.tau)
+        else:
+            out = fn(x_seq, v, self.v_threshold, v_reset, self.tau)
+        return out if store_v_seq else out + (None,)
+
 
 class ParametricLIFNode(BaseNode):
     def __init__(self, init_tau: float = 2.0, decay_input: bool = True, v_threshold: float = 1.,
@@ -1280,6 +1760,8 @@ class ParametricLIFNode(BaseNode):
         self.decay_input = decay_input
         init_w = - math.log(init_tau - 1.)
         self.w = nn.Parameter(torch.as_tensor(init_w))
+        # ``self.w.sigmoid()`` shared by all time-steps in ``multi_step_forward``
+        self._k = None
 
     @property
     def supported_backends(self):
@@ -1296,20 +1778,215 @@ class ParametricLIFNode(BaseNode):
         return super().extra_repr() + f', tau={tau}'
 
     def neuronal_charge(self, x: torch.Tensor):
+        k = self.w.sigmoid() if self._k is None else self._k
         if self.decay_input:
             if self.v_reset is None or self.v_reset == 0.:
-                self.v = self.v + (x - self.v) * self.w.sigmoid()
+                self.v = self.v + (x - self.v) * k
             else:
-                self.v = self.v + (x - (self.v - self.v_reset)) * self.w.sigmoid()
+                self.v = self.v + (x - (self.v - self.v_reset)) * k
         else:
             if self.v_reset is None or self.v_reset == 0.:
-                self.v = self.v * (1. - self.w.sigmoid()) + x
+                self.v = self.v * (1. - k) + x
             else:
-                self.v = self.v - (self.v - self.v_reset) * self.w.sigmoid() + x
+                self.v = self.v - (self.v - self.v_reset) * k + x
+
+    @staticmethod
+    @torch.jit.script
+    def jit_eval_multi_step_forward_hard_reset_decay_input(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float,
+                                                           v_reset: float, k: torch.Tensor):
+        shape = x_seq.shape
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        decay = 1. - k
+        # v + (x - (v - v_reset)) * k = v * decay + x * k + v_reset * k, whose last term vanishes if v_reset = 0
+        bias = k * v_reset
+        # the mask is reused by all time-steps
+        mask = torch.empty(v.shape, dtype=torch.bool, device=v.device)
+        for t in range(x_seq.shape[0]):
+            v.mul_(decay).addcmul_(x_seq[t], k)
+            if v_reset != 0.:
+                v.add_(bias)
+            torch.ge(v, v_threshold, out=mask)
+            spike_seq[t] = mask
+            v.masked_fill_(mask, v_reset)
+        return spike_seq.view(shape), v_out
+
+    @staticmethod
+    @torch.jit.script
+    def jit_eval_multi_step_forward_hard_reset_decay_input_with_v_seq(x_seq: torch.Tensor, v: torch.Tensor,
+                                                                      v_threshold: float, v_reset: float,
+                                                                      k: torch.Tensor):
+        shape = x_seq.shape
+        v_seq = torch.empty(shape, dtype=x_seq.dtype, device=x_seq.device)
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        v_seq_flat = v_seq.view(x_seq.shape)
+        decay = 1. - k
+        # v + (x - (v - v_reset)) * k = v * decay + x * k + v_reset * k, whose last term vanishes if v_reset = 0
+        bias = k * v_reset
+        # the mask is reused by all time-steps
+        mask = torch.empty(v.shape, dtype=torch.bool, device=v.device)
+        for t in range(x_seq.shape[0]):
+            v.mul_(decay).addcmul_(x_seq[t], k)
+            if v_reset != 0.:
+                v.add_(bias)
+            torch.ge(v, v_threshold, out=mask)
+            spike_seq[t] = mask
+            v.masked_fill_(mask, v_reset)
+            v_seq_flat[t] = v
+        return spike_seq.view(shape), v_out, v_seq
+
+    @staticmethod
+    @torch.jit.script
+    def jit_eval_multi_step_forward_hard_reset_no_decay_input(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float,
+                                                              v_reset: float, k: torch.Tensor):
+        shape = x_seq.shape
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        decay = 1. - k
+        # v - (v - v_reset) * k + x = v * decay + x + v_reset * k, whose last term vanishes if v_reset = 0
+        bias = k * v_reset
+        # the mask is reused by all time-steps
+        mask = torch.empty(v.shape, dtype=torch.bool, device=v.device)
+        for t in range(x_seq.shape[0]):
+            v.mul_(decay).add_(x_seq[t])
+            if v_reset != 0.:
+                v.add_(bias)
+            torch.ge(v, v_threshold, out=mask)
+            spike_seq[t] = mask
+            v.masked_fill_(mask, v_reset)
+        return spike_seq.view(shape), v_out
+
+    @staticmethod
+    @torch.jit.script
+    def jit_eval_multi_step_forward_hard_reset_no_decay_input_with_v_seq(x_seq: torch.Tensor, v: torch.Tensor,
+                                                                         v_threshold: float, v_reset: float,
+                                                                         k: torch.Tensor):
+        shape = x_seq.shape
+        v_seq = torch.empty(shape, dtype=x_seq.dtype, device=x_seq.device)
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        v_seq_flat = v_seq.view(x_seq.shape)
+        decay = 1. - k
+        # v - (v - v_reset) * k + x = v * decay + x + v_reset * k, whose last term vanishes if v_reset = 0
+        bias = k * v_reset
+        # the mask is reused by all time-steps
+        mask = torch.empty(v.shape, dtype=torch.bool, device=v.device)
+        for t in range(x_seq.shape[0]):
+            v.mul_(decay).add_(x_seq[t])
+            if v_reset != 0.:
+                v.add_(bias)
+            torch.ge(v, v_threshold, out=mask)
+            spike_seq[t] = mask
+            v.masked_fill_(mask, v_reset)
+            v_seq_flat[t] = v
+        return spike_seq.view(shape), v_out, v_seq
+
+    @staticmethod
+    @torch.jit.script
+    def jit_eval_multi_step_forward_soft_reset_decay_input(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float,
+                                                           k: torch.Tensor):
+        shape = x_seq.shape
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        for t in range(x_seq.shape[0]):
+            v.addcmul_(x_seq[t] - v, k)
+            torch.ge(v, v_threshold, out=spike_seq[t])
+            v.sub_(spike_seq[t], alpha=v_threshold)
+        return spike_seq.view(shape), v_out
+
+    @staticmethod
+    @torch.jit.script
+    def jit_eval_multi_step_forward_soft_reset_decay_input_with_v_seq(x_seq: torch.Tensor, v: torch.Tensor,
+                                                                      v_threshold: float, k: torch.Tensor):
+        shape = x_seq.shape
+        v_seq = torch.empty(shape, dtype=x_seq.dtype, device=x_seq.device)
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        v_seq_flat = v_seq.view(x_seq.shape)
+        for t in range(x_seq.shape[0]):
+            v.addcmul_(x_seq[t] - v, k)
+            torch.ge(v, v_threshold, out=spike_seq[t])
+            v.sub_(spike_seq[t], alpha=v_threshold)
+            v_seq_flat[t] = v
+        return spike_seq.view(shape), v_out, v_seq
+
+    @staticmethod
+    @torch.jit.script
+    def jit_eval_multi_step_forward_soft_reset_no_decay_input(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float,
+                                                              k: torch.Tensor):
+        shape = x_seq.shape
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        decay = 1. - k
+        for t in range(x_seq.shape[0]):
+            v.mul_(decay).add_(x_seq[t])
+            torch.ge(v, v_threshold, out=spike_seq[t])
+            v.sub_(spike_seq[t], alpha=v_threshold)
+        return spike_seq.view(shape), v_out
+
+    @staticmethod
+    @torch.jit.script
+    def jit_eval_multi_step_forward_soft_reset_no_decay_input_with_v_seq(x_seq: torch.Tensor, v: torch.Tensor,
+                                                                         v_threshold: float, k: torch.Tensor):
+        shape = x_seq.shape
+        v_seq = torch.empty(shape, dtype=x_seq.dtype, device=x_seq.device)
+        x_seq = x_seq.reshape(shape[0], -1)
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        v_out = v.clone(memory_format=torch.contiguous_format)
+        v = v_out.view(-1)
+        v_seq_flat = v_seq.view(x_seq.shape)
+        decay = 1. - k
+        for t in range(x_seq.shape[0]):
+            v.mul_(decay).add_(x_seq[t])
+            torch.ge(v, v_threshold, out=spike_seq[t])
+            v.sub_(spike_seq[t], alpha=v_threshold)
+            v_seq_flat[t] = v
+        return spike_seq.view(shape), v_out, v_seq
+
+    _jit_eval_multi_step_forward_fns = LIFNode._jit_eval_multi_step_forward_fns
+
+    def jit_eval_multi_step_forward(self, x_seq: torch.Tensor, v: torch.Tensor, k: torch.Tensor):
+        # return (spike_seq, v, v_seq), where v_seq is None if not self.store_v_seq
+        v_reset = self.v_reset
+        store_v_seq = self.store_v_seq
+        fn = getattr(self, self._jit_eval_multi_step_forward_fns[(v_reset is not None, self.decay_input, store_v_seq)])
+        if v_reset is None:
+            out = fn(x_seq, v, self.v_threshold, k)
+        else:
+            out = fn(x_seq, v, self.v_threshold, v_reset, k)
+        return out if store_v_seq else out + (None,)
 
     def multi_step_forward(self, x_seq: torch.Tensor):
         if self.backend == 'torch':
-            return super().multi_step_forward(x_seq)
+            if not self.training and not (torch.is_grad_enabled() and (x_seq.requires_grad or self.w.requires_grad)):
+                # inference without autograd: the surrogate gradients are not needed
+                self.v_float_to_tensor(x_seq[0])
+                spike_seq, self.v, v_seq = self.jit_eval_multi_step_forward(x_seq, self.v, self.w.sigmoid().to(x_seq))
+                if self.store_v_seq:
+                    self.v_seq = v_seq
+                return spike_seq
+
+            # compute ``self.w.sigmoid()`` once, rather than at every time-step
+            self._k = self.w.sigmoid()
+            try:
+                return super().multi_step_forward(x_seq)
+            finally:
+                self._k = None
         elif self.backend == 'cupy':
             hard_reset = self.v_reset is not None
             if x_seq.dtype == torch.float:
@@ -1319,20 +1996,16 @@ class ParametricLIFNode(BaseNode):
             else:
                 raise NotImplementedError(x_seq.dtype)
 
-            if self.forward_kernel is None or not self.forward_kernel.check_attributes(hard_reset=hard_reset,
-                                                                                       dtype=dtype,
-                                                                                       decay_input=self.decay_input):
+            kernel_sig = ('m', hard_reset, self.detach_reset, dtype, self.decay_input, self.surrogate_function)
+            if self.forward_kernel is None or self.backward_kernel is None or self._kernel_sig != kernel_sig:
                 self.forward_kernel = ac_neuron_kernel.ParametricLIFNodeFPTTKernel(decay_input=self.decay_input,
                                                                                    hard_reset=hard_reset, dtype=dtype)
-
-            if self.backward_kernel is None or not self.backward_kernel.check_attributes(
-                    surrogate_function=self.surrogate_function.cuda_codes, hard_reset=hard_reset,
-                    detach_reset=self.detach_reset, dtype=dtype, decay_input=self.decay_input):
                 self.backward_kernel = ac_neuron_kernel.ParametricLIFNodeBPTTKernel(decay_input=self.decay_input,
                                                                                     surrogate_function=self.surrogate_function.cuda_codes,
                                                                                     hard_reset=hard_reset,
                                                                                     detach_reset=self.detach_reset,
                                                                                     dtype=dtype)
+                self._kernel_sig = kernel_sig
 
             self.v_float_to_tensor(x_seq[0])
 
@@ -1468,8 +2141,13 @@ class QIFNode(BaseNode):
     def extra_repr(self):
         return super().extra_repr() + f', tau={self.tau}, v_c={self.v_c}, a0={self.a0}, v_rest={self.v_rest}'
 
+    @staticmethod
+    @torch.jit.script
+    def jit_neuronal_charge(x: torch.Tensor, v: torch.Tensor, tau: float, v_rest: float, v_c: float, a0: float):
+        return v + (x + a0 * (v - v_rest) * (v - v_c)) / tau
+
     def neuronal_charge(self, x: torch.Tensor):
-        self.v = self.v + (x + self.a0 * (self.v - self.v_rest) * (self.v - self.v_c)) / self.tau
+        self.v = self.jit_neuronal_charge(x, self.v, self.tau, float(self.v_rest), float(self.v_c), float(self.a0))
 
     @property
     def supported_backends(self):
@@ -1615,13 +2293,18 @@ class EIFNode(BaseNode):
     def extra_repr(self):
         return super().extra_repr() + f', tau={self.tau}, delta_T={self.delta_T}, theta_rh={self.theta_rh}'
 
-    def neuronal_charge(self, x: torch.Tensor):
-        with torch.no_grad():
-            if not isinstance(self.v, torch.Tensor):
-                self.v = torch.as_tensor(self.v, device=x.device)
+    @staticmethod
+    @torch.jit.script
+    def jit_neuronal_charge(x: torch.Tensor, v: torch.Tensor, tau: float, v_rest: float, theta_rh: float,
+                            delta_T: float):
+        # exp(z) = exp2(z * log2(e)), and exp2 maps to a cheaper hardware instruction than exp
+        z = (v - theta_rh) * (1.4426950408889634 / delta_T)
+        return v + (x + v_rest - v + delta_T * torch.exp2(z)) / tau
 
-        self.v = self.v + (x + self.v_rest - self.v + self.delta_T * torch.exp(
-            (self.v - self.theta_rh) / self.delta_T)) / self.tau
+    def neuronal_charge(self, x: torch.Tensor):
+        self.v_float_to_tensor(x)
+        self.v = self.jit_neuronal_charge(x, self.v, self.tau, float(self.v_rest), float(self.theta_rh),
+                                          float(self.delta_T))
 
     @property
     def supported_backends(self):
@@ -1673,8 +2356,15 @@ class IzhikevichNode(AdaptBaseNode):
     def extra_repr(self):
         return super().extra_repr() + f', tau={self.tau}, v_c={self.v_c}, a0={self.a0}'
 
+    @staticmethod
+    @torch.jit.script
+    def jit_neuronal_charge(x: torch.Tensor, v: torch.Tensor, w: torch.Tensor, tau: float, v_rest: float, v_c: float,
+                            a0: float):
+        return v + (x + a0 * (v - v_rest) * (v - v_c) - w) / tau
+
     def neuronal_charge(self, x: torch.Tensor):
-        self.v = self.v + (x + self.a0 * (self.v - self.v_rest) * (self.v - self.v_c) - self.w) / self.tau
+        self.v = self.jit_neuronal_charge(x, self.v, self.w, self.tau, float(self.v_rest), float(self.v_c),
+                                          float(self.a0))
 
     @property
     def supported_backends(self):
@@ -1758,13 +2448,13 @@ class LIAFNode(LIFNode):
         self.threshold_related = threshold_related
 
         assert self.backend == 'torch', "LIAFNode only supports for backend='torch'!"
-        assert self.single_step_cupy_fp32_inference == False, "LIAFNode does not support for single_step_cupy_fp32_inference!"
 
     @property
     def supported_backends(self):
         return ('torch',)
 
     def single_step_forward(self, x: torch.Tensor):
+        self.v_float_to_tensor(x)
         self.neuronal_charge(x)
         if self.threshold_related:
             y = self.act(self.v - self.v_threshold)
@@ -1774,6 +2464,10 @@ class LIAFNode(LIFNode):
         self.neuronal_reset(spike)
         return y
 
+    def multi_step_forward(self, x_seq: torch.Tensor):
+        # the fused inference paths of LIFNode output spikes rather than self.act(...)
+        return BaseNode.multi_step_forward(self, x_seq)
+
 
 class KLIFNode(BaseNode):
     def __init__(self, scale_reset: bool = False, tau: float = 2., decay_input: bool = True, v_threshold: float = 1.,
@@ -1936,9 +2630,6 @@ class KLIFNode(BaseNode):
 
         """
         assert isinstance(tau, float) and tau > 1.
-        if backend == 'cupy':
-            raise NotImplementedError("The CuPy backend for the KLIF neuron has not been implemented!")
-
         super().__init__(v_threshold, v_reset, surrogate_function, detach_reset, step_mode, backend, store_v_seq)
 
         self.scale_reset = scale_reset
@@ -1950,14 +2641,20 @@ class KLIFNode(BaseNode):
     @staticmethod
     @torch.jit.script
     def neuronal_charge_decay_input(x: torch.Tensor, v: torch.Tensor, v_reset: float, tau: float, k: torch.Tensor):
-        v = v + (x - (v - v_reset)) / tau
+        # v + (x - (v - v_reset)) / tau = lerp(v, x + v_reset, 1 / tau)
+        if v_reset != 0.:
+            x = x + v_reset
+        v = torch.lerp(v, x, 1. / tau)
         v = torch.relu_(k * v)
         return v
 
     @staticmethod
     @torch.jit.script
     def neuronal_charge_no_decay_input(x: torch.Tensor, v: torch.Tensor, v_reset: float, tau: float, k: torch.Tensor):
-        v = v - (v - v_reset) / tau + x
+        # v - (v - v_reset) / tau + x = x + (1 - 1 / tau) * v + v_reset / tau
+        v = torch.add(x, v, alpha=1. - 1. / tau)
+        if v_reset != 0.:
+            v = v + v_reset / tau
         v = torch.relu_(k * v)
         return v
 
@@ -1973,10 +2670,7 @@ class KLIFNode(BaseNode):
             self.v = self.neuronal_charge_no_decay_input(x, self.v, v_reset, self.tau, self.k)
 
     def neuronal_reset(self, spike):
-        if self.detach_reset:
-            spike_d = spike.detach()
-        else:
-            spike_d = spike
+        spike_d = self._detach_fn(spike)
 
         if self.scale_reset:
             if self.v_reset is None:
@@ -1997,6 +2691,37 @@ class KLIFNode(BaseNode):
                 # hard reset
                 self.v = self.jit_hard_reset(self.v, spike_d, self.v_reset)
 
+    @property
+    def supported_backends(self):
+        if self.step_mode == 's':
+            return ('torch',)
+        elif self.step_mode == 'm':
+            return ('torch', 'cupy')
+        else:
+            raise ValueError(self.step_mode)
+
+    def multi_step_forward(self, x_seq: torch.Tensor):
+        if self.backend == 'torch':
+            return super().multi_step_forward(x_seq)
+        elif self.backend == 'cupy':
+            self.v_float_to_tensor(x_seq[0])
+
+            spike_seq, v_seq = neuron_kernel.MultiStepKLIFNodePTT.apply(
+                x_seq.flatten(1), self.v.flatten(0), self.k, self.decay_input, self.tau, self.v_threshold,
+                self.v_reset, self.scale_reset, self.detach_reset, self.surrogate_function.cuda_code)
+
+            spike_seq = spike_seq.reshape(x_seq.shape)
+            v_seq = v_seq.reshape(x_seq.shape)
+
+            if self.store_v_seq:
+                self.v_seq = v_seq
+
+            self.v = v_seq[-1].clone()
+
+            return spike_seq
+        else:
+            raise ValueError(self.backend)
+
 
 class PSN(nn.Module, base.MultiStepModule):
     def __init__(self, T: int, surrogate_function: surrogate.SurrogateFunctionBase = surrogate.ATan()):
@@ -2049,6 +2774,19 @@ class MaskedPSN(base.MemoryModule):
         return (lambda_ * mask0 + (1. - lambda_) * mask1) * weight
 
     def masked_weight(self):
+        if torch.is_grad_enabled() and self.weight.requires_grad:
+            return self._masked_weight()
+
+        # the masked weight only changes when the weight, lambda_ or masks are modified in place (e.g., by the
+        # optimizer, the setter of lambda_ or load_state_dict) or replaced (e.g., by to()), which can be detected by
+        # their versions and data pointers without synchronizing with the device
+        key = tuple((t.data_ptr(), t._version) for t in (self.weight, self._lambda_, self.mask0, self.mask1))
+        if key != self._masked_weight_key:
+            self._masked_weight_cache = self._masked_weight()
+            self._masked_weight_key = key
+        return self._masked_weight_cache
+
+    def _masked_weight(self):
         if self.lambda_ >= 1.:
             return self.weight * self.mask0
         else:
@@ -2118,10 +2856,14 @@ class MaskedPSN(base.MemoryModule):
         nn.init.constant_(self.bias, -1.)
 
         mask1 = torch.ones([T, T])
-        mask0 = torch.tril(mask1) * torch.triu(mask1, -(self.k - 1))
+        # mask0[i][j] = 1 if 0 <= i - j < k else 0
+        t = torch.arange(T)
+        offset = t.unsqueeze(1) - t
+        mask0 = ((offset >= 0) & (offset < self.k)).to(mask1)
         self.register_buffer('mask0', mask0)
         self.register_buffer('mask1', mask1)
-
+        self._masked_weight_cache = None
+        self._masked_weight_key = None
 
     def single_step_forward(self, x: torch.Tensor):
         if self.lambda_ < 1.:
@@ -2138,13 +2880,8 @@ class MaskedPSN(base.MemoryModule):
         weight = self.masked_weight()[self.time_step, self.time_step + 1 - self.queue.__len__(): self.time_step + 1]
         x_seq = torch.stack(self.queue)
 
-
-
-        for i in range(x.dim()):
-            weight = weight.unsqueeze(-1)
-
-
-        h = torch.sum(weight * x_seq, 0)
+        # weight.shape = [n], x_seq.shape = [n, N], where n <= k
+        h = torch.mv(x_seq.t(), weight)
         spike = self.surrogate_function(h + self.bias[self.time_step])
 
         self.time_step += 1
@@ -2176,14 +2913,17 @@ class SlidingPSN(base.MemoryModule):
         return 'gemm', 'conv'
 
     def gen_gemm_weight(self, T: int):
-        weight = torch.zeros([T, T], device=self.weight.device)
-        for i in range(T):
-            end = i + 1
-            start = max(0, i + 1 - self.k)
-            length = min(end - start, self.k)
-            weight[i][start: end] = self.weight[self.k - length: self.k]
-
-        return weight
+        # weight[i][j] = self.weight[k - 1 - (i - j)] if 0 <= i - j < k else 0
+        # the gather index only depends on T, and is cached to avoid rebuilding it in every forward
+        index = self._gemm_weight_index
+        if index is None or index.shape[0] != T or index.device != self.weight.device:
+            t = torch.arange(T, device=self.weight.device)
+            offset = t.unsqueeze(1) - t
+            # index 0 points to the zero padded before self.weight
+            index = torch.where((offset >= 0) & (offset < self.k), self.k - offset, 0)
+            self._gemm_weight_index = index
+
+        return F.pad(self.weight, (1, 0))[index]
 
     def __init__(self, k: int, exp_init: bool = True,
                  surrogate_function: surrogate.SurrogateFunctionBase = surrogate.ATan(), step_mode: str = 's',
@@ -2221,15 +2961,15 @@ class SlidingPSN(base.MemoryModule):
 
         super().__init__()
         self.register_memory('queue', [])
+        self._gemm_weight_index = None
         self.step_mode = step_mode
         self.k = k
         self.surrogate_function = surrogate_function
         self.backend = backend
 
         if exp_init:
-            weight = torch.ones([k])
-            for i in range(k - 2, -1, -1):
-                weight[i] = weight[i + 1] / 2.
+            # weight = [..., 1/4, 1/2, 1]
+            weight = torch.pow(0.5, torch.arange(k - 1, -1, -1, dtype=torch.float))
         else:
             weight = torch.ones([1, k])
             nn.init.kaiming_uniform_(weight, a=math.sqrt(5))
@@ -2246,10 +2986,8 @@ class SlidingPSN(base.MemoryModule):
         weight = self.weight[self.k - self.queue.__len__(): self.k]
         x_seq = torch.stack(self.queue)
 
-        for i in range(x.dim()):
-            weight = weight.unsqueeze(-1)
-
-        h = torch.sum(weight * x_seq, 0)
+        # weight.shape = [n], x_seq.shape = [n, N], where n <= k
+        h = torch.mv(x_seq.t(), weight)
         spike = self.surrogate_function(h + self.bias)
 
         return spike.view(x.shape)
@@ -2267,11 +3005,14 @@ class SlidingPSN(base.MemoryModule):
             # [T, N, *] -> [T, N] -> [N, T] -> [N, 1, T]
             x_seq = x_seq.flatten(1).t().unsqueeze(1)
 
-            x_seq = F.pad(x_seq, pad=(self.k - 1, 0))
-            x_seq = F.conv1d(x_seq, self.weight.view(1, 1, -1), stride=1)
+            # the causal padding is done by the conv, rather than by F.pad. The conv pads both sides, and the last k - 1
+            # outputs, which see the future inputs, are dropped
+            # the bias is added in the conv, rather than by another pass over the output
+            x_seq = F.conv1d(x_seq, self.weight.view(1, 1, -1), bias=self.bias.view(1), stride=1, padding=self.k - 1)
+            x_seq = x_seq[..., :x_seq_shape[0]]
 
             x_seq = x_seq.squeeze(1).t().view(x_seq_shape)
-            return self.surrogate_function(x_seq + self.bias)
+            return self.surrogate_function(x_seq)
 
         else:
             raise NotImplementedError(self.backend)
@@ -2416,20 +3157,50 @@ class GatedLIFNode(base.MemoryModule):
                  + input
 
     def neuronal_reset(self, spike, alpha: torch.Tensor, gamma: torch.Tensor):
-        self.u = self.u - (1 - alpha * (1 - self.tau.view(1, -1, 1, 1).sigmoid())) * self.v * gamma * spike \
-                 - (1 - gamma) * self.v_subreset.view(1, -1, 1, 1).sigmoid() * spike
+        # u = u - (decay * v * gamma + (1 - gamma) * v_subreset) * spike, where the spike is multiplied only once
+        scale = torch.addcmul((1 - gamma) * self.v_subreset.view(1, -1, 1, 1).sigmoid(),
+                              (1 - alpha * (1 - self.tau.view(1, -1, 1, 1).sigmoid())) * self.v, gamma)
+        self.u = torch.addcmul(self.u, scale, spike, value=-1.)
 
-    def neuronal_fire(self):
-        return self.surrogate_function(self.u - self.v_threshold.view(1, -1, 1, 1).sigmoid())
+    def neuronal_fire(self, v_threshold: torch.Tensor = None):
+        # v_threshold is the sigmoid of self.v_threshold, which can be computed outside the loop over time-steps
+        if v_threshold is None:
+            v_threshold = self.v_threshold.view(1, -1, 1, 1).sigmoid()
+        return self.surrogate_function(self.u - v_threshold)
+
+    @staticmethod
+    @torch.jit.script
+    def jit_neuronal_charge_and_reset(x: torch.Tensor, v: torch.Tensor, spike: torch.Tensor, decay: torch.Tensor,
+                                      linear_decay: torch.Tensor, input_scale: torch.Tensor, gamma: torch.Tensor,
+                                      subreset: torch.Tensor):
+        # the fused version of neuronal_charge and neuronal_reset with the loop-invariant gates precomputed
+        # the multiply-adds are merged by addcmul: u = decay * v - linear_decay + x * input_scale,
+        # v_next = u - (decay * v * gamma + subreset) * spike
+        decay_v = decay * v
+        u = torch.addcmul(decay_v - linear_decay, x, input_scale)
+        return torch.addcmul(u, torch.addcmul(subreset, decay_v, gamma), spike, value=-1.)
 
     def multi_step_forward(self, x_seq: torch.Tensor):
         alpha, beta, gamma = self.alpha.view(1, -1, 1, 1).sigmoid(), self.beta.view(1, -1, 1, 1).sigmoid(), self.gamma.view(1, -1, 1, 1).sigmoid()
+        # the gates do not change over time-steps, and are computed only once
+        decay = 1 - alpha * (1 - self.tau.view(1, -1, 1, 1).sigmoid())
+        linear_decay = (1 - alpha) * self.linear_decay.view(1, -1, 1, 1).sigmoid()
+        subreset = (1 - gamma) * self.v_subreset.view(1, -1, 1, 1).sigmoid()
+        v_threshold = self.v_threshold.view(1, -1, 1, 1).sigmoid()
+        # conduct.shape = [T] or [T, C] -> input_scale.shape = [T, 1, C or 1, 1, 1]
+        input_scale = 1 - beta * (1 - self.conduct.view(self.T, 1, -1, 1, 1).sigmoid())
+        # the parameters are kept in their own dtype, while the gates are cast to the dtype of x_seq. Thus, the states
+        # are not promoted to float32 when x_seq is half or bfloat16
+        decay, linear_decay, input_scale, gamma, subreset, v_threshold = (
+            g.to(x_seq.dtype) for g in (decay, linear_decay, input_scale, gamma, subreset, v_threshold))
         y_seq = []
-        spike = torch.zeros(x_seq.shape[1:], device=x_seq.device)
+        spike = torch.zeros_like(x_seq[0])
+        if not isinstance(self.v, torch.Tensor):
+            self.v = torch.full_like(x_seq[0], self.v)
         for t in range(self.T):
-            self.neuronal_charge(x_seq[t], alpha, beta, t)
-            self.neuronal_reset(spike, alpha, gamma)
-            spike = self.neuronal_fire()
+            self.u = self.jit_neuronal_charge_and_reset(x_seq[t], self.v, spike, decay, linear_decay, input_scale[t],
+                                                        gamma, subreset)
+            spike = self.neuronal_fire(v_threshold)
             self.v = self.u
             y_seq.append(spike)
         return torch.stack(y_seq)
@@ -2554,19 +3325,33 @@ class DSRIFNode(base.MemoryModule):
 
 
     class DSRIFFunction(torch.autograd.Function):
+        @staticmethod
+        @torch.jit.script
+        def jit_forward(inp: torch.Tensor, v_threshold: torch.Tensor, alpha: float):
+            # the reset of each time-step depends on the spike of the last time-step, and the loop can not be replaced
+            # by a cumsum. Thus, the whole loop is scripted to avoid the python overhead in each time-step
+            v_threshold_alpha = alpha * v_threshold
+            mem_potential = torch.zeros_like(inp[0])
+            # the spikes are written into the preallocated output, rather than being stacked after the loop
+            output = torch.empty(inp.shape, dtype=torch.float, device=inp.device)
+
+            for t in range(inp.shape[0]):
+                mem_potential = mem_potential + inp[t]
+                spike = (mem_potential >= v_threshold_alpha).float() * v_threshold
+                mem_potential = mem_potential - spike
+                output[t] = spike
+            return output
+
         @staticmethod
         def forward(ctx, inp, T=10, v_threshold=1.0, alpha=0.5, v_threshold_grad_scaling=1.0):
             ctx.save_for_backward(inp)
 
-            mem_potential = torch.zeros_like(inp[0]).to(inp.device)
-            spikes = []
-
-            for t in range(inp.size(0)):
-                mem_potential = mem_potential + inp[t]
-                spike = ((mem_potential >= alpha * v_threshold).float() * v_threshold).float()
-                mem_potential = mem_potential - spike
-                spikes.append(spike)
-            output = torch.stack(spikes)
+            v_threshold_tensor = torch.as_tensor(v_threshold, device=inp.device)
+            if triton_dsr_kernel is not None and inp.is_cuda:
+                # charge, fire and reset of all T time-steps are fused into one kernel
+                output = triton_dsr_kernel.dsrif_multi_step_forward(inp, v_threshold_tensor, float(alpha))
+            else:
+                output = DSRIFNode.DSRIFFunction.jit_forward(inp, v_threshold_tensor, float(alpha))
 
             ctx.T = T
             ctx.v_threshold = v_threshold
@@ -2584,12 +3369,14 @@ class DSRIFNode(base.MemoryModule):
                 input_rate_coding = torch.mean(inp, 0)
                 grad_output_coding = torch.mean(grad_output, 0) * T
 
-                input_grad = grad_output_coding.clone()
-                input_grad[(input_rate_coding < 0) | (input_rate_coding > v_threshold)] = 0
-                input_grad = torch.stack([input_grad for _ in range(T)]) / T
+                # torch.where is used rather than zeroing the gradients by boolean indexing, which needs a scatter
+                input_grad = torch.where((input_rate_coding < 0) | (input_rate_coding > v_threshold), 0.,
+                                         grad_output_coding / T)
+                # the same gradient is shared by all time-steps. It is materialized, as a zero-stride view can not be
+                # updated in place by the consumers of the gradient, e.g., grad hooks or in-place accumulation
+                input_grad = input_grad.unsqueeze(0).expand(T, *input_grad.shape).contiguous()
 
-                v_threshold_grad = grad_output_coding.clone()
-                v_threshold_grad[input_rate_coding <= v_threshold] = 0
+                v_threshold_grad = torch.where(input_rate_coding <= v_threshold, 0., grad_output_coding)
                 v_threshold_grad = torch.sum(v_threshold_grad) * v_threshold_grad_scaling
                 if v_threshold_grad.is_cuda and torch.cuda.device_count() != 1:
                     try:
@@ -2734,27 +3521,37 @@ class DSRLIFNode(base.MemoryModule):
     @classmethod
     def weight_rate_spikes(cls, data, tau, delta_t):
         T = data.shape[0]
-        chw = data.size()[2:]
-        data_reshape = data.permute(list(range(1, len(chw) + 2)) + [0])
-        weight = torch.tensor([math.exp(-1 / tau * (delta_t * T - ii * delta_t)) for ii in range(1, T + 1)]).to(
-            data_reshape.device)
-        return (weight * data_reshape).sum(dim=len(chw) + 1) / weight.sum()
+        # weight[ii - 1] = exp(-1 / tau * (delta_t * T - ii * delta_t)) for ii in [1, T], which is built on the device
+        weight = torch.exp(torch.arange(T - 1, -1, -1, dtype=torch.float64, device=data.device) * (-delta_t / tau))
+        weight = weight.to(data.dtype)
+        # the weighted sum over T is done by one contraction, without permuting data or materializing weight * data
+        return torch.tensordot(data, weight, dims=([0], [0])) / weight.sum()
 
     class DSRLIFFunction(torch.autograd.Function):
+        @staticmethod
+        @torch.jit.script
+        def jit_forward(inp: torch.Tensor, v_threshold: torch.Tensor, beta: float, delta_t: float, alpha: float):
+            # the reset of each time-step depends on the spike of the last time-step, and the loop can not be replaced
+            # by a convolution along T. Thus, the whole loop is scripted to avoid the python overhead in each time-step
+            v_threshold_alpha = alpha * v_threshold
+            mem_potential = torch.zeros_like(inp[0])
+            # the spikes are written into the preallocated output, rather than being stacked after the loop
+            output = torch.empty(inp.shape, dtype=torch.float, device=inp.device)
+
+            for t in range(inp.shape[0]):
+                mem_potential = beta * mem_potential + (1. - beta) * inp[t]
+                spike = (mem_potential >= v_threshold_alpha).float() * v_threshold
+                mem_potential = mem_potential - spike
+                output[t] = spike / delta_t
+            return output
+
         @staticmethod
         def forward(ctx, inp, T, v_threshold, tau, delta_t=0.05, alpha=0.3, v_threshold_grad_scaling=1.0):
             ctx.save_for_backward(inp)
 
-            mem_potential = torch.zeros_like(inp[0]).to(inp.device)
             beta = math.exp(-delta_t / tau)
-
-            spikes = []
-            for t in range(inp.size(0)):
-                mem_potential = beta * mem_potential + (1 - beta) * inp[t]
-                spike = ((mem_potential >= alpha * v_threshold).float() * v_threshold).float()
-                mem_potential = mem_potential - spike
-                spikes.append(spike / delta_t)
-            output = torch.stack(spikes)
+            output = DSRLIFNode.DSRLIFFunction.jit_forward(inp, torch.as_tensor(v_threshold, device=inp.device), beta,
+                                                           float(delta_t), float(alpha))
 
             ctx.T = T
             ctx.v_threshold = v_threshold
@@ -2775,13 +3572,15 @@ class DSRLIFNode(base.MemoryModule):
             input_rate_coding = DSRLIFNode.weight_rate_spikes(inp, tau, delta_t)
             grad_output_coding = DSRLIFNode.weight_rate_spikes(grad_output, tau, delta_t) * T
 
-            indexes = (input_rate_coding > 0) & (input_rate_coding < v_threshold / delta_t * tau)
-            input_grad = torch.zeros_like(grad_output_coding)
-            input_grad[indexes] = grad_output_coding[indexes].clone() / tau
-            input_grad = torch.stack([input_grad for _ in range(T)]) / T
+            # torch.where is used rather than zeroing the gradients by boolean indexing, which needs a scatter
+            rate_threshold = v_threshold / delta_t * tau
+            indexes = (input_rate_coding > 0) & (input_rate_coding < rate_threshold)
+            input_grad = torch.where(indexes, grad_output_coding / tau / T, 0.)
+            # the same gradient is shared by all time-steps. It is materialized, as a zero-stride view can not be
+            # updated in place by the consumers of the gradient, e.g., grad hooks or in-place accumulation
+            input_grad = input_grad.unsqueeze(0).expand(T, *input_grad.shape).contiguous()
 
-            v_threshold_grad = grad_output_coding.clone()
-            v_threshold_grad[input_rate_coding <= v_threshold / delta_t * tau] = 0
+            v_threshold_grad = torch.where(input_rate_coding <= rate_threshold, 0., grad_output_coding)
             v_threshold_grad = torch.sum(v_threshold_grad) * delta_t * v_threshold_grad_scaling
             if v_threshold_grad.is_cuda and torch.cuda.device_count() != 1:
                 try:
@@ -2926,7 +3725,8 @@ class OTTTLIFNode(LIFNode):
     @torch.jit.script
     def track_trace(spike: torch.Tensor, trace: torch.Tensor, tau: float):
         with torch.no_grad():
-            trace = trace * (1. - 1. / tau) + spike
+            # trace = trace * (1. - 1. / tau) + spike, where the decay is a scalar and is applied by the same kernel
+            trace = torch.add(spike, trace, alpha=1. - 1. / tau)
         return trace
 
 
@@ -3156,9 +3956,16 @@ class CLIFNode(BaseNode):
         self.c_decay = c_decay
         self.v_decay = v_decay
 
+    @staticmethod
+    @torch.jit.script
+    def jit_neuronal_charge(x: torch.Tensor, c: torch.Tensor, v: torch.Tensor, c_decay: float, v_decay: float):
+        # c = c * c_decay + x, v = v * v_decay + c
+        c = torch.add(x, c, alpha=c_decay)
+        v = torch.add(c, v, alpha=v_decay)
+        return c, v
+
     def neuronal_charge(self, x: torch.Tensor):
-        self.c = self.c * self.c_decay + x
-        self.v = self.v * self.v_decay + self.c
+        self.c, self.v = self.jit_neuronal_charge(x, self.c, self.v, float(self.c_decay), float(self.v_decay))
 
     def single_step_forward(self, x: torch.Tensor):
         self.v_float_to_tensor(x)
@@ -3168,16 +3975,6 @@ class CLIFNode(BaseNode):
         self.neuronal_reset(spike)
         return spike
 
-    def multi_step_forward(self, x_seq: torch.Tensor):
-        T = x_seq.shape[0]
-        spike_seq = []
-
-        for t in range(T):
-            spike = self.single_step_forward(x_seq[t])
-            spike_seq.append(spike)
-
-        return torch.stack(spike_seq)
-
     def c_float_to_tensor(self, c: torch.Tensor):
         if isinstance(self.c, float):
             c_init = self.c
@@ -3191,6 +3988,7 @@ class CLIFNode(BaseNode):
 """Generate colored noise."""
 
 from typing import Union, Iterable, Optional
+from functools import lru_cache
 from numpy import sqrt, newaxis, integer
 from numpy.fft import irfft, rfftfreq
 from numpy.random import default_rng, Generator, RandomState
@@ -3274,30 +4072,16 @@ def powerlaw_psd_gaussian(
     # The number of samples in each time series
     samples = size[-1]
     
-    # Calculate Frequencies (we asume a sample rate of one)
-    # Use fft functions for real output (-> hermitian spectrum)
-    f = rfftfreq(samples) # type: ignore # mypy 1.5.1 has problems here 
-    
-    # Validate / normalise fmin
-    if 0 <= fmin <= 0.5:
-        fmin = max(fmin, 1./samples) # Low frequency cutoff
-    else:
+    # Validate fmin
+    if not 0 <= fmin <= 0.5:
         raise ValueError("fmin must be chosen between 0 and 0.5.")
     
-    # Build scaling factors for all frequencies
-    s_scale = f    
-    ix   = npsum(s_scale < fmin)   # Index of the cutoff
-    if ix and ix < len(s_scale):
-        s_scale[:ix] = s_scale[ix]
-    s_scale = s_scale**(-exponent/2.)
-    
-    # Calculate theoretical output standard deviation from scaling
-    w      = s_scale[1:].copy()
-    w[-1] *= (1 + (samples % 2)) / 2. # correct f = +-0.5
-    sigma = 2 * sqrt(npsum(w**2)) / samples
+    # The scaling factors and sigma only depend on (samples, exponent, fmin),
+    # and are cached between calls
+    s_scale, sigma = _powerlaw_psd_scale(samples, exponent, fmin)
     
     # Adjust size to generate one Fourier component per frequency
-    size[-1] = len(f)
+    size[-1] = len(s_scale)
 
     # Add empty dimension(s) to broadcast s_scale along last
     # dimension of generated random power + phase (below)
@@ -3330,6 +4114,32 @@ def powerlaw_psd_gaussian(
     return y
 
 
+@lru_cache(maxsize=32)
+def _powerlaw_psd_scale(samples: int, exponent: float, fmin: float):
+    # Calculate Frequencies (we asume a sample rate of one)
+    # Use fft functions for real output (-> hermitian spectrum)
+    f = rfftfreq(samples) # type: ignore # mypy 1.5.1 has problems here 
+    
+    # Normalise fmin
+    fmin = max(fmin, 1./samples) # Low frequency cutoff
+    
+    # Build scaling factors for all frequencies
+    s_scale = f    
+    ix   = npsum(s_scale < fmin)   # Index of the cutoff
+    if ix and ix < len(s_scale):
+        s_scale[:ix] = s_scale[ix]
+    s_scale = s_scale**(-exponent/2.)
+    
+    # Calculate theoretical output standard deviation from scaling
+    w      = s_scale[1:].copy()
+    w[-1] *= (1 + (samples % 2)) / 2. # correct f = +-0.5
+    sigma = 2 * sqrt(npsum(w**2)) / samples
+    
+    # the cached array is shared by all calls, and must not be modified
+    s_scale.setflags(write=False)
+    return s_scale, sigma
+
+
 def _get_normal_distribution(random_state: Optional[Union[int, Generator, RandomState]]):
     normal_dist = None
     if isinstance(random_state, (integer, int)) or random_state is None:
@@ -3347,7 +4157,7 @@ def _get_normal_distribution(random_state: Optional[Union[int, Generator, Random
 class NoisyBaseNode(nn.Module, base.MultiStepModule):
     def __init__(self, num_node, is_training: bool = True, T: int = 5, sigma_init: float = 0.5, 
                  beta: float = 0.0, v_threshold: float = 0.5, v_reset: float = 0., 
-                 surrogate_function: Callable = surrogate.Rect()):
+                 surrogate_function: Callable = surrogate.Rect(), noise_dtype: torch.dtype = torch.float32):
         assert isinstance(v_reset, float) or v_reset is None
         assert isinstance(v_threshold, float)
         super().__init__()
@@ -3356,6 +4166,9 @@ class NoisyBaseNode(nn.Module, base.MultiStepModule):
         self.is_training = is_training
         self.T = T
         self.beta = beta
+        # the dtype in which the exploration noises are stored, e.g., torch.float16 halves the memory and the bandwidth
+        # of the noise buffer
+        self.noise_dtype = noise_dtype
 
         self.sigma_v = sigma_init / math.sqrt(num_node)
         self.cn_v = None
@@ -3377,9 +4190,24 @@ class NoisyBaseNode(nn.Module, base.MultiStepModule):
 
     def neuronal_reset(self, spike):
         if self.v_reset is None:
-            self.v = self.v - spike * self.v_threshold
+            self.v = BaseNode.jit_soft_reset(self.v, spike, self.v_threshold)
         else:
-            self.v = (1. - spike) * self.v + spike * self.v_reset
+            if spike.requires_grad or not _is_binary_surrogate(self.surrogate_function):
+                # the gradient flows through spike, or spike is not binary
+                self.v = BaseNode.jit_hard_reset(self.v, spike, self.v_reset)
+            else:
+                self.v = BaseNode.jit_hard_reset_binary(self.v, spike, self.v_reset)
+
+    def neuronal_fire_and_reset(self):
+        if self.v.requires_grad or not _is_binary_surrogate(self.surrogate_function):
+            spike = self.neuronal_fire()
+            self.neuronal_reset(spike)
+        # the spike is binary and requires no grad, and firing and resetting are done by one scripted function
+        elif self.v_reset is None:
+            spike, self.v = BaseNode.jit_fire_soft_reset_binary(self.v, self.v_threshold)
+        else:
+            spike, self.v = BaseNode.jit_fire_hard_reset_binary(self.v, self.v_threshold, self.v_reset)
+        return spike
 
     def init_tensor(self, data: torch.Tensor):
         self.v = torch.full_like(data, fill_value=self.v_reset)
@@ -3387,45 +4215,48 @@ class NoisyBaseNode(nn.Module, base.MultiStepModule):
     def forward(self, x_seq: torch.Tensor):
         self.init_tensor(x_seq[0].data)
         
-        y = []
+        y = torch.empty((self.T,) + x_seq.shape[1:], dtype=x_seq.dtype, device=x_seq.device)
 
         if self.is_training:
             if self.cn_v is None or self.cn_s is None:
                 self.noise_step += 1
+            # the noises are moved to the device of x_seq only once after reset_noise, rather than in every time-step
+            if self.cn_v is None and self.eps_v_seq.device != x_seq.device:
+                self.eps_v_seq = self.eps_v_seq.to(x_seq.device)
+            if self.cn_s is None and self.eps_s_seq.device != x_seq.device:
+                self.eps_s_seq = self.eps_s_seq.to(x_seq.device)
 
-            for t in range(self.T):      
-                if self.cn_v is None:
-                    self.neuronal_charge(x_seq[t] + self.sigma_v * self.eps_v_seq[self.noise_step][t].to(x_seq.device))
-                else:
-                    self.neuronal_charge(x_seq[t] + self.sigma_v * self.cn_v[:, t])
-                spike = self.neuronal_fire()
-                self.neuronal_reset(spike)
-                if self.cn_s is None:
-                    spike = spike + self.sigma_s * self.eps_s_seq[self.noise_step][t].to(x_seq.device)
-                else:
-                    spike = spike + self.sigma_s * self.cn_s[:, t]
-                y.append(spike)
+            # the noises of the current forward are sliced once, and indexed only by t in the loop
+            noise_v = (self.eps_v_seq[self.noise_step] if self.cn_v is None else self.cn_v.transpose(0, 1)).to(x_seq.dtype)
+            noise_s = (self.eps_s_seq[self.noise_step] if self.cn_s is None else self.cn_s.transpose(0, 1)).to(x_seq.dtype)
+
+            for t in range(self.T):
+                self.neuronal_charge(torch.add(x_seq[t], noise_v[t], alpha=self.sigma_v))
+                spike = self.neuronal_fire_and_reset()
+                spike = torch.add(spike, noise_s[t], alpha=self.sigma_s)
+                y[t] = spike
             
         else:
             for t in range(self.T):
                 self.neuronal_charge(x_seq[t])
-                spike = self.neuronal_fire()
-                self.neuronal_reset(spike)
-                y.append(spike)
+                spike = self.neuronal_fire_and_reset()
+                y[t] = spike
 
-        return torch.stack(y)
+        return y
         
     def reset_noise(self, num_rl_step):
-        eps_shape = [self.num_node, num_rl_step * self.T]
-        per_order = [1, 2, 0]
-        # (nodes, steps * T) -> (nodes, steps, T) -> (steps, T, nodes)
-        self.eps_v_seq = torch.FloatTensor(powerlaw_psd_gaussian(self.beta, eps_shape).reshape(self.num_node, num_rl_step, self.T)).permute(per_order)
-        self.eps_s_seq = torch.FloatTensor(powerlaw_psd_gaussian(self.beta, eps_shape).reshape(self.num_node, num_rl_step, self.T)).permute(per_order)
+        # the noises of v and s are generated by one call, in which the FFTs of both are batched
+        eps_shape = [2, self.num_node, num_rl_step * self.T]
+        per_order = [2, 3, 0, 1]
+        # (2, nodes, steps * T) -> (2, nodes, steps, T) -> (steps, T, 2, nodes)
+        # the noises of v and s at the same step share one contiguous buffer, in which the nodes are the innermost dim
+        eps_seq = torch.FloatTensor(powerlaw_psd_gaussian(self.beta, eps_shape).reshape(2, self.num_node, num_rl_step, self.T))
+        self.eps_v_seq, self.eps_s_seq = eps_seq.permute(per_order).contiguous().to(self.noise_dtype).unbind(-2)
         self.noise_step = -1
 
     def get_colored_noise(self):
         cn = [self.eps_v_seq[self.noise_step], self.eps_s_seq[self.noise_step]]
-        return torch.cat(cn, dim=1)
+        return torch.cat(cn, dim=1).float()
 
     def load_colored_noise(self, cn):
         self.cn_v = cn[:, :, :self.num_node]
@@ -3439,19 +4270,19 @@ class NoisyBaseNode(nn.Module, base.MultiStepModule):
 class NoisyCLIFNode(NoisyBaseNode):
     def __init__(self, num_node, c_decay: float = 0.5, v_decay: float = 0.75, is_training: bool = True, 
                  T: int = 5, sigma_init: float = 0.5, beta: float = 0.0, v_threshold: float = 0.5, 
-                 v_reset: float = 0., surrogate_function: Callable = surrogate.Rect()):
+                 v_reset: float = 0., surrogate_function: Callable = surrogate.Rect(),
+                 noise_dtype: torch.dtype = torch.float32):
         super().__init__(num_node, is_training, T, sigma_init, beta, v_threshold, 
-                         v_reset, surrogate_function)
+                         v_reset, surrogate_function, noise_dtype)
 
         self.c_decay = c_decay
         self.v_decay = v_decay
 
     def neuronal_charge(self, x: torch.Tensor):
-        self.c = self.c * self.c_decay + x
-        self.v = self.v * self.v_decay + self.c
+        self.c, self.v = CLIFNode.jit_neuronal_charge(x, self.c, self.v, float(self.c_decay), float(self.v_decay))
 
     def init_tensor(self, data: torch.Tensor):
-        self.c = torch.full_like(data, fill_value=0.0)
+        self.c = torch.zeros_like(data)
         self.v = torch.full_like(data, fill_value=self.v_reset)
 
 
@@ -3461,8 +4292,46 @@ class NoisyCLIFNode(NoisyBaseNode):
 
 class ILCBaseNode(nn.Module, base.MultiStepModule):
     def __init__(self, act_dim, dec_pop_dim, v_threshold: float = 1.0, v_reset: float = 0., 
-                 surrogate_function: Callable = surrogate.Rect()):
+                 surrogate_function: Callable = surrogate.Rect(), sparse_ratio: float = 0.1):
+        """
+        * :ref:`API in English <ILCBaseNode.__init__-en>`
+
+        .. _ILCBaseNode.__init__-cn:
+
+        :param act_dim: 动作的维数，即组的数量
+        :type act_dim: int
+        :param dec_pop_dim: 每个动作的解码神经元群的大小
+        :type dec_pop_dim: int
+        :param v_threshold: 神经元的阈值电压
+        :type v_threshold: float
+        :param v_reset: 神经元的重置电压。为 ``None`` 时使用软重置
+        :type v_reset: float
+        :param surrogate_function: 反向传播时用来计算脉冲函数梯度的替代函数
+        :type surrogate_function: Callable
+        :param sparse_ratio: 在CPU上，若脉冲不需要梯度且发放脉冲的神经元比例低于 ``sparse_ratio`` ，则层间连接只由发放脉冲的
+            神经元计算。设置为 ``0.`` 时总是使用稠密计算
+        :type sparse_ratio: float
+
+        * :ref:`中文API <ILCBaseNode.__init__-cn>`
 
+        .. _ILCBaseNode.__init__-en:
+
+        :param act_dim: the dimension of actions, i.e., the number of groups
+        :type act_dim: int
+        :param dec_pop_dim: the size of the decoding population of each action
+        :type dec_pop_dim: int
+        :param v_threshold: threshold of the neurons
+        :type v_threshold: float
+        :param v_reset: reset voltage of the neurons. If ``None``, soft reset is used
+        :type v_reset: float
+        :param surrogate_function: the function for calculating surrogate gradients of the heaviside step function in
+            backward
+        :type surrogate_function: Callable
+        :param sparse_ratio: on CPU, if the spikes require no grad and the ratio of the fired neurons is lower than
+            ``sparse_ratio``, the inter-layer connection is computed from the fired neurons only. Set it to ``0.`` to
+            always use the dense computation
+        :type sparse_ratio: float
+        """
         assert isinstance(v_reset, float) or v_reset is None
         assert isinstance(v_threshold, float)
         super().__init__()
@@ -3478,6 +4347,8 @@ class ILCBaseNode(nn.Module, base.MultiStepModule):
 
         self.surrogate_function = surrogate_function
 
+        self.sparse_ratio = sparse_ratio
+
     @abstractmethod
     def neuronal_charge(self, x: torch.Tensor):
         raise NotImplementedError
@@ -3487,9 +4358,55 @@ class ILCBaseNode(nn.Module, base.MultiStepModule):
 
     def neuronal_reset(self, spike):
         if self.v_reset is None:
-            self.v = self.v - spike * self.v_threshold
+            self.v = BaseNode.jit_soft_reset(self.v, spike, self.v_threshold)
+        else:
+            if spike.requires_grad or not _is_binary_surrogate(self.surrogate_function):
+                # the gradient flows through spike, or spike is not binary
+                self.v = BaseNode.jit_hard_reset(self.v, spike, self.v_reset)
+            else:
+                self.v = BaseNode.jit_hard_reset_binary(self.v, spike, self.v_reset)
+
+    def neuronal_fire_and_reset(self):
+        if self.v.requires_grad or not _is_binary_surrogate(self.surrogate_function):
+            spike = self.neuronal_fire()
+            self.neuronal_reset(spike)
+        # the spike is binary and requires no grad, and firing and resetting are done by one scripted function
+        elif self.v_reset is None:
+            spike, self.v = BaseNode.jit_fire_soft_reset_binary(self.v, self.v_threshold)
         else:
-            self.v = (1. - spike) * self.v + spike * self.v_reset
+            spike, self.v = BaseNode.jit_fire_hard_reset_binary(self.v, self.v_threshold, self.v_reset)
+        return spike
+
+    def inter_layer_connection(self, spike: torch.Tensor):
+        # equal to self.conn(spike.view(-1, self.act_dim, self.dec_pop_dim)).view(-1, self.out_pop_dim)
+        # the grouped conv with an output length of 1 is computed as a batched matmul over the act_dim groups, which
+        # avoids the slow grouped conv kernels for the tiny groups
+        # weight.shape = [act_dim, dec_pop_dim (in), dec_pop_dim (out)], spike.shape = [act_dim, N, dec_pop_dim (in)]
+        weight = self.conn.weight.view(self.act_dim, self.dec_pop_dim, self.dec_pop_dim).transpose(1, 2)
+
+        if not spike.requires_grad and spike.device.type == 'cpu' and _is_binary_surrogate(self.surrogate_function):
+            # event-driven path: the spike is binary and no gradient flows through it, so only the weight rows of the
+            # fired neurons are accumulated when few neurons fire. It is limited to CPU, where checking the ratio does
+            # not synchronize with the device. The cheap sum is checked before the indices are materialized by nonzero
+            spike = spike.reshape(-1, self.out_pop_dim)
+            if spike.sum().item() < self.sparse_ratio * spike.numel():
+                n_idx, i_idx = spike.nonzero(as_tuple=True)
+                if self.conn.bias is None:
+                    y = torch.zeros(spike.shape[0] * self.act_dim, self.dec_pop_dim, dtype=weight.dtype,
+                                    device=weight.device)
+                else:
+                    y = self.conn.bias.view(1, self.act_dim, self.dec_pop_dim).repeat(spike.shape[0], 1, 1).flatten(0, 1)
+                # the i-th neuron of the n-th sample adds its weight row to the (n * act_dim + i // dec_pop_dim)-th row
+                y = y.index_add(0, n_idx * self.act_dim + torch.div(i_idx, self.dec_pop_dim, rounding_mode='floor'),
+                                weight.reshape(self.out_pop_dim, self.dec_pop_dim).index_select(0, i_idx))
+                return y.view(-1, self.out_pop_dim).to(spike.dtype)
+
+        spike = spike.view(-1, self.act_dim, self.dec_pop_dim).transpose(0, 1)
+        if self.conn.bias is None:
+            y = torch.bmm(spike, weight)
+        else:
+            y = torch.baddbmm(self.conn.bias.view(self.act_dim, 1, self.dec_pop_dim), spike, weight)
+        return y.transpose(0, 1).reshape(-1, self.out_pop_dim)
 
     def init_tensor(self, data: torch.Tensor):
         self.v = torch.full_like(data, fill_value=self.v_reset)
@@ -3498,44 +4415,45 @@ class ILCBaseNode(nn.Module, base.MultiStepModule):
         self.init_tensor(x_seq[0].data)
 
         T = x_seq.shape[0]
-        spike_seq = []
+        spike_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
 
+        # x is the input of the current time-step, including the inter-layer connection from the last time-step.
+        # x_seq itself is not modified
+        x = x_seq[0]
         for t in range(T):
-            self.neuronal_charge(x_seq[t])
-            spike = self.neuronal_fire()
-            self.neuronal_reset(spike)
-            spike_seq.append(spike)
+            self.neuronal_charge(x)
+            spike = self.neuronal_fire_and_reset()
+            spike_seq[t] = spike
             if t < T - 1:
-                x_seq[t + 1] = x_seq[t + 1] + self.conn(spike.view(-1, self.act_dim, self.dec_pop_dim)).view(-1, self.out_pop_dim)
+                x = x_seq[t + 1] + self.inter_layer_connection(spike)
 
-        return torch.stack(spike_seq)
+        return spike_seq
 
 
 class ILCCLIFNode(ILCBaseNode):
     def __init__(self, act_dim, dec_pop_dim, c_decay: float = 0.5, v_decay: float = 0.75,
                  v_threshold: float = 0.5, v_reset: float = 0., 
-                 surrogate_function: Callable = surrogate.Rect()):
+                 surrogate_function: Callable = surrogate.Rect(), sparse_ratio: float = 0.1):
 
-        super().__init__(act_dim, dec_pop_dim, v_threshold, v_reset, surrogate_function)
+        super().__init__(act_dim, dec_pop_dim, v_threshold, v_reset, surrogate_function, sparse_ratio)
 
         self.c_decay = c_decay
         self.v_decay = v_decay
 
     def neuronal_charge(self, x: torch.Tensor):
-        self.c = self.c * self.c_decay + x
-        self.v = self.v * self.v_decay + self.c
+        self.c, self.v = CLIFNode.jit_neuronal_charge(x, self.c, self.v, float(self.c_decay), float(self.v_decay))
 
     def init_tensor(self, data: torch.Tensor):
-        self.c = torch.full_like(data, fill_value=0.0)
+        self.c = torch.zeros_like(data)
         self.v = torch.full_like(data, fill_value=self.v_reset)
 
 
 class ILCLIFNode(ILCBaseNode):
     def __init__(self, act_dim, dec_pop_dim, v_decay: float = 0.75,
                  v_threshold: float = 1.0, v_reset: float = 0., 
-                 surrogate_function: Callable = surrogate.Rect()):
+                 surrogate_function: Callable = surrogate.Rect(), sparse_ratio: float = 0.1):
 
-        super().__init__(act_dim, dec_pop_dim, v_threshold, v_reset, surrogate_function)
+        super().__init__(act_dim, dec_pop_dim, v_threshold, v_reset, surrogate_function, sparse_ratio)
 
         self.v_decay = v_decay
 
@@ -3545,9 +4463,9 @@ class ILCLIFNode(ILCBaseNode):
 
 class ILCIFNode(ILCBaseNode):
     def __init__(self, act_dim, dec_pop_dim, v_threshold: float = 1.0, v_reset: float = 0., 
-                 surrogate_function: Callable = surrogate.Rect()):
+                 surrogate_function: Callable = surrogate.Rect(), sparse_ratio: float = 0.1):
 
-        super().__init__(act_dim, dec_pop_dim, v_threshold, v_reset, surrogate_function)
+        super().__init__(act_dim, dec_pop_dim, v_threshold, v_reset, surrogate_function, sparse_ratio)
 
     def neuronal_charge(self, x: torch.Tensor):
         self.v = self.v + x
@@ -3560,7 +4478,8 @@ class ILCIFNode(ILCBaseNode):
 class NoisyILCBaseNode(nn.Module, base.MultiStepModule):
     def __init__(self, act_dim, dec_pop_dim, is_training: bool = True, T: int = 5, 
                  sigma_init: float = 0.5, beta: float = 0.0, v_threshold: float = 1.0, 
-                 v_reset: float = 0., surrogate_function: Callable = surrogate.Rect()):
+                 v_reset: float = 0., surrogate_function: Callable = surrogate.Rect(),
+                 noise_dtype: torch.dtype = torch.float32):
 
         assert isinstance(v_reset, float) or v_reset is None
         assert isinstance(v_threshold, float)
@@ -3575,6 +4494,9 @@ class NoisyILCBaseNode(nn.Module, base.MultiStepModule):
         self.is_training = is_training
         self.T = T
         self.beta = beta
+        # the dtype in which the exploration noises are stored, e.g., torch.float16 halves the memory and the bandwidth
+        # of the noise buffer
+        self.noise_dtype = noise_dtype
 
         self.sigma_v = sigma_init / math.sqrt(self.num_node)
         self.cn_v = None
@@ -3596,9 +4518,37 @@ class NoisyILCBaseNode(nn.Module, base.MultiStepModule):
 
     def neuronal_reset(self, spike):
         if self.v_reset is None:
-            self.v = self.v - spike * self.v_threshold
+            self.v = BaseNode.jit_soft_reset(self.v, spike, self.v_threshold)
+        else:
+            if spike.requires_grad or not _is_binary_surrogate(self.surrogate_function):
+                # the gradient flows through spike, or spike is not binary
+                self.v = BaseNode.jit_hard_reset(self.v, spike, self.v_reset)
+            else:
+                self.v = BaseNode.jit_hard_reset_binary(self.v, spike, self.v_reset)
+
+    def neuronal_fire_and_reset(self):
+        if self.v.requires_grad or not _is_binary_surrogate(self.surrogate_function):
+            spike = self.neuronal_fire()
+            self.neuronal_reset(spike)
+        # the spike is binary and requires no grad, and firing and resetting are done by one scripted function
+        elif self.v_reset is None:
+            spike, self.v = BaseNode.jit_fire_soft_reset_binary(self.v, self.v_threshold)
         else:
-            self.v = (1. - spike) * self.v + spike * self.v_reset
+            spike, self.v = BaseNode.jit_fire_hard_reset_binary(self.v, self.v_threshold, self.v_reset)
+        return spike
+
+    def inter_layer_connection(self, spike: torch.Tensor):
+        # equal to self.conn(spike.view(-1, self.act_dim, self.dec_pop_dim)).view(-1, self.num_node)
+        # the grouped conv with an output length of 1 is computed as a batched matmul over the act_dim groups, which
+        # avoids the slow grouped conv kernels for the tiny groups
+        # weight.shape = [act_dim, dec_pop_dim (in), dec_pop_dim (out)], spike.shape = [act_dim, N, dec_pop_dim (in)]
+        weight = self.conn.weight.view(self.act_dim, self.dec_pop_dim, self.dec_pop_dim).transpose(1, 2)
+        spike = spike.view(-1, self.act_dim, self.dec_pop_dim).transpose(0, 1)
+        if self.conn.bias is None:
+            y = torch.bmm(spike, weight)
+        else:
+            y = torch.baddbmm(self.conn.bias.view(self.act_dim, 1, self.dec_pop_dim), spike, weight)
+        return y.transpose(0, 1).reshape(-1, self.num_node)
 
     def init_tensor(self, data: torch.Tensor):
         self.v = torch.full_like(data, fill_value=self.v_reset)
@@ -3606,51 +4556,57 @@ class NoisyILCBaseNode(nn.Module, base.MultiStepModule):
     def forward(self, x_seq: torch.Tensor):
         self.init_tensor(x_seq[0].data)
 
-        y = []
+        y = torch.empty((self.T,) + x_seq.shape[1:], dtype=x_seq.dtype, device=x_seq.device)
+        # x is the input of the current time-step, including the inter-layer connection from the last time-step.
+        # x_seq itself is not modified
+        x = x_seq[0]
 
         if self.is_training:
             if self.cn_v is None or self.cn_s is None:
                 self.noise_step += 1
+            # the noises are moved to the device of x_seq only once after reset_noise, rather than in every time-step
+            if self.cn_v is None and self.eps_v_seq.device != x_seq.device:
+                self.eps_v_seq = self.eps_v_seq.to(x_seq.device)
+            if self.cn_s is None and self.eps_s_seq.device != x_seq.device:
+                self.eps_s_seq = self.eps_s_seq.to(x_seq.device)
 
-            for t in range(self.T):      
-                if self.cn_v is None:
-                    self.neuronal_charge(x_seq[t] + self.sigma_v * self.eps_v_seq[self.noise_step][t].to(x_seq.device))
-                else:
-                    self.neuronal_charge(x_seq[t] + self.sigma_v * self.cn_v[:, t])
-                spike = self.neuronal_fire()
-                self.neuronal_reset(spike)
-                if self.cn_s is None:
-                    spike = spike + self.sigma_s * self.eps_s_seq[self.noise_step][t].to(x_seq.device)
-                else:
-                    spike = spike + self.sigma_s * self.cn_s[:, t]
-                y.append(spike)
+            # the noises of the current forward are sliced once, and indexed only by t in the loop
+            noise_v = (self.eps_v_seq[self.noise_step] if self.cn_v is None else self.cn_v.transpose(0, 1)).to(x_seq.dtype)
+            noise_s = (self.eps_s_seq[self.noise_step] if self.cn_s is None else self.cn_s.transpose(0, 1)).to(x_seq.dtype)
+
+            for t in range(self.T):
+                self.neuronal_charge(torch.add(x, noise_v[t], alpha=self.sigma_v))
+                spike = self.neuronal_fire_and_reset()
+                spike = torch.add(spike, noise_s[t], alpha=self.sigma_s)
+                y[t] = spike
 
                 if t < self.T - 1:
-                    x_seq[t + 1] = x_seq[t + 1] + self.conn(spike.view(-1, self.act_dim, self.dec_pop_dim)).view(-1, self.num_node)
+                    x = x_seq[t + 1] + self.inter_layer_connection(spike)
             
         else:
             for t in range(self.T):
-                self.neuronal_charge(x_seq[t])
-                spike = self.neuronal_fire()
-                self.neuronal_reset(spike)
-                y.append(spike)
+                self.neuronal_charge(x)
+                spike = self.neuronal_fire_and_reset()
+                y[t] = spike
 
                 if t < self.T - 1:
-                    x_seq[t + 1] = x_seq[t + 1] + self.conn(spike.view(-1, self.act_dim, self.dec_pop_dim)).view(-1, self.num_node)
+                    x = x_seq[t + 1] + self.inter_layer_connection(spike)
 
-        return torch.stack(y)
+        return y
         
     def reset_noise(self, num_rl_step):
-        eps_shape = [self.num_node, num_rl_step * self.T]
-        per_order = [1, 2, 0]
-        # (nodes, steps * T) -> (nodes, steps, T) -> (steps, T, nodes)
-        self.eps_v_seq = torch.FloatTensor(powerlaw_psd_gaussian(self.beta, eps_shape).reshape(self.num_node, num_rl_step, self.T)).permute(per_order)
-        self.eps_s_seq = torch.FloatTensor(powerlaw_psd_gaussian(self.beta, eps_shape).reshape(self.num_node, num_rl_step, self.T)).permute(per_order)
+        # the noises of v and s are generated by one call, in which the FFTs of both are batched
+        eps_shape = [2, self.num_node, num_rl_step * self.T]
+        per_order = [2, 3, 0, 1]
+        # (2, nodes, steps * T) -> (2, nodes, steps, T) -> (steps, T, 2, nodes)
+        # the noises of v and s at the same step share one contiguous buffer, in which the nodes are the innermost dim
+        eps_seq = torch.FloatTensor(powerlaw_psd_gaussian(self.beta, eps_shape).reshape(2, self.num_node, num_rl_step, self.T))
+        self.eps_v_seq, self.eps_s_seq = eps_seq.permute(per_order).contiguous().to(self.noise_dtype).unbind(-2)
         self.noise_step = -1
 
     def get_colored_noise(self):
         cn = [self.eps_v_seq[self.noise_step], self.eps_s_seq[self.noise_step]]
-        return torch.cat(cn, dim=1)
+        return torch.cat(cn, dim=1).float()
 
     def load_colored_noise(self, cn):
         self.cn_v = cn[:, :, :self.num_node]
@@ -3665,19 +4621,18 @@ class NoisyILCCLIFNode(NoisyILCBaseNode):
     def __init__(self, act_dim, dec_pop_dim, c_decay: float = 0.5, v_decay: float = 0.75,
                  is_training: bool = True, T: int = 5, sigma_init: float = 0.5, 
                  beta: float = 0.0, v_threshold: float = 1.0, v_reset: float = 0., 
-                 surrogate_function: Callable = surrogate.Rect()):
+                 surrogate_function: Callable = surrogate.Rect(), noise_dtype: torch.dtype = torch.float32):
         super().__init__(act_dim, dec_pop_dim, is_training, T, sigma_init, beta, v_threshold, 
-                         v_reset, surrogate_function)
+                         v_reset, surrogate_function, noise_dtype)
 
         self.c_decay = c_decay
         self.v_decay = v_decay
 
     def neuronal_charge(self, x: torch.Tensor):
-        self.c = self.c * self.c_decay + x
-        self.v = self.v * self.v_decay + self.c
+        self.c, self.v = CLIFNode.jit_neuronal_charge(x, self.c, self.v, float(self.c_decay), float(self.v_decay))
 
     def init_tensor(self, data: torch.Tensor):
-        self.c = torch.full_like(data, fill_value=0.0)
+        self.c = torch.zeros_like(data)
         self.v = torch.full_like(data, fill_value=self.v_reset)
 
 
@@ -3695,27 +4650,30 @@ class NonSpikingBaseNode(nn.Module, base.MultiStepModule):
     def neuronal_charge(self, x: torch.Tensor):
         raise NotImplementedError
 
-    def forward(self, x_seq: torch.Tensor):
-        self.v = torch.full_like(x_seq[0].data, fill_value=0.0)
+    def multi_step_charge(self, x_seq: torch.Tensor):
+        # the membrane potentials of all time-steps, with shape = [T, *]
+        # the subclass can override it by a parallel form, as there is no reset in non-spiking neurons
+        v_seq = torch.empty(x_seq.shape, dtype=x_seq.dtype, device=x_seq.device)
+        for t in range(x_seq.shape[0]):
+            self.neuronal_charge(x_seq[t])
+            v_seq[t] = self.v
+        return v_seq
 
-        T = x_seq.shape[0]
-        v_seq = []
+    def forward(self, x_seq: torch.Tensor):
+        self.v = torch.zeros_like(x_seq[0].data)
 
-        for t in range(T):
-            self.neuronal_charge(x_seq[t])
-            v_seq.append(self.v)
+        v_seq = self.multi_step_charge(x_seq)
 
         if self.decode == 'max-mem':
-            mem = torch.max(torch.stack(v_seq, 0), 0).values
+            mem = torch.amax(v_seq, 0)
 
         elif self.decode == 'max-abs-mem':
-            v_stack = torch.stack(v_seq, 0)
-            max_mem = torch.max(v_stack, 0).values
-            min_mem = torch.min(v_stack, 0).values
-            mem = max_mem * (max_mem.abs() > min_mem.abs()) + min_mem * (max_mem.abs() <= min_mem.abs())
+            # the max and the min are got by one reduction, and the one with the larger abs is chosen (min on ties)
+            min_mem, max_mem = torch.aminmax(v_seq, dim=0)
+            mem = torch.where(max_mem.abs() > min_mem.abs(), max_mem, min_mem)
 
         elif self.decode == 'mean-mem':
-            mem = torch.mean(torch.stack(v_seq, 0), 0)
+            mem = torch.mean(v_seq, 0)
 
         else:  # 'last-mem'
             mem = v_seq[-1]
@@ -3730,6 +4688,15 @@ class NonSpikingIFNode(NonSpikingBaseNode):
     def neuronal_charge(self, x: torch.Tensor):
         self.v = self.v + x
 
+    def multi_step_charge(self, x_seq: torch.Tensor):
+        # v[t] = x[0] + x[1] + ... + x[t], which is computed by a lower triangular gemm (faster than torch.cumsum
+        # along dim 0 on CPU)
+        T = x_seq.shape[0]
+        weight = torch.ones([T, T], dtype=x_seq.dtype, device=x_seq.device).tril_()
+        v_seq = torch.mm(weight, x_seq.flatten(1)).view(x_seq.shape)
+        self.v = v_seq[-1]
+        return v_seq
+
 
 class NonSpikingLIFNode(NonSpikingBaseNode):
     def __init__(self, tau: float = 2., decode='last-mem'):
@@ -3738,7 +4705,17 @@ class NonSpikingLIFNode(NonSpikingBaseNode):
         self.tau = tau
 
     def neuronal_charge(self, x: torch.Tensor):
-        self.v = self.v + (x - self.v) / self.tau
+        self.v = LIFNode.neuronal_charge_decay_input_reset0(x, self.v, self.tau)
+
+    def multi_step_charge(self, x_seq: torch.Tensor):
+        # v[t] = sum_{i <= t} (1 - 1 / tau) ** (t - i) / tau * x[i], which is computed by a lower triangular gemm
+        T = x_seq.shape[0]
+        t = torch.arange(T, device=x_seq.device)
+        exponent = (t.unsqueeze(1) - t.unsqueeze(0)).to(x_seq.dtype)
+        weight = torch.tril(torch.pow(1. - 1. / self.tau, exponent.clamp_min(0.)) / self.tau)
+        v_seq = torch.mm(weight, x_seq.flatten(1)).view(x_seq.shape)
+        self.v = v_seq[-1]
+        return v_seq
 
 
 ##########################################################################################################
@@ -3747,7 +4724,8 @@ class NonSpikingLIFNode(NonSpikingBaseNode):
 
 class NoisyNonSpikingBaseNode(nn.Module, base.MultiStepModule):
     def __init__(self, num_node, is_training: bool = True, T: int = 5, 
-                 sigma_init: float = 0.5, beta: float = 0.0, decode: str = 'last-mem'):
+                 sigma_init: float = 0.5, beta: float = 0.0, decode: str = 'last-mem',
+                 noise_dtype: torch.dtype = torch.float32):
         super().__init__()
 
         self.num_node = num_node
@@ -3755,6 +4733,9 @@ class NoisyNonSpikingBaseNode(nn.Module, base.MultiStepModule):
         self.T = T
         self.beta = beta
         self.decode = decode
+        # the dtype in which the exploration noise is stored, e.g., torch.float16 halves the memory and the bandwidth
+        # of the noise buffer
+        self.noise_dtype = noise_dtype
 
         self.sigma = nn.Parameter(torch.FloatTensor(num_node))
         self.sigma.data.fill_(sigma_init / math.sqrt(num_node))
@@ -3765,40 +4746,47 @@ class NoisyNonSpikingBaseNode(nn.Module, base.MultiStepModule):
         raise NotImplementedError
 
     def init_tensor(self, data: torch.Tensor):
-        self.v = torch.full_like(data, fill_value=0.0)
+        self.v = torch.zeros_like(data)
 
     def forward(self, x_seq: torch.Tensor):
         self.init_tensor(x_seq[0].data)
 
-        v_seq = []
+        v_seq = torch.empty((self.T,) + x_seq.shape[1:], dtype=x_seq.dtype, device=x_seq.device)
 
         if self.is_training:
             if self.cn is None:
                 self.noise_step += 1
+            # the noises are moved to the device of x_seq only once, rather than in every time-step
+            if self.cn is None:
+                if self.eps_seq.device != x_seq.device:
+                    self.eps_seq = self.eps_seq.to(x_seq.device)
+            elif self.cn.device != x_seq.device:
+                self.cn = self.cn.to(x_seq.device)
+
+            # the noise of the current forward is sliced once, and indexed only by t in the loop
+            noise = (self.eps_seq[self.noise_step] if self.cn is None else self.cn.transpose(0, 1)).to(x_seq.dtype)
+            # the noise of all time-steps is scaled by sigma in one multiplication
+            noise = self.sigma * noise
 
             for t in range(self.T):
-                if self.cn is None:
-                    self.neuronal_charge(x_seq[t] + self.sigma.mul(self.eps_seq[self.noise_step][t].to(x_seq.device)))
-                else:
-                    self.neuronal_charge(x_seq[t] + self.sigma.mul(self.cn[:, t].to(x_seq.device)))
-                v_seq.append(self.v)
+                self.neuronal_charge(x_seq[t] + noise[t])
+                v_seq[t] = self.v
                 
         else:
             for t in range(self.T):
                 self.neuronal_charge(x_seq[t])
-                v_seq.append(self.v)
+                v_seq[t] = self.v
 
         if self.decode == 'max-mem':
-            mem = torch.max(torch.stack(v_seq, 0), 0).values
+            mem = torch.amax(v_seq, 0)
 
         elif self.decode == 'max-abs-mem':
-            v_stack = torch.stack(v_seq, 0)
-            max_mem = torch.max(v_stack, 0).values
-            min_mem = torch.min(v_stack, 0).values
-            mem = max_mem * (max_mem.abs() > min_mem.abs()) + min_mem * (max_mem.abs() <= min_mem.abs())
+            # the max and the min are got by one reduction, and the one with the larger abs is chosen (min on ties)
+            min_mem, max_mem = torch.aminmax(v_seq, dim=0)
+            mem = torch.where(max_mem.abs() > min_mem.abs(), max_mem, min_mem)
 
         elif self.decode == 'mean-mem':
-            mem = torch.mean(torch.stack(v_seq, 0), 0)
+            mem = torch.mean(v_seq, 0)
 
         else:  # 'last-mem'
             mem = v_seq[-1]
@@ -3808,11 +4796,11 @@ class NoisyNonSpikingBaseNode(nn.Module, base.MultiStepModule):
     def reset_noise(self, num_rl_step):
         eps_shape = [self.num_node, num_rl_step * self.T]
         per_order = [1, 2, 0]
-        self.eps_seq = torch.FloatTensor(powerlaw_psd_gaussian(self.beta, eps_shape).reshape(self.num_node, num_rl_step, self.T)).permute(per_order)
+        self.eps_seq = torch.FloatTensor(powerlaw_psd_gaussian(self.beta, eps_shape).reshape(self.num_node, num_rl_step, self.T)).permute(per_order).contiguous().to(self.noise_dtype)
         self.noise_step = -1
 
     def get_colored_noise(self):
-        return self.eps_seq[self.noise_step]
+        return self.eps_seq[self.noise_step].float()
 
     def load_colored_noise(self, cn):
         self.cn = cn
@@ -1384,7 +1384,7 @@ class MultiStepQIFNodePTT(torch.autograd.Function):
                 for(int mem_offset = 0; mem_offset < numel; mem_offset += neuron_num)
                 {
                     const int t = index + mem_offset;
-                    h_seq[t] = v_v_seq[t] + reciprocal_tau * (x_seq[t] + a0 * (v_v_seq[t] - v_rest) * (v_v_seq[t] - v_c));
+                    h_seq[t] = fmaf(fmaf(a0, (v_v_seq[t] - v_rest) * (v_v_seq[t] - v_c), x_seq[t]), reciprocal_tau, v_v_seq[t]);
                     if (h_seq[t] >= v_threshold)
                     {
                         spike_seq[t] = 1.0f;
@@ -1624,11 +1624,14 @@ class MultiStepQIFNodePTT(torch.autograd.Function):
             x_seq = F.pad(x_seq, (0, 1))  # [T, N] -> [T, N + 1]
             v_init = F.pad(v_init, (0, 1))  # [N] -> [N + 1]
 
-        zero_shape = list(x_seq.shape)
-        zero_shape[0] *= 3
-        v_seq, h_seq, spike_seq = torch.split(torch.zeros(zero_shape, device=x_seq.device, dtype=x_seq.dtype), x_seq.shape[0])
-
-        v_v_seq = torch.cat((v_init.unsqueeze(0), v_seq))
+        # the kernel writes every element of v_v_seq[1:], h_seq and spike_seq, so they do not need to be zeroed,
+        # and v_init is copied into v_v_seq[0] directly instead of being concatenated with a [T, N] buffer
+        seq_shape = list(x_seq.shape)
+        seq_shape[0] += 1
+        v_v_seq = torch.empty(seq_shape, device=x_seq.device, dtype=x_seq.dtype)
+        v_v_seq[0] = v_init
+        seq_shape[0] = 2 * x_seq.shape[0]
+        h_seq, spike_seq = torch.split(torch.empty(seq_shape, device=x_seq.device, dtype=x_seq.dtype), x_seq.shape[0])
 
         with cuda_utils.DeviceEnvironment(device):
             numel = x_seq.numel()
@@ -1783,8 +1786,8 @@ class MultiStepIzhikevichNodePTT(torch.autograd.Function):
                 for(int mem_offset = 0; mem_offset < numel; mem_offset += neuron_num)
                 {
                     const int t = index + mem_offset;
-                    h_seq[t] = v_v_seq[t] + reciprocal_tau * (x_seq[t] + a0 * (v_v_seq[t] - v_rest) * (v_v_seq[t] - v_c) - w_w_seq[t]);
-                    const float z = w_w_seq[t] + reciprocal_tau_w * (a * (h_seq[t] - v_rest) - w_w_seq[t]);
+                    h_seq[t] = fmaf(fmaf(a0, (v_v_seq[t] - v_rest) * (v_v_seq[t] - v_c), x_seq[t] - w_w_seq[t]), reciprocal_tau, v_v_seq[t]);
+                    const float z = fmaf(fmaf(a, h_seq[t] - v_rest, -w_w_seq[t]), reciprocal_tau_w, w_w_seq[t]);
                     if (h_seq[t] >= v_threshold)
                     {
                         spike_seq[t] = 1.0f;
@@ -1896,12 +1899,17 @@ class MultiStepIzhikevichNodePTT(torch.autograd.Function):
         else:
             raise NotImplementedError
 
-        zero_shape = list(x_seq.shape)
-        zero_shape[0] *= 4
-        v_seq, h_seq, w_seq, spike_seq = torch.split(torch.zeros(zero_shape, device=x_seq.device, dtype=x_seq.dtype), x_seq.shape[0])
-
-        v_v_seq = torch.cat((v_init.unsqueeze(0), v_seq))
-        w_w_seq = torch.cat((w_init.unsqueeze(0), w_seq))
+        # the kernel writes every element of v_v_seq[1:], w_w_seq[1:], h_seq and spike_seq, so they do not need to be
+        # zeroed, and v_init/w_init are copied into v_v_seq[0]/w_w_seq[0] directly instead of being concatenated with
+        # [T, N] buffers
+        seq_shape = list(x_seq.shape)
+        seq_shape[0] += 1
+        v_v_seq = torch.empty(seq_shape, device=x_seq.device, dtype=x_seq.dtype)
+        v_v_seq[0] = v_init
+        w_w_seq = torch.empty(seq_shape, device=x_seq.device, dtype=x_seq.dtype)
+        w_w_seq[0] = w_init
+        seq_shape[0] = 2 * x_seq.shape[0]
+        h_seq, spike_seq = torch.split(torch.empty(seq_shape, device=x_seq.device, dtype=x_seq.dtype), x_seq.shape[0])
 
         with cuda_utils.DeviceEnvironment(device):
             numel = x_seq.numel()
@@ -2043,7 +2051,7 @@ class MultiStepEIFNodePTT(torch.autograd.Function):
                 for(int mem_offset = 0; mem_offset < numel; mem_offset += neuron_num)
                 {
                     const int t = index + mem_offset;
-                    h_seq[t] = v_v_seq[t] + reciprocal_tau * (x_seq[t] - v_v_seq[t] + v_rest + delta_T * expf((v_v_seq[t] - theta_rh) / delta_T));
+                    h_seq[t] = v_v_seq[t] + reciprocal_tau * (x_seq[t] - v_v_seq[t] + v_rest + delta_T * exp2f((v_v_seq[t] - theta_rh) * (1.4426950408889634f / delta_T)));
                     if (h_seq[t] >= v_threshold)
                     {
                         spike_seq[t] = 1.0f;
@@ -2183,10 +2191,10 @@ class MultiStepEIFNodePTT(torch.autograd.Function):
 
             code += code_grad_v_to_h
             code += r'''
-                grad_h = grad_spike_seq[t] * grad_s_to_h + (grad_v_seq[t] + grad_h * (one_sub_reciprocal_tau + reciprocal_tau * expf((v_v_seq[t + neuron_num] - theta_rh) * reciprocal_delta_T))) * grad_v_to_h;
+                grad_h = grad_spike_seq[t] * grad_s_to_h + (grad_v_seq[t] + grad_h * (one_sub_reciprocal_tau + reciprocal_tau * exp2f((v_v_seq[t + neuron_num] - theta_rh) * (reciprocal_delta_T * 1.4426950408889634f)))) * grad_v_to_h;
                 grad_x_seq[t] = grad_h * reciprocal_tau;
                 }
-            grad_v_init[index] = grad_x_seq[index] * (one_sub_reciprocal_tau + reciprocal_tau * expf((v_v_seq[index] - theta_rh) * reciprocal_delta_T));
+            grad_v_init[index] = grad_x_seq[index] * (one_sub_reciprocal_tau + reciprocal_tau * exp2f((v_v_seq[index] - theta_rh) * (reciprocal_delta_T * 1.4426950408889634f)));
             }
             }
             '''
@@ -2284,11 +2292,14 @@ class MultiStepEIFNodePTT(torch.autograd.Function):
             x_seq = F.pad(x_seq, (0, 1))  # [T, N] -> [T, N + 1]
             v_init = F.pad(v_init, (0, 1))  # [N] -> [N + 1]
 
-        zero_shape = list(x_seq.shape)
-        zero_shape[0] *= 3
-        v_seq, h_seq, spike_seq = torch.split(torch.zeros(zero_shape, device=x_seq.device, dtype=x_seq.dtype), x_seq.shape[0])
-
-        v_v_seq = torch.cat((v_init.unsqueeze(0), v_seq))
+        # the kernel writes every element of v_v_seq[1:], h_seq and spike_seq, so they do not need to be zeroed,
+        # and v_init is copied into v_v_seq[0] directly instead of being concatenated with a [T, N] buffer
+        seq_shape = list(x_seq.shape)
+        seq_shape[0] += 1
+        v_v_seq = torch.empty(seq_shape, device=x_seq.device, dtype=x_seq.dtype)
+        v_v_seq[0] = v_init
+        seq_shape[0] = 2 * x_seq.shape[0]
+        h_seq, spike_seq = torch.split(torch.empty(seq_shape, device=x_seq.device, dtype=x_seq.dtype), x_seq.shape[0])
 
         with cuda_utils.DeviceEnvironment(device):
             numel = x_seq.numel()
@@ -2418,6 +2429,362 @@ class MultiStepEIFNodePTT(torch.autograd.Function):
             return grad_x_seq, grad_v_init, None, None, None, None, None, None, None, None
 
 
+class MultiStepKLIFNodePTT(torch.autograd.Function):
+    @staticmethod
+    def create_fptt_kernel(decay_input: bool, hard_reset: bool, scale_reset: bool, dtype: str):
+        kernel_name = f'KLIFNode_fptt_decayInput{decay_input}_{"hard" if hard_reset else "soft"}Reset_{"scaleReset" if scale_reset else ""}_{dtype}'
+
+        if dtype == 'fp32':
+            code = rf'''
+            extern "C" __global__
+            void {kernel_name}(const float* x_seq, float* v_v_seq, float* h_seq, float* spike_seq,
+            const float & reciprocal_tau, const float & k,
+            const float & v_threshold, {'const float & v_reset,' if hard_reset else ''}
+            const int & neuron_num, const int & numel)
+            '''
+            code += r'''
+            {
+            const int index = blockIdx.x * blockDim.x + threadIdx.x;
+            if (index < neuron_num)
+            {
+                const int dt = neuron_num;
+                for(int mem_offset = 0; mem_offset < numel; mem_offset += neuron_num)
+                {
+                    const int t = index + mem_offset;
+            '''
+            # the charge is the same as LIF, except that the soft reset neuron uses v_reset = 0 in the leakage
+            if hard_reset:
+                if decay_input:
+                    code += r'''
+                        h_seq[t] = fmaf(x_seq[t] - v_v_seq[t] + v_reset, reciprocal_tau, v_v_seq[t]);
+                    '''
+                else:
+                    code += r'''
+                        h_seq[t] = fmaf(v_reset - v_v_seq[t], reciprocal_tau, v_v_seq[t]) + x_seq[t];
+                    '''
+            else:
+                if decay_input:
+                    code += r'''
+                        h_seq[t] = fmaf(x_seq[t] - v_v_seq[t], reciprocal_tau, v_v_seq[t]);
+                    '''
+                else:
+                    code += r'''
+                        h_seq[t] = fmaf(v_v_seq[t], 1.0f - reciprocal_tau, x_seq[t]);
+                    '''
+            code += r'''
+                    h_seq[t] = fmaxf(k * h_seq[t], 0.0f);
+                    if (h_seq[t] >= v_threshold)
+                    {
+                        spike_seq[t] = 1.0f;
+            '''
+            if hard_reset:
+                code += r'''
+                        v_v_seq[t + dt] = v_reset;
+                '''
+            elif scale_reset:
+                code += r'''
+                        v_v_seq[t + dt] = (h_seq[t] - v_threshold) / k;
+                '''
+            else:
+                code += r'''
+                        v_v_seq[t + dt] = h_seq[t] - v_threshold;
+                '''
+            code += r'''
+                    }
+                    else
+                    {
+                        spike_seq[t] = 0.0f;
+            '''
+            if scale_reset:
+                code += r'''
+                        v_v_seq[t + dt] = h_seq[t] / k;
+                '''
+            else:
+                code += r'''
+                        v_v_seq[t + dt] = h_seq[t];
+                '''
+            code += r'''
+                    }
+                }
+            }
+            }
+            '''
+        else:
+            raise TypeError
+        return cupy.RawKernel(code, kernel_name, options=configure.cuda_compiler_options, backend=configure.cuda_compiler_backend)
+
+    @staticmethod
+    def create_bptt_kernel(sg_cuda_code_fun, decay_input: bool, hard_reset: bool, scale_reset: bool, detach_reset: bool,
+                           dtype: str):
+        kernel_name = f'KLIFNode_bptt_decayInput{decay_input}_{"hard" if hard_reset else "soft"}Reset_{"scaleReset" if scale_reset else ""}_{"detachReset" if detach_reset else ""}_{dtype}'
+
+        code_grad_s_to_h = sg_cuda_code_fun(x='over_th', y='grad_s_to_h', dtype=dtype)
+
+        if dtype == 'fp32':
+            code = fr'''
+            extern "C" __global__
+            void {kernel_name}(
+            const float* grad_spike_seq, const float* grad_v_seq, const float* h_seq, const float* spike_seq, const float* v_v_seq,
+            float* grad_x_seq, float* grad_v_init, float* grad_k,
+            const float & reciprocal_tau, const float & one_sub_reciprocal_tau, const float & k,
+            const float & v_threshold, {'const float & v_reset,' if hard_reset else ''}
+            const int & neuron_num, const int & numel)
+            '''
+            code += r'''
+            {
+                const int index = blockIdx.x * blockDim.x + threadIdx.x;
+            '''
+            code += f'__shared__ float sdata[{configure.cuda_threads}];'
+            code += r'''
+                if (index < neuron_num)
+                {
+                    const float reciprocal_k = 1.0f / k;
+                    float grad_u = 0.0f;  // the gradient of the LIF charge before ReLU(k * u), which will be used recursively
+                    sdata[threadIdx.x] = 0.0f;
+                    for(int mem_offset = numel - neuron_num; mem_offset >= 0; mem_offset -= neuron_num)
+                    {
+                        const int t = index + mem_offset;
+                        const float over_th = h_seq[t] - v_threshold;
+            '''
+            code += code_grad_s_to_h
+            if detach_reset:
+                if hard_reset:
+                    code_grad_v_to_h = r'''
+                    const float grad_v_to_h = 1.0f - spike_seq[t];
+                    '''
+                else:
+                    code_grad_v_to_h = r'''
+                    const float grad_v_to_h = 1.0f;
+                    '''
+            else:
+                if hard_reset:
+                    if scale_reset:
+                        code_grad_v_to_h = r'''
+                        const float grad_v_to_h = (1.0f - spike_seq[t]) * reciprocal_k + (v_reset - h_seq[t] * reciprocal_k) * grad_s_to_h;
+                        '''
+                    else:
+                        code_grad_v_to_h = r'''
+                        const float grad_v_to_h = 1.0f - spike_seq[t] + (v_reset - h_seq[t]) * grad_s_to_h;
+                        '''
+                else:
+                    code_grad_v_to_h = r'''
+                    const float grad_v_to_h = 1.0f - v_threshold * grad_s_to_h;
+                    '''
+            code += code_grad_v_to_h
+            if scale_reset and (detach_reset or not hard_reset):
+                code += r'''
+                    const float grad_v_to_h_scaled = grad_v_to_h * reciprocal_k;
+                '''
+            else:
+                code += r'''
+                    const float grad_v_to_h_scaled = grad_v_to_h;
+                '''
+            code += r'''
+                    const float grad_v = grad_v_seq[t] + grad_u * one_sub_reciprocal_tau;
+                    const float grad_h = grad_spike_seq[t] * grad_s_to_h + grad_v * grad_v_to_h_scaled;
+            '''
+            if scale_reset:
+                # v[t] also depends on k through the division by k
+                if hard_reset:
+                    code += r'''
+                    sdata[threadIdx.x] -= grad_v * (v_v_seq[t + neuron_num] - v_reset * spike_seq[t]) * reciprocal_k;
+                    '''
+                else:
+                    code += r'''
+                    sdata[threadIdx.x] -= grad_v * v_v_seq[t + neuron_num] * reciprocal_k;
+                    '''
+            code += r'''
+                    if (h_seq[t] > 0.0f)
+                    {
+                        grad_u = grad_h * k;
+                        sdata[threadIdx.x] += grad_h * h_seq[t] * reciprocal_k;
+                    }
+                    else
+                    {
+                        grad_u = 0.0f;
+                    }
+            '''
+            if decay_input:
+                code += r'''
+                    grad_x_seq[t] = grad_u * reciprocal_tau;
+                '''
+            else:
+                code += r'''
+                    grad_x_seq[t] = grad_u;
+                '''
+            code += r'''
+                }
+            grad_v_init[index] = grad_u * one_sub_reciprocal_tau;
+            }
+            else
+            {
+                sdata[threadIdx.x] = 0.0f;
+            }
+            int threadx = blockDim.x;
+            #pragma unroll
+            for (int stride = threadx >> 1; stride > 0; stride = stride >> 1)
+            {
+            // Synchronize all thread before next loop
+            __syncthreads();
+            if (threadIdx.x < stride)
+            {
+                sdata[threadIdx.x] += sdata[threadIdx.x + stride];
+            }
+            }
+            __syncthreads();
+            if (threadIdx.x == 0)
+            {
+            atomicAdd(grad_k, sdata[0]);
+            }
+            }
+            '''
+        else:
+            raise TypeError
+        return cupy.RawKernel(code, kernel_name, options=configure.cuda_compiler_options, backend=configure.cuda_compiler_backend)
+
+    @staticmethod
+    def forward(ctx, x_seq: torch.Tensor, v_init: torch.Tensor, k: torch.Tensor, decay_input: bool, tau: float,
+                v_threshold: float, v_reset: float, scale_reset: bool, detach_reset: bool, sg_cuda_code_fun):
+        requires_grad = x_seq.requires_grad or v_init.requires_grad or k.requires_grad
+        device = x_seq.get_device()
+        if x_seq.dtype == torch.float32:
+            dtype = 'fp32'
+            cp_dtype = np.float32
+        else:
+            raise NotImplementedError
+
+        # the kernel writes every element of v_v_seq[1:], h_seq and spike_seq, so they do not need to be zeroed,
+        # and v_init is copied into v_v_seq[0] directly instead of being concatenated with a [T, N] buffer
+        seq_shape = list(x_seq.shape)
+        seq_shape[0] += 1
+        v_v_seq = torch.empty(seq_shape, device=x_seq.device, dtype=x_seq.dtype)
+        v_v_seq[0] = v_init
+        seq_shape[0] = 2 * x_seq.shape[0]
+        h_seq, spike_seq = torch.split(torch.empty(seq_shape, device=x_seq.device, dtype=x_seq.dtype), x_seq.shape[0])
+
+        with cuda_utils.DeviceEnvironment(device):
+            numel = x_seq.numel()
+            neuron_num = numel // x_seq.shape[0]
+
+            threads = configure.cuda_threads
+            blocks = cuda_utils.cal_blocks(neuron_num)
+
+            cp_numel = cupy.asarray(numel)
+            cp_neuron_num = cupy.asarray(neuron_num)
+            cp_v_threshold = cupy.asarray(v_threshold, dtype=cp_dtype)
+            cp_reciprocal_tau = cupy.asarray(1. / tau, dtype=cp_dtype)
+            cp_one_sub_reciprocal_tau = cupy.asarray(1. - 1. / tau, dtype=cp_dtype)
+            cp_k = cupy.asarray(k.item(), dtype=cp_dtype)
+
+            if v_reset is None:
+                cp_v_reset = None
+                hard_reset = False
+                x_seq, v_v_seq, h_seq, spike_seq, cp_reciprocal_tau, cp_k, cp_v_threshold, cp_neuron_num, cp_numel = cuda_utils.get_contiguous(
+                    x_seq, v_v_seq, h_seq, spike_seq, cp_reciprocal_tau, cp_k, cp_v_threshold, cp_neuron_num, cp_numel)
+                kernel_args = [x_seq, v_v_seq, h_seq, spike_seq, cp_reciprocal_tau, cp_k, cp_v_threshold,
+                               cp_neuron_num, cp_numel]
+            else:
+                cp_v_reset = cupy.asarray(v_reset, dtype=cp_dtype)
+                hard_reset = True
+                x_seq, v_v_seq, h_seq, spike_seq, cp_reciprocal_tau, cp_k, cp_v_threshold, cp_v_reset, cp_neuron_num, cp_numel = cuda_utils.get_contiguous(
+                    x_seq, v_v_seq, h_seq, spike_seq, cp_reciprocal_tau, cp_k, cp_v_threshold, cp_v_reset,
+                    cp_neuron_num, cp_numel)
+                kernel_args = [x_seq, v_v_seq, h_seq, spike_seq, cp_reciprocal_tau, cp_k, cp_v_threshold, cp_v_reset,
+                               cp_neuron_num, cp_numel]
+
+            kernel = MultiStepKLIFNodePTT.create_fptt_kernel(decay_input, hard_reset, scale_reset, dtype)
+            kernel(
+                (blocks,), (threads,),
+                cuda_utils.wrap_args_to_raw_kernel(
+                    device,
+                    *kernel_args
+                )
+            )
+
+        if requires_grad:
+            ctx.decay_input = decay_input
+            ctx.scale_reset = scale_reset
+            ctx.k_shape = k.shape
+            ctx.k_dtype = k.dtype
+            if configure.save_spike_as_bool_in_neuron_kernel:
+                ctx.s_shape = spike_seq.shape
+                ctx.s_tk = tensor_cache.BOOL_TENSOR_CACHE.store_bool(spike_seq)
+                ctx.save_for_backward(h_seq, v_v_seq)
+            else:
+                ctx.save_for_backward(h_seq, spike_seq, v_v_seq)
+            ctx.blocks = blocks
+            ctx.threads = threads
+            ctx.cp_numel = cp_numel
+            ctx.cp_neuron_num = cp_neuron_num
+            ctx.cp_reciprocal_tau = cp_reciprocal_tau
+            ctx.cp_one_sub_reciprocal_tau = cp_one_sub_reciprocal_tau
+            ctx.cp_k = cp_k
+            ctx.cp_v_threshold = cp_v_threshold
+            ctx.cp_v_reset = cp_v_reset
+            ctx.detach_reset = detach_reset
+            ctx.sg_cuda_code_fun = sg_cuda_code_fun
+
+        return spike_seq, v_v_seq[1:, ]
+
+    @staticmethod
+    def backward(ctx, grad_spike_seq, grad_v_seq):
+        device = grad_spike_seq.get_device()
+        if configure.save_spike_as_bool_in_neuron_kernel:
+            spike_seq = tensor_cache.BOOL_TENSOR_CACHE.get_float(ctx.s_tk, ctx.s_shape)
+            h_seq, v_v_seq = ctx.saved_tensors
+        else:
+            h_seq, spike_seq, v_v_seq = ctx.saved_tensors
+        zero_shape = list(grad_spike_seq.shape)
+        zero_shape[0] += 1
+        zero_data = torch.zeros(zero_shape, device=grad_spike_seq.device, dtype=grad_spike_seq.dtype)
+        grad_x_seq = zero_data[0: -1]
+        grad_v_init = zero_data[-1]
+        grad_k = torch.as_tensor(0., device=grad_spike_seq.device, dtype=torch.float32)
+
+        if ctx.cp_v_reset is None:
+            hard_reset = False
+        else:
+            hard_reset = True
+
+        if grad_spike_seq.dtype == torch.float32:
+            dtype = 'fp32'
+        else:
+            raise NotImplementedError
+
+        kernel = MultiStepKLIFNodePTT.create_bptt_kernel(ctx.sg_cuda_code_fun, ctx.decay_input, hard_reset,
+                                                         ctx.scale_reset, ctx.detach_reset, dtype)
+
+        with cuda_utils.DeviceEnvironment(device):
+
+            if hard_reset:
+                grad_spike_seq, grad_v_seq, h_seq, spike_seq, v_v_seq, grad_x_seq, grad_v_init, grad_k, ctx.cp_reciprocal_tau, ctx.cp_one_sub_reciprocal_tau, ctx.cp_k, ctx.cp_v_threshold, ctx.cp_v_reset, ctx.cp_neuron_num, ctx.cp_numel = cuda_utils.get_contiguous(
+                    grad_spike_seq, grad_v_seq, h_seq, spike_seq, v_v_seq, grad_x_seq, grad_v_init, grad_k,
+                    ctx.cp_reciprocal_tau, ctx.cp_one_sub_reciprocal_tau, ctx.cp_k, ctx.cp_v_threshold,
+                    ctx.cp_v_reset, ctx.cp_neuron_num, ctx.cp_numel)
+                kernel_args = [grad_spike_seq, grad_v_seq, h_seq, spike_seq, v_v_seq, grad_x_seq, grad_v_init, grad_k,
+                               ctx.cp_reciprocal_tau, ctx.cp_one_sub_reciprocal_tau, ctx.cp_k, ctx.cp_v_threshold,
+                               ctx.cp_v_reset, ctx.cp_neuron_num, ctx.cp_numel]
+            else:
+                grad_spike_seq, grad_v_seq, h_seq, spike_seq, v_v_seq, grad_x_seq, grad_v_init, grad_k, ctx.cp_reciprocal_tau, ctx.cp_one_sub_reciprocal_tau, ctx.cp_k, ctx.cp_v_threshold, ctx.cp_neuron_num, ctx.cp_numel = cuda_utils.get_contiguous(
+                    grad_spike_seq, grad_v_seq, h_seq, spike_seq, v_v_seq, grad_x_seq, grad_v_init, grad_k,
+                    ctx.cp_reciprocal_tau, ctx.cp_one_sub_reciprocal_tau, ctx.cp_k, ctx.cp_v_threshold,
+                    ctx.cp_neuron_num, ctx.cp_numel)
+                kernel_args = [grad_spike_seq, grad_v_seq, h_seq, spike_seq, v_v_seq, grad_x_seq, grad_v_init, grad_k,
+                               ctx.cp_reciprocal_tau, ctx.cp_one_sub_reciprocal_tau, ctx.cp_k, ctx.cp_v_threshold,
+                               ctx.cp_neuron_num, ctx.cp_numel]
+
+            kernel(
+                (ctx.blocks,), (ctx.threads,),
+                cuda_utils.wrap_args_to_raw_kernel(
+                    device,
+                    *kernel_args
+                )
+            )
+
+        grad_k = grad_k.to(ctx.k_dtype).view(ctx.k_shape)
+        return grad_x_seq, grad_v_init, grad_k, None, None, None, None, None, None, None
+
+
 def save_cuda_codes(cu_file_path: str = './spikingjelly/activation_based/neuron_kernel_sample.cu'):
     # save all cuda codes to files
     with open(cu_file_path, 'w+') as cu_file:
@@ -0,0 +1,114 @@
+import numpy as np
+import torch
+import numba
+
+
+@numba.njit(parallel=True, cache=True)
+def lif_multistep_fwd(x_seq, v, spike_seq, v_seq, v_th, v_reset, inv_tau, decay, hard_reset, decay_input,
+                      store_v_seq, block):
+    # x_seq, spike_seq, v_seq: [T, N], v: [N]. The neurons are split into blocks, and each block is processed over
+    # all T time-steps by one thread, so that its v stays in the cache and the inner loop reads x_seq contiguously
+    T = x_seq.shape[0]
+    N = x_seq.shape[1]
+    for b in numba.prange((N + block - 1) // block):
+        start = b * block
+        end = min(start + block, N)
+        for t in range(T):
+            for i in range(start, end):
+                x = x_seq[t, i]
+                v_i = v[i]
+                if hard_reset:
+                    if decay_input:
+                        v_i = v_i + (x - (v_i - v_reset)) * inv_tau
+                    else:
+                        v_i = v_i - (v_i - v_reset) * inv_tau + x
+                else:
+                    if decay_input:
+                        v_i = v_i + (x - v_i) * inv_tau
+                    else:
+                        v_i = x + v_i * decay
+                spike = v_i >= v_th
+                spike_seq[t, i] = 1. if spike else 0.
+                if spike:
+                    v_i = v_reset if hard_reset else v_i - v_th
+                v[i] = v_i
+                if store_v_seq:
+                    v_seq[t, i] = v_i
+
+
+def multi_step_forward(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float, v_reset: float or None, tau: float,
+                       decay_input: bool, store_v_seq: bool = False, block: int = 1024):
+    """
+    * :ref:`API in English <numba_lif_kernel.multi_step_forward-en>`
+
+    .. _numba_lif_kernel.multi_step_forward-cn:
+
+    :param x_seq: ``shape = [T, *]`` 的输入，需要位于CPU上，且数据类型为 ``torch.float32`` 或 ``torch.float64``
+    :type x_seq: torch.Tensor
+    :param v: ``shape = [*]`` 的初始膜电位
+    :type v: torch.Tensor
+    :param v_threshold: 神经元的阈值电压
+    :type v_threshold: float
+    :param v_reset: 神经元的重置电压。为 ``None`` 时使用软重置
+    :type v_reset: float or None
+    :param tau: 膜电位时间常数
+    :type tau: float
+    :param decay_input: 输入是否也会参与衰减
+    :type decay_input: bool
+    :param store_v_seq: 是否返回所有时刻的膜电位
+    :type store_v_seq: bool
+    :param block: 每个线程处理的神经元数量
+    :type block: int
+    :return: ``(spike_seq, v, v_seq)``，``store_v_seq = False`` 时 ``v_seq`` 为 ``None``
+    :rtype: tuple
+
+    推理阶段LIF神经元多步前向传播的Numba CPU实现。神经元被分为若干块，每块在 ``T`` 个时间步内的计算由一个线程在同一个循环中完成，
+    不再经过PyTorch的逐算子调度。
+
+    * :ref:`中文API <numba_lif_kernel.multi_step_forward-cn>`
+
+    .. _numba_lif_kernel.multi_step_forward-en:
+
+    :param x_seq: the input with ``shape = [T, *]``, which should be on CPU with ``dtype`` of ``torch.float32`` or
+        ``torch.float64``
+    :type x_seq: torch.Tensor
+    :param v: the initial membrane potential with ``shape = [*]``
+    :type v: torch.Tensor
+    :param v_threshold: threshold of the neuron
+    :type v_threshold: float
+    :param v_reset: reset voltage of the neuron. If ``None``, soft reset is used
+    :type v_reset: float or None
+    :param tau: membrane time constant
+    :type tau: float
+    :param decay_input: whether the input will decay
+    :type decay_input: bool
+    :param store_v_seq: whether to return the membrane potential at all time-steps
+    :type store_v_seq: bool
+    :param block: the number of neurons processed by each thread
+    :type block: int
+    :return: ``(spike_seq, v, v_seq)``, where ``v_seq`` is ``None`` if ``store_v_seq = False``
+    :rtype: tuple
+
+    The Numba implementation of the multi-step forward of the LIF neuron in inference on CPU. The neurons are split into
+    blocks, and all ``T`` time-steps of each block are computed in one loop by one thread, without going through the
+    PyTorch dispatcher for each operation.
+    """
+    shape = x_seq.shape
+    x_flat = x_seq.detach().reshape(shape[0], -1).contiguous()
+    # the kernel updates v in place, so it should not alias the input
+    v_out = v.detach().to(x_seq).clone(memory_format=torch.contiguous_format)
+    spike_seq = torch.empty_like(x_flat)
+    if store_v_seq:
+        # v_seq will be stored as a memory of the neuron, which should not be a view
+        v_seq = torch.empty(shape, dtype=x_seq.dtype)
+        v_seq_flat = v_seq.view(x_flat.shape)
+    else:
+        v_seq = None
+        v_seq_flat = spike_seq
+    hard_reset = v_reset is not None
+    # the scalars are cast to the dtype of x_seq, as PyTorch does for scalar arguments
+    scalar = np.dtype(str(x_seq.dtype).split('.')[-1]).type
+    lif_multistep_fwd(x_flat.numpy(), v_out.view(-1).numpy(), spike_seq.numpy(), v_seq_flat.numpy(),
+                      scalar(v_threshold), scalar(v_reset if hard_reset else 0.), scalar(1. / tau),
+                      scalar(1. - 1. / tau), hard_reset, decay_input, store_v_seq, block)
+    return spike_seq.view(shape), v_out, v_seq
@@ -150,6 +150,49 @@ class SurrogateFunctionBase(nn.Module):
         else:
             return self.primitive_function(x, self.alpha)
 
+    def forward_with_threshold(self, v: torch.Tensor, v_threshold):
+        '''
+        * :ref:`API in English <SurrogateFunctionBase.forward_with_threshold-en>`
+        .. _SurrogateFunctionBase.forward_with_threshold-cn:
+
+        :param v: 膜电位
+        :type v: torch.Tensor
+        :param v_threshold: 阈值电压
+        :type v_threshold: float or torch.Tensor
+        :return: 输出脉冲
+        :rtype: torch.Tensor
+
+        等价于 ``self(v - v_threshold)``。若处于 ``spiking`` 模式且不需要计算梯度，则直接以 ``v >= v_threshold`` 计算输出脉冲，
+        不再生成 ``v - v_threshold`` 这一中间tensor。
+
+        * :ref:`中文API <SurrogateFunctionBase.forward_with_threshold-cn>`
+        .. _SurrogateFunctionBase.forward_with_threshold-en:
+
+        :param v: the membrane potential
+        :type v: torch.Tensor
+        :param v_threshold: the threshold voltage
+        :type v_threshold: float or torch.Tensor
+        :return: the output spikes
+        :rtype: torch.Tensor
+
+        Equivalent to ``self(v - v_threshold)``. In ``spiking`` mode and when no gradient is required, the spikes are
+        computed by ``v >= v_threshold`` directly, without materializing the intermediate tensor ``v - v_threshold``.
+        The shortcut assumes that the forward of ``spiking_function`` is the heaviside function, which holds for all
+        surrogate functions in this module.
+
+        If ``v - v_threshold`` is ``torch.float16`` or ``torch.bfloat16`` and the surrogate function is evaluated, it is
+        evaluated in ``torch.float32`` and the output is cast back, so that the surrogate gradients near the threshold
+        keep their precision.
+        '''
+        if self.spiking and type(self).forward is SurrogateFunctionBase.forward and not (torch.is_grad_enabled() and (
+                v.requires_grad or (isinstance(v_threshold, torch.Tensor) and v_threshold.requires_grad))):
+            return (v >= v_threshold).to(torch.result_type(v, v_threshold))
+
+        x = v - v_threshold
+        if x.dtype == torch.float16 or x.dtype == torch.bfloat16:
+            return self.forward(x.float()).to(x.dtype)
+        return self.forward(x)
+
     def cuda_codes(self, y: str, x: str, dtype: str):
         # new version
         raise NotImplementedError
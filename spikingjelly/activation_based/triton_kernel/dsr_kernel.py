@@ -0,0 +1,72 @@
+import torch
+import triton
+import triton.language as tl
+
+
+@triton.jit
+def dsrif_multistep_fwd(X_ptr, S_ptr, Vth_ptr, alpha, N, T, BLOCK: tl.constexpr):
+    # each program handles BLOCK neurons and keeps their v in registers over all T time-steps
+    pid = tl.program_id(0)
+    offs = pid * BLOCK + tl.arange(0, BLOCK)
+    mask = offs < N
+    # v_threshold is loaded from the device, rather than being copied to the host by v_threshold.item()
+    v_th = tl.load(Vth_ptr).to(tl.float32)
+    v_th_alpha = alpha * v_th
+    v = tl.zeros([BLOCK], dtype=tl.float32)
+    for t in range(T):
+        x = tl.load(X_ptr + t * N + offs, mask=mask, other=0.).to(tl.float32)
+        v = v + x
+        spike = (v >= v_th_alpha).to(tl.float32) * v_th
+        v = v - spike
+        tl.store(S_ptr + t * N + offs, spike, mask=mask)
+
+
+def dsrif_multi_step_forward(x_seq: torch.Tensor, v_threshold: torch.Tensor, alpha: float, block: int = 1024):
+    """
+    * :ref:`API in English <dsr_kernel.dsrif_multi_step_forward-en>`
+
+    .. _dsr_kernel.dsrif_multi_step_forward-cn:
+
+    :param x_seq: ``shape = [T, *]`` 的输入
+    :type x_seq: torch.Tensor
+    :param v_threshold: 神经元的阈值电压，为只有一个元素的tensor
+    :type v_threshold: torch.Tensor
+    :param alpha: 发放脉冲时使用的阈值比例，即膜电位达到 ``alpha * v_threshold`` 时发放脉冲
+    :type alpha: float
+    :param block: 每个 Triton program 处理的神经元数量
+    :type block: int
+    :return: ``shape = [T, *]`` 的输出，每个元素为 ``0`` 或 ``v_threshold``
+    :rtype: torch.Tensor
+
+    :class:`DSRIFNode <spikingjelly.activation_based.neuron.DSRIFNode>` 前向传播的Triton实现。膜电位在 ``T`` 个时间步内保存在寄存器中，
+    初始膜电位为0，且不需要写回显存。
+
+    * :ref:`中文API <dsr_kernel.dsrif_multi_step_forward-cn>`
+
+    .. _dsr_kernel.dsrif_multi_step_forward-en:
+
+    :param x_seq: the input with ``shape = [T, *]``
+    :type x_seq: torch.Tensor
+    :param v_threshold: threshold of the neuron, which is a tensor with only one element
+    :type v_threshold: torch.Tensor
+    :param alpha: the scale of the threshold for firing, i.e., the neuron fires when the membrane potential reaches
+        ``alpha * v_threshold``
+    :type alpha: float
+    :param block: the number of neurons processed by each Triton program
+    :type block: int
+    :return: the output with ``shape = [T, *]``, whose elements are ``0`` or ``v_threshold``
+    :rtype: torch.Tensor
+
+    The Triton implementation of the forward of :class:`DSRIFNode <spikingjelly.activation_based.neuron.DSRIFNode>`.
+    The membrane potential starts from 0 and is kept in registers during all ``T`` time-steps, and is never written
+    to the global memory.
+    """
+    T = x_seq.shape[0]
+    N = x_seq[0].numel()
+    x_seq = x_seq.contiguous()
+    v_threshold = v_threshold.detach().to(x_seq.device)
+    # the output is float32, which is the same as that of the torch implementation
+    spike_seq = torch.empty_like(x_seq, dtype=torch.float32)
+    grid = (triton.cdiv(N, block),)
+    dsrif_multistep_fwd[grid](x_seq, spike_seq, v_threshold, alpha, N, T, BLOCK=block)
+    return spike_seq
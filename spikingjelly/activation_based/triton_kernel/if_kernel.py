@@ -0,0 +1,237 @@
+import torch
+import triton
+import triton.language as tl
+
+
+@triton.jit
+def if_multistep_fwd(X_ptr, V_ptr, S_ptr, Vseq_ptr, v_th, v_reset, N, T,
+                     STORE_VSEQ: tl.constexpr, HARD: tl.constexpr, BLOCK: tl.constexpr):
+    # each program handles BLOCK neurons and keeps their v in registers over all T time-steps
+    pid = tl.program_id(0)
+    offs = pid * BLOCK + tl.arange(0, BLOCK)
+    mask = offs < N
+    v = tl.load(V_ptr + offs, mask=mask, other=0.).to(tl.float32)
+    for t in range(T):
+        x = tl.load(X_ptr + t * N + offs, mask=mask, other=0.).to(tl.float32)
+        v = v + x
+        mask_s = v >= v_th
+        spike = mask_s.to(tl.float32)
+        if HARD:
+            v = tl.where(mask_s, v_reset, v)
+        else:
+            v = v - spike * v_th
+        tl.store(S_ptr + t * N + offs, spike, mask=mask)
+        if STORE_VSEQ:
+            tl.store(Vseq_ptr + t * N + offs, v, mask=mask)
+    tl.store(V_ptr + offs, v, mask=mask)
+
+
+def multi_step_forward(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float, v_reset: float or None,
+                       store_v_seq: bool = False, block: int = 1024):
+    """
+    * :ref:`API in English <if_kernel.multi_step_forward-en>`
+
+    .. _if_kernel.multi_step_forward-cn:
+
+    :param x_seq: ``shape = [T, *]`` 的输入
+    :type x_seq: torch.Tensor
+    :param v: ``shape = [*]`` 的初始膜电位
+    :type v: torch.Tensor
+    :param v_threshold: 神经元的阈值电压
+    :type v_threshold: float
+    :param v_reset: 神经元的重置电压。为 ``None`` 时使用软重置
+    :type v_reset: float or None
+    :param store_v_seq: 是否返回所有时刻的膜电位
+    :type store_v_seq: bool
+    :param block: 每个 Triton program 处理的神经元数量
+    :type block: int
+    :return: ``(spike_seq, v, v_seq)``，``store_v_seq = False`` 时 ``v_seq`` 为 ``None``
+    :rtype: tuple
+
+    推理阶段IF神经元多步前向传播的Triton实现。膜电位在 ``T`` 个时间步内保存在寄存器中，只需从显存中读写一次。
+
+    * :ref:`中文API <if_kernel.multi_step_forward-cn>`
+
+    .. _if_kernel.multi_step_forward-en:
+
+    :param x_seq: the input with ``shape = [T, *]``
+    :type x_seq: torch.Tensor
+    :param v: the initial membrane potential with ``shape = [*]``
+    :type v: torch.Tensor
+    :param v_threshold: threshold of the neuron
+    :type v_threshold: float
+    :param v_reset: reset voltage of the neuron. If ``None``, soft reset is used
+    :type v_reset: float or None
+    :param store_v_seq: whether to return the membrane potential at all time-steps
+    :type store_v_seq: bool
+    :param block: the number of neurons processed by each Triton program
+    :type block: int
+    :return: ``(spike_seq, v, v_seq)``, where ``v_seq`` is ``None`` if ``store_v_seq = False``
+    :rtype: tuple
+
+    The Triton implementation of the multi-step forward of the IF neuron in inference. The membrane potential is kept
+    in registers during all ``T`` time-steps, and is read from/written to the global memory only once.
+    """
+    T = x_seq.shape[0]
+    N = x_seq[0].numel()
+    x_seq = x_seq.contiguous()
+    v = v.to(x_seq).contiguous().clone()
+    spike_seq = torch.empty_like(x_seq)
+    if store_v_seq:
+        v_seq = torch.empty_like(x_seq)
+    else:
+        v_seq = spike_seq
+    hard_reset = v_reset is not None
+    grid = (triton.cdiv(N, block),)
+    if_multistep_fwd[grid](x_seq, v, spike_seq, v_seq, v_threshold, v_reset if hard_reset else 0., N, T,
+                           STORE_VSEQ=store_v_seq, HARD=hard_reset, BLOCK=block)
+    if store_v_seq:
+        return spike_seq, v, v_seq
+    else:
+        return spike_seq, v, None
+
+
+@triton.jit
+def _surrogate_grad(x, alpha, SG: tl.constexpr):
+    # SG = 0: surrogate.Sigmoid, SG = 1: surrogate.ATan
+    if SG == 0:
+        sgax = tl.sigmoid(alpha * x)
+        return (1. - sgax) * sgax * alpha
+    else:
+        pax = 1.5707963267948966 * alpha * x
+        return alpha / 2. / (1. + pax * pax)
+
+
+@triton.jit
+def if_multistep_fptt(X_ptr, V_ptr, S_ptr, H_ptr, Vseq_ptr, v_th, v_reset, N, T,
+                      HARD: tl.constexpr, BLOCK: tl.constexpr):
+    pid = tl.program_id(0)
+    offs = pid * BLOCK + tl.arange(0, BLOCK)
+    mask = offs < N
+    v = tl.load(V_ptr + offs, mask=mask, other=0.).to(tl.float32)
+    for t in range(T):
+        x = tl.load(X_ptr + t * N + offs, mask=mask, other=0.).to(tl.float32)
+        h = v + x
+        mask_s = h >= v_th
+        spike = mask_s.to(tl.float32)
+        if HARD:
+            v = tl.where(mask_s, v_reset, h)
+        else:
+            v = h - spike * v_th
+        tl.store(H_ptr + t * N + offs, h, mask=mask)
+        tl.store(S_ptr + t * N + offs, spike, mask=mask)
+        tl.store(Vseq_ptr + t * N + offs, v, mask=mask)
+
+
+@triton.jit
+def if_multistep_bptt(GS_ptr, GV_ptr, H_ptr, GX_ptr, GVinit_ptr, v_th, v_reset, alpha, N, T,
+                      HARD: tl.constexpr, DETACH: tl.constexpr, SG: tl.constexpr, BLOCK: tl.constexpr):
+    pid = tl.program_id(0)
+    offs = pid * BLOCK + tl.arange(0, BLOCK)
+    mask = offs < N
+    grad_h_next = tl.zeros([BLOCK], dtype=tl.float32)
+    for i in range(T):
+        t = T - 1 - i
+        h = tl.load(H_ptr + t * N + offs, mask=mask, other=0.).to(tl.float32)
+        grad_s = tl.load(GS_ptr + t * N + offs, mask=mask, other=0.).to(tl.float32)
+        grad_v = tl.load(GV_ptr + t * N + offs, mask=mask, other=0.).to(tl.float32) + grad_h_next
+        over_th = h - v_th
+        spike = (over_th >= 0.).to(tl.float32)
+        sg = _surrogate_grad(over_th, alpha, SG)
+        if HARD:
+            grad_v_to_h = 1. - spike
+            if not DETACH:
+                grad_v_to_h += (v_reset - h) * sg
+        else:
+            grad_v_to_h = tl.full([BLOCK], 1., tl.float32)
+            if not DETACH:
+                grad_v_to_h -= v_th * sg
+        grad_h = grad_s * sg + grad_v * grad_v_to_h
+        tl.store(GX_ptr + t * N + offs, grad_h, mask=mask)
+        grad_h_next = grad_h
+    tl.store(GVinit_ptr + offs, grad_h_next, mask=mask)
+
+
+def surrogate_to_triton(surrogate_function):
+    from .. import surrogate
+    if not getattr(surrogate_function, 'spiking', False):
+        raise NotImplementedError(surrogate_function)
+    if type(surrogate_function) is surrogate.Sigmoid:
+        return 0, float(surrogate_function.alpha)
+    elif type(surrogate_function) is surrogate.ATan:
+        return 1, float(surrogate_function.alpha)
+    else:
+        raise NotImplementedError(surrogate_function)
+
+
+class IFNodeTritonATGF(torch.autograd.Function):
+    @staticmethod
+    def forward(ctx, x_seq: torch.Tensor, v_init: torch.Tensor, v_threshold: float, v_reset: float or None,
+                detach_reset: bool, sg_type: int, alpha: float, block: int):
+        T = x_seq.shape[0]
+        N = x_seq[0].numel()
+        x_seq = x_seq.contiguous()
+        v_init = v_init.to(x_seq).contiguous()
+        spike_seq = torch.empty_like(x_seq)
+        h_seq = torch.empty_like(x_seq)
+        v_seq = torch.empty_like(x_seq)
+        hard_reset = v_reset is not None
+        v_reset = v_reset if hard_reset else 0.
+        grid = (triton.cdiv(N, block),)
+        if_multistep_fptt[grid](x_seq, v_init, spike_seq, h_seq, v_seq, v_threshold, v_reset, N, T,
+                                HARD=hard_reset, BLOCK=block)
+        if x_seq.requires_grad or v_init.requires_grad:
+            ctx.save_for_backward(h_seq)
+            ctx.v_threshold = v_threshold
+            ctx.v_reset = v_reset
+            ctx.hard_reset = hard_reset
+            ctx.detach_reset = detach_reset
+            ctx.sg_type = sg_type
+            ctx.alpha = alpha
+            ctx.block = block
+        return spike_seq, v_seq
+
+    @staticmethod
+    def backward(ctx, grad_spike_seq: torch.Tensor, grad_v_seq: torch.Tensor):
+        h_seq = ctx.saved_tensors[0]
+        T = h_seq.shape[0]
+        N = h_seq[0].numel()
+        if grad_spike_seq is None:
+            grad_spike_seq = torch.zeros_like(h_seq)
+        if grad_v_seq is None:
+            grad_v_seq = torch.zeros_like(h_seq)
+        grad_x_seq = torch.empty_like(h_seq)
+        grad_v_init = torch.empty_like(h_seq[0])
+        grid = (triton.cdiv(N, ctx.block),)
+        if_multistep_bptt[grid](grad_spike_seq.contiguous(), grad_v_seq.contiguous(), h_seq, grad_x_seq,
+                                grad_v_init, ctx.v_threshold, ctx.v_reset, ctx.alpha, N, T,
+                                HARD=ctx.hard_reset, DETACH=ctx.detach_reset, SG=ctx.sg_type, BLOCK=ctx.block)
+        return grad_x_seq, grad_v_init, None, None, None, None, None, None
+
+
+def multi_step_forward_train(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float, v_reset: float or None,
+                             surrogate_function, detach_reset: bool, block: int = 1024):
+    """
+    * :ref:`API in English <if_kernel.multi_step_forward_train-en>`
+
+    .. _if_kernel.multi_step_forward_train-cn:
+
+    :return: ``(spike_seq, v_seq)``
+    :rtype: tuple
+
+    训练阶段IF神经元多步前向传播的Triton实现，支持反向传播。目前仅支持 ``surrogate.Sigmoid`` 和 ``surrogate.ATan``，
+    对于其他替代函数会抛出 ``NotImplementedError``，调用者应回退到逐步的实现。
+
+    * :ref:`中文API <if_kernel.multi_step_forward_train-cn>`
+
+    .. _if_kernel.multi_step_forward_train-en:
+
+    :return: ``(spike_seq, v_seq)``
+    :rtype: tuple
+
+    The Triton implementation of the multi-step forward of the IF neuron in training, with backward supported. Only
+    ``surrogate.Sigmoid`` and ``surrogate.ATan`` are supported now. ``NotImplementedError`` is raised for other surrogate
+    functions, and the caller should fall back to the step-by-step implementation.
+    """
+    sg_type, alpha = surrogate_to_triton(surrogate_function)
+    return IFNodeTritonATGF.apply(x_seq, v, v_threshold, v_reset, detach_reset, sg_type, alpha, block)
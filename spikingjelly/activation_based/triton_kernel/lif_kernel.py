@@ -0,0 +1,108 @@
+import torch
+import triton
+import triton.language as tl
+
+
+@triton.jit
+def lif_multistep_fwd(X_ptr, V_ptr, S_ptr, Vseq_ptr, v_th, v_reset, inv_tau, N, T,
+                      STORE_VSEQ: tl.constexpr, HARD: tl.constexpr, DECAY_INPUT: tl.constexpr, BLOCK: tl.constexpr):
+    # each program handles BLOCK neurons and keeps their v in registers over all T time-steps
+    pid = tl.program_id(0)
+    offs = pid * BLOCK + tl.arange(0, BLOCK)
+    mask = offs < N
+    v = tl.load(V_ptr + offs, mask=mask, other=0.).to(tl.float32)
+    for t in range(T):
+        x = tl.load(X_ptr + t * N + offs, mask=mask, other=0.).to(tl.float32)
+        if HARD:
+            if DECAY_INPUT:
+                v = v + (x - (v - v_reset)) * inv_tau
+            else:
+                v = v - (v - v_reset) * inv_tau + x
+        else:
+            if DECAY_INPUT:
+                v = v + (x - v) * inv_tau
+            else:
+                v = v * (1. - inv_tau) + x
+        mask_s = v >= v_th
+        spike = mask_s.to(tl.float32)
+        if HARD:
+            v = tl.where(mask_s, v_reset, v)
+        else:
+            v = v - spike * v_th
+        tl.store(S_ptr + t * N + offs, spike, mask=mask)
+        if STORE_VSEQ:
+            tl.store(Vseq_ptr + t * N + offs, v, mask=mask)
+    tl.store(V_ptr + offs, v, mask=mask)
+
+
+def multi_step_forward(x_seq: torch.Tensor, v: torch.Tensor, v_threshold: float, v_reset: float or None, tau: float,
+                       decay_input: bool, store_v_seq: bool = False, block: int = 1024):
+    """
+    * :ref:`API in English <lif_kernel.multi_step_forward-en>`
+
+    .. _lif_kernel.multi_step_forward-cn:
+
+    :param x_seq: ``shape = [T, *]`` 的输入
+    :type x_seq: torch.Tensor
+    :param v: ``shape = [*]`` 的初始膜电位
+    :type v: torch.Tensor
+    :param v_threshold: 神经元的阈值电压
+    :type v_threshold: float
+    :param v_reset: 神经元的重置电压。为 ``None`` 时使用软重置
+    :type v_reset: float or None
+    :param tau: 膜电位时间常数
+    :type tau: float
+    :param decay_input: 输入是否也会参与衰减
+    :type decay_input: bool
+    :param store_v_seq: 是否返回所有时刻的膜电位
+    :type store_v_seq: bool
+    :param block: 每个 Triton program 处理的神经元数量
+    :type block: int
+    :return: ``(spike_seq, v, v_seq)``，``store_v_seq = False`` 时 ``v_seq`` 为 ``None``
+    :rtype: tuple
+
+    推理阶段LIF神经元多步前向传播的Triton实现。膜电位在 ``T`` 个时间步内保存在寄存器中，只需从显存中读写一次。
+
+    * :ref:`中文API <lif_kernel.multi_step_forward-cn>`
+
+    .. _lif_kernel.multi_step_forward-en:
+
+    :param x_seq: the input with ``shape = [T, *]``
+    :type x_seq: torch.Tensor
+    :param v: the initial membrane potential with ``shape = [*]``
+    :type v: torch.Tensor
+    :param v_threshold: threshold of the neuron
+    :type v_threshold: float
+    :param v_reset: reset voltage of the neuron. If ``None``, soft reset is used
+    :type v_reset: float or None
+    :param tau: membrane time constant
+    :type tau: float
+    :param decay_input: whether the input will decay
+    :type decay_input: bool
+    :param store_v_seq: whether to return the membrane potential at all time-steps
+    :type store_v_seq: bool
+    :param block: the number of neurons processed by each Triton program
+    :type block: int
+    :return: ``(spike_seq, v, v_seq)``, where ``v_seq`` is ``None`` if ``store_v_seq = False``
+    :rtype: tuple
+
+    The Triton implementation of the multi-step forward of the LIF neuron in inference. The membrane potential is kept
+    in registers during all ``T`` time-steps, and is read from/written to the global memory only once.
+    """
+    T = x_seq.shape[0]
+    N = x_seq[0].numel()
+    x_seq = x_seq.contiguous()
+    v = v.to(x_seq).contiguous().clone()
+    spike_seq = torch.empty_like(x_seq)
+    if store_v_seq:
+        v_seq = torch.empty_like(x_seq)
+    else:
+        v_seq = spike_seq
+    hard_reset = v_reset is not None
+    grid = (triton.cdiv(N, block),)
+    lif_multistep_fwd[grid](x_seq, v, spike_seq, v_seq, v_threshold, v_reset if hard_reset else 0., 1. / tau, N, T,
+                            STORE_VSEQ=store_v_seq, HARD=hard_reset, DECAY_INPUT=decay_input, BLOCK=block)
+    if store_v_seq:
+        return spike_seq, v, v_seq
+    else:
+        return spike_seq, v, None
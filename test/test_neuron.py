@@ -0,0 +1,391 @@
+import copy
+import math
+import pickle
+import unittest
+
+import torch
+
+from spikingjelly.activation_based import base, neuron
+
+
+def lif_reference(x_seq: torch.Tensor, tau: float, decay_input: bool, v_threshold: float, v_reset):
+    # the plain out-of-place LIF dynamics, which autograd differentiates w.r.t. x_seq through v
+    v = torch.full_like(x_seq[0], 0. if v_reset is None else v_reset)
+    spike_seq = []
+    v_seq = []
+    for t in range(x_seq.shape[0]):
+        if decay_input:
+            if v_reset is None:
+                v = v + (x_seq[t] - v) / tau
+            else:
+                v = v + (x_seq[t] - (v - v_reset)) / tau
+        else:
+            if v_reset is None:
+                v = v - v / tau + x_seq[t]
+            else:
+                v = v - (v - v_reset) / tau + x_seq[t]
+        spike = (v >= v_threshold).to(x_seq)
+        if v_reset is None:
+            v = v - spike * v_threshold
+        else:
+            v = v_reset * spike + (1. - spike) * v
+        spike_seq.append(spike)
+        v_seq.append(v)
+    return torch.stack(spike_seq), v, torch.stack(v_seq)
+
+
+class TestBaseNode(unittest.TestCase):
+    def test_multi_step_forward_layout(self):
+        # the outputs are contiguous even if x_seq is not
+        for x_seq in (torch.rand([2, 4, 8]).transpose(0, 1),
+                      torch.rand([4, 3, 5, 5]).contiguous(memory_format=torch.channels_last)):
+            node = neuron.IFNode(step_mode='m', store_v_seq=True)
+            spike_seq = node(x_seq)
+            self.assertTrue(spike_seq.is_contiguous())
+            self.assertTrue(node.v_seq.is_contiguous())
+
+    def test_surrogate_hook(self):
+        # the hooks of the surrogate function are checked once per multi-step forward, and are still called
+        calls = []
+        node = neuron.IFNode(step_mode='m')
+        handle = node.surrogate_function.register_forward_hook(lambda *args: calls.append(None))
+        node(torch.rand([4, 3, 5]))
+        self.assertEqual(len(calls), 4)
+
+        handle.remove()
+        node.reset()
+        node(torch.rand([4, 3, 5]))
+        self.assertEqual(len(calls), 4)
+        self.assertIsNone(node._sg_hook_free)
+
+
+class TestLIFNodeEval(unittest.TestCase):
+    def test_multi_step_eval_with_grad(self):
+        # inference with grad mode enabled and x_seq.requires_grad = True keeps the gradients w.r.t. x_seq
+        for v_reset in (0., None, 0.3):
+            for decay_input in (True, False):
+                for store_v_seq in (False, True):
+                    with self.subTest(v_reset=v_reset, decay_input=decay_input, store_v_seq=store_v_seq):
+                        torch.manual_seed(0)
+                        x_seq = torch.rand([8, 4, 5]) * 1.5
+                        x_node = x_seq.clone().requires_grad_(True)
+                        x_ref = x_seq.clone().requires_grad_(True)
+
+                        node = neuron.LIFNode(tau=3., decay_input=decay_input, v_reset=v_reset, step_mode='m',
+                                              store_v_seq=store_v_seq)
+                        node.eval()
+                        spike_seq = node(x_node)
+                        spike_ref, v_ref, v_seq_ref = lif_reference(x_ref, 3., decay_input, 1., v_reset)
+
+                        self.assertTrue(torch.equal(spike_seq, spike_ref))
+                        torch.testing.assert_close(node.v, v_ref)
+                        if store_v_seq:
+                            torch.testing.assert_close(node.v_seq, v_seq_ref)
+                            node.v_seq.sum().backward()
+                            v_seq_ref.sum().backward()
+                        else:
+                            node.v.sum().backward()
+                            v_ref.sum().backward()
+                        torch.testing.assert_close(x_node.grad, x_ref.grad)
+
+    def test_multi_step_eval_no_grad(self):
+        for v_reset in (0., None, 0.3):
+            for decay_input in (True, False):
+                with self.subTest(v_reset=v_reset, decay_input=decay_input):
+                    torch.manual_seed(0)
+                    x_seq = torch.rand([8, 4, 5]) * 1.5
+                    node = neuron.LIFNode(tau=3., decay_input=decay_input, v_reset=v_reset, step_mode='m')
+                    node.eval()
+                    with torch.no_grad():
+                        spike_seq = node(x_seq)
+                    spike_ref, v_ref, _ = lif_reference(x_seq, 3., decay_input, 1., v_reset)
+                    self.assertTrue(torch.equal(spike_seq, spike_ref))
+                    torch.testing.assert_close(node.v, v_ref)
+
+    def test_multi_step_eval_layout(self):
+        # the spikes are contiguous even if x_seq is a transposed [T, N] tensor
+        x_seq = torch.rand([8, 4]).t()
+        for v_reset in (0., None):
+            for decay_input in (True, False):
+                with self.subTest(v_reset=v_reset, decay_input=decay_input):
+                    node = neuron.LIFNode(decay_input=decay_input, v_reset=v_reset, step_mode='m')
+                    node.eval()
+                    with torch.no_grad():
+                        self.assertTrue(node(x_seq).is_contiguous())
+                    # the step-by-step path used when autograd is required
+                    node.reset()
+                    self.assertTrue(node(x_seq.detach().requires_grad_(True)).is_contiguous())
+
+
+class TestIFNodeEval(unittest.TestCase):
+    def test_multi_step_eval_with_grad(self):
+        for v_reset in (0., None):
+            with self.subTest(v_reset=v_reset):
+                torch.manual_seed(0)
+                x_seq = torch.rand([8, 4, 5]) * 1.5
+                x_node = x_seq.clone().requires_grad_(True)
+                x_ref = x_seq.clone().requires_grad_(True)
+
+                node = neuron.IFNode(v_reset=v_reset, step_mode='m')
+                node.eval()
+                spike_seq = node(x_node)
+
+                step = neuron.if_step_soft_reset if v_reset is None else neuron.if_step_hard_reset
+                v_ref = torch.zeros_like(x_ref[0])
+                spike_ref = []
+                for t in range(x_ref.shape[0]):
+                    if v_reset is None:
+                        spike, v_ref = step(v_ref, x_ref[t], 1.)
+                    else:
+                        spike, v_ref = step(v_ref, x_ref[t], 1., v_reset)
+                    spike_ref.append(spike)
+
+                self.assertTrue(torch.equal(spike_seq, torch.stack(spike_ref)))
+                torch.testing.assert_close(node.v, v_ref)
+                node.v.sum().backward()
+                v_ref.sum().backward()
+                torch.testing.assert_close(x_node.grad, x_ref.grad)
+
+
+@unittest.skipIf(base.triton is None, 'triton is not installed')
+class TestIFNodeTritonBackend(unittest.TestCase):
+    def test_fallback(self):
+        # the Triton kernels are only used on CUDA, and the 'triton' backend falls back to the step-by-step forward of
+        # the 'torch' backend otherwise
+        for v_reset in (0., None):
+            with self.subTest(v_reset=v_reset):
+                torch.manual_seed(0)
+                x_seq = torch.rand([8, 4, 5]) * 1.5
+                grads = []
+                spike_seqs = []
+                for backend in ('torch', 'triton'):
+                    x = x_seq.clone().requires_grad_(True)
+                    node = neuron.IFNode(v_reset=v_reset, step_mode='m', backend=backend)
+                    spike_seq = node(x)
+                    spike_seq.sum().backward()
+                    spike_seqs.append(spike_seq)
+                    grads.append(x.grad)
+                self.assertTrue(torch.equal(spike_seqs[0], spike_seqs[1]))
+                torch.testing.assert_close(grads[0], grads[1])
+
+
+@unittest.skipIf(base.triton is None, 'triton is not installed')
+class TestLIFNodeTritonBackend(unittest.TestCase):
+    def test_fallback(self):
+        # the Triton kernel is only used in inference on CUDA
+        torch.manual_seed(0)
+        x_seq = torch.rand([8, 4, 5]) * 1.5
+        for training in (True, False):
+            with self.subTest(training=training):
+                node = neuron.LIFNode(tau=3., step_mode='m', backend='triton')
+                node.train(training)
+                with torch.no_grad():
+                    spike_seq = node(x_seq)
+                spike_ref, v_ref, _ = lif_reference(x_seq, 3., True, 1., 0.)
+                self.assertTrue(torch.equal(spike_seq, spike_ref))
+                torch.testing.assert_close(node.v, v_ref)
+
+    def test_multi_step_eval_layout(self):
+        # the spikes are contiguous even if x_seq is a transposed [T, N] tensor
+        x_seq = torch.rand([8, 4]).t()
+        for v_reset in (0., None):
+            with self.subTest(v_reset=v_reset):
+                node = neuron.IFNode(v_reset=v_reset, step_mode='m')
+                node.eval()
+                with torch.no_grad():
+                    self.assertTrue(node(x_seq).is_contiguous())
+
+
+class TestHardReset(unittest.TestCase):
+    def test_non_binary_surrogate(self):
+        # a callable other than SurrogateFunctionBase may output non-binary values, which must not take the binary
+        # reset path
+        torch.manual_seed(0)
+        x = torch.rand([4, 5]) * 1.5
+        node = neuron.IFNode(v_reset=0.2, surrogate_function=torch.sigmoid)
+        with torch.no_grad():
+            spike = node(x)
+        v = x + 0.2
+        torch.testing.assert_close(spike, torch.sigmoid(v - 1.))
+        torch.testing.assert_close(node.v, 0.2 * spike + (1. - spike) * v)
+
+
+class TestNoiseDtype(unittest.TestCase):
+    def test_noise_dtype(self):
+        node = neuron.NoisyCLIFNode(4)
+        node.reset_noise(2)
+        self.assertEqual(node.eps_v_seq.dtype, torch.float32)
+
+        node = neuron.NoisyCLIFNode(4, noise_dtype=torch.float16)
+        node.reset_noise(2)
+        self.assertEqual(node.eps_v_seq.dtype, torch.float16)
+        self.assertEqual(node.get_colored_noise().dtype, torch.float32)
+
+
+class TestParametricLIFNodeEval(unittest.TestCase):
+    def test_multi_step_eval(self):
+        # the scripted inference functions are compared with the torch backend used in training
+        for v_reset in (0., None, 0.3):
+            for decay_input in (True, False):
+                for store_v_seq in (False, True):
+                    with self.subTest(v_reset=v_reset, decay_input=decay_input, store_v_seq=store_v_seq):
+                        torch.manual_seed(0)
+                        x_seq = torch.rand([8, 4, 5]) * 1.5
+                        node = neuron.ParametricLIFNode(init_tau=3., decay_input=decay_input, v_reset=v_reset,
+                                                        step_mode='m', store_v_seq=store_v_seq)
+                        with torch.no_grad():
+                            spike_ref = node(x_seq)
+                            v_ref = node.v
+                            v_seq_ref = node.v_seq if store_v_seq else None
+                            node.reset()
+                            node.eval()
+                            spike_seq = node(x_seq)
+
+                        self.assertTrue(torch.equal(spike_seq, spike_ref))
+                        torch.testing.assert_close(node.v, v_ref)
+                        if store_v_seq:
+                            torch.testing.assert_close(node.v_seq, v_seq_ref)
+
+    def test_multi_step_eval_layout(self):
+        # the spikes are contiguous even if x_seq is a transposed [T, N] tensor
+        node = neuron.ParametricLIFNode(step_mode='m')
+        node.eval()
+        with torch.no_grad():
+            self.assertTrue(node(torch.rand([8, 4]).t()).is_contiguous())
+
+
+class TestDSRNode(unittest.TestCase):
+    def test_dsrif_forward(self):
+        torch.manual_seed(0)
+        x_seq = torch.rand([8, 4, 5]) * 3.
+        v_threshold = torch.tensor(2.)
+        y_seq = neuron.DSRIFNode.DSRIFFunction.jit_forward(x_seq, v_threshold, 0.5)
+
+        v = torch.zeros_like(x_seq[0])
+        y_ref = []
+        for t in range(x_seq.shape[0]):
+            v = v + x_seq[t]
+            spike = (v >= 0.5 * v_threshold).float() * v_threshold
+            v = v - spike
+            y_ref.append(spike)
+        torch.testing.assert_close(y_seq, torch.stack(y_ref))
+
+    def test_dsrlif_forward(self):
+        torch.manual_seed(0)
+        x_seq = torch.rand([8, 4, 5]) * 3.
+        v_threshold = torch.tensor(2.)
+        beta = math.exp(-0.05 / 2.)
+        y_seq = neuron.DSRLIFNode.DSRLIFFunction.jit_forward(x_seq, v_threshold, beta, 0.05, 0.3)
+
+        v = torch.zeros_like(x_seq[0])
+        y_ref = []
+        for t in range(x_seq.shape[0]):
+            v = beta * v + (1. - beta) * x_seq[t]
+            spike = (v >= 0.3 * v_threshold).float() * v_threshold
+            v = v - spike
+            y_ref.append(spike / 0.05)
+        torch.testing.assert_close(y_seq, torch.stack(y_ref))
+
+    def test_backward(self):
+        # the input gradient is a dense tensor, rather than a broadcasted view
+        for node in (neuron.DSRIFNode(T=8, v_threshold=2.), neuron.DSRLIFNode(T=8, v_threshold=2.)):
+            with self.subTest(node=node.__class__.__name__):
+                x_seq = (torch.rand([8, 4, 5]) * 3.).requires_grad_(True)
+                node(x_seq).sum().backward()
+                self.assertEqual(x_seq.grad.stride(), x_seq.stride())
+
+
+class TestNonSpikingNode(unittest.TestCase):
+    def test_multi_step_charge(self):
+        # the closed-form charge is compared with the step-by-step charge of the base class
+        torch.manual_seed(0)
+        x_seq = torch.randn([8, 4, 5])
+        for node in (neuron.NonSpikingIFNode(), neuron.NonSpikingLIFNode(tau=3.)):
+            with self.subTest(node=node.__class__.__name__):
+                v_seq = node.multi_step_charge(x_seq)
+                node.v = torch.zeros_like(x_seq[0])
+                v_seq_ref = neuron.NonSpikingBaseNode.multi_step_charge(node, x_seq)
+                torch.testing.assert_close(v_seq, v_seq_ref)
+                torch.testing.assert_close(node.v, v_seq_ref[-1])
+
+
+@unittest.skipIf(neuron.numba_lif_kernel is None, 'numba is not installed')
+class TestNumbaLIFKernel(unittest.TestCase):
+    def test_multi_step_forward(self):
+        for dtype in (torch.float32, torch.float64):
+            for v_reset in (0., None, 0.3):
+                for decay_input in (True, False):
+                    with self.subTest(dtype=dtype, v_reset=v_reset, decay_input=decay_input):
+                        torch.manual_seed(0)
+                        x_seq = torch.rand([8, 4, 5], dtype=dtype) * 1.5
+                        v = torch.full_like(x_seq[0], 0. if v_reset is None else v_reset)
+                        spike_seq, v, v_seq = neuron.numba_lif_kernel.multi_step_forward(
+                            x_seq, v, 1., v_reset, 3., decay_input, True)
+                        spike_ref, v_ref, v_seq_ref = lif_reference(x_seq, 3., decay_input, 1., v_reset)
+
+                        self.assertTrue(torch.equal(spike_seq, spike_ref))
+                        torch.testing.assert_close(v, v_ref)
+                        torch.testing.assert_close(v_seq, v_seq_ref)
+
+    def test_backend(self):
+        # the kernel is only used by the 'numba' backend in inference
+        torch.manual_seed(0)
+        x_seq = torch.rand([8, 4, 5]) * 1.5
+        node = neuron.LIFNode(tau=3., step_mode='m', backend='numba', store_v_seq=True)
+        node.eval()
+        with torch.no_grad():
+            spike_seq = node(x_seq)
+        spike_ref, v_ref, v_seq_ref = lif_reference(x_seq, 3., True, 1., 0.)
+        self.assertTrue(torch.equal(spike_seq, spike_ref))
+        torch.testing.assert_close(node.v, v_ref)
+        torch.testing.assert_close(node.v_seq, v_seq_ref)
+
+
+class TestILCNode(unittest.TestCase):
+    def test_sparse_inter_layer_connection(self):
+        # the index_add path for sparse spikes is compared with the grouped conv
+        act_dim, dec_pop_dim = 3, 4
+        for bias in (True, False):
+            with self.subTest(bias=bias):
+                torch.manual_seed(0)
+                node = neuron.ILCLIFNode(act_dim, dec_pop_dim)
+                if not bias:
+                    node.conn.bias = None
+                spike = (torch.rand([6, act_dim * dec_pop_dim]) < 0.05).float()
+                with torch.no_grad():
+                    y = node.inter_layer_connection(spike)
+                    y_ref = node.conn(spike.view(-1, act_dim, dec_pop_dim)).view(-1, act_dim * dec_pop_dim)
+                torch.testing.assert_close(y, y_ref)
+
+    def test_forward(self):
+        act_dim, dec_pop_dim = 3, 4
+        x_seq = torch.rand([5, 6, act_dim * dec_pop_dim])
+        spike_seqs = []
+        # sparse_ratio = 2 always takes the index_add path, and sparse_ratio = 0 disables it
+        for sparse_ratio in (2., 0.):
+            torch.manual_seed(0)
+            node = neuron.ILCIFNode(act_dim, dec_pop_dim, sparse_ratio=sparse_ratio)
+            with torch.no_grad():
+                spike_seqs.append(node(x_seq))
+        self.assertTrue(torch.equal(spike_seqs[0], spike_seqs[1]))
+
+
+class TestCUDAGraphState(unittest.TestCase):
+    def test_copy_does_not_clear_captured_graphs(self):
+        # the captured graphs can not be copied, but copying the module should not drop those of the original module
+        node = neuron.IFNode(step_mode='m', use_cuda_graph=True)
+        node._cuda_graphs['key'] = 'graph'
+        node_copy = copy.deepcopy(node)
+        node_loaded = pickle.loads(pickle.dumps(node))
+        self.assertEqual(node._cuda_graphs, {'key': 'graph'})
+        self.assertEqual(node_copy._cuda_graphs, {})
+        self.assertEqual(node_loaded._cuda_graphs, {})
+        self.assertTrue(node_copy.use_cuda_graph)
+
+    def test_disabled_by_default(self):
+        self.assertFalse(neuron.IFNode().use_cuda_graph)
+        self.assertFalse(neuron.LIFNode().use_cuda_graph)
+
+
+if __name__ == '__main__':
+    unittest.main()